@@ -3,8 +3,19 @@
 from math import ceil, log2
 from random import randint
 
+import cocotb
 from cocotb.runner import check_results_file, get_runner
-from cocotb.triggers import ClockCycles, FallingEdge, RisingEdge, with_timeout
+from cocotb.triggers import (
+    ClockCycles,
+    Edge,
+    FallingEdge,
+    First,
+    ReadWrite,
+    RisingEdge,
+    Timer,
+    with_timeout,
+)
+from cocotb.utils import get_sim_time
 
 
 async def toggle(clk, signal, cycles=1):
@@ -35,25 +46,131 @@ async def reset_n(clk, rst, cycles=1):
     await _reset(clk, rst, cycles, active_low=True)
 
 
+# Time of the last rising edge of the clocks passed to wait_for_change
+_rises = {}
+_rise_trackers = {}
+
+
+async def _track_rises(clk):
+    while True:
+        await RisingEdge(clk)
+        _rises[clk] = get_sim_time("step")
+
+
+def _start_rise_tracker(clk):
+    # Tasks are killed at the end of every test, so the tracker is restarted when needed
+    tracker = _rise_trackers.get(clk)
+    if tracker is None or tracker.done():
+        _rise_trackers[clk] = cocotb.start_soon(_track_rises(clk))
+
+
+async def wait_for_change(clk, *signals):
+    """
+    Wait for a change of any of `signals` and return at the rising edge of `clk` at which it
+    is sampled.
+
+    Unlike polling the signals on every clock edge, this wakes up only when they change.
+    A change in the time step of a rising edge (an output of a flop) is sampled at that edge,
+    any other one (e.g. a testbench write while `clk` is high) at the next rising edge.
+    """
+    _start_rise_tracker(clk)
+    await First(*(Edge(signal) for signal in signals))
+    if not clk.value:
+        await RisingEdge(clk)
+    elif _rises.get(clk) != get_sim_time("step"):
+        # Either a change in the high phase or the callback of this edge did not run yet
+        edge = RisingEdge(clk)
+        if await First(edge, ReadWrite()) is not edge:
+            await RisingEdge(clk)
+
+
+async def wait_for_value(signal, expected, clk):
+    """
+    Wait until `signal` equals `expected` at a rising edge of `clk`, returns at that edge
+    """
+    while signal.value != expected:
+        await wait_for_change(clk, signal)
+
+
+async def clock_period(clk, units="step"):
+    """
+    Measure the period of `clk`, returns at a rising edge
+    """
+    await RisingEdge(clk)
+    start = get_sim_time(units)
+    await RisingEdge(clk)
+    return get_sim_time(units) - start
+
+
+async def wait_cycles(clk, cycles):
+    """
+    Wait for `cycles` rising edges of `clk` like `ClockCycles`, with a single timer for the
+    bulk of the wait instead of waking up on every edge.
+
+    The period and phase of the clock are measured on the first edges. If the clock is not
+    regular, the wait falls back to counting edges. The timer expires half a period before
+    the last edge, which is then awaited and checked to arrive on time, so a clock that got
+    gated or changed its period during the wait is reported instead of miscounted.
+    """
+    if cycles < 8:
+        await ClockCycles(clk, cycles)
+        return
+
+    await RisingEdge(clk)
+    first = get_sim_time("step")
+    await RisingEdge(clk)
+    start = get_sim_time("step")
+    period = start - first
+    await RisingEdge(clk)
+    if get_sim_time("step") - start != period:
+        await ClockCycles(clk, cycles - 3)
+        return
+    start += period
+
+    remaining = cycles - 3
+    await Timer(remaining * period - period // 2, "step")
+    edge = RisingEdge(clk)
+    if await First(edge, Timer(period, "step")) is not edge:
+        raise RuntimeError(f"{clk._name} stopped or slowed down during a wait of {cycles} cycles")
+    if get_sim_time("step") != start + remaining * period:
+        raise RuntimeError(f"{clk._name} changed its period during a wait of {cycles} cycles")
+
+
 async def timeout(clk, signal, exp_val, timeout_threshold):
     """
     TODO: this function duplicates functionality of expect_with_timeout,
     but is used, so we will have to refactor tests before dropping it
     """
-    timeout = 0
-    while signal.value != exp_val:
-        timeout += 1
+    # The value is checked at `timeout_threshold` rising edges, the timeout is raised at the next
+    if signal.value == exp_val:
+        return
+    if timeout_threshold < 2:
+        for _ in range(timeout_threshold):
+            await RisingEdge(clk)
+            if signal.value == exp_val:
+                return
         await RisingEdge(clk)
-        if timeout > timeout_threshold:
-            raise TimeoutError(f"timeout {signal.name}")
+        raise TimeoutError(f"timeout {signal.name}")
+
+    wait = cocotb.start_soon(wait_for_value(signal, exp_val, clk))
+    # Two edges are checked while measuring the clock
+    measure = cocotb.start_soon(clock_period(clk))
+    await First(wait, measure)
+    if wait.done():
+        measure.kill()
+        return
+    period = measure.result()
+    # Expire between the last checked edge and the following one
+    deadline = Timer(int((timeout_threshold - 2) * period + period // 2), "step")
+    if await First(wait, deadline) is not deadline:
+        return
+    wait.kill()
+    await RisingEdge(clk)
+    raise TimeoutError(f"timeout {signal.name}")
 
 
 async def expect_with_timeout(signal, expected, clk, timeout: int = 2, units: str = "ms"):
-    async def wait_cond():
-        while signal.value != expected:
-            await RisingEdge(clk)
-
-    await with_timeout(wait_cond(), timeout, units)
+    await with_timeout(wait_for_value(signal, expected, clk), timeout, units)
 
 
 def clog2(val: int):
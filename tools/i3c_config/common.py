@@ -1,12 +1,43 @@
 # SPDX-License-Identifier: Apache-2.0
+import hashlib
+import json
+import os
 import re
 from math import log2
 
+from jsonschema.validators import validator_for
+
 
 class ConfigException(Exception):
     pass
 
 
+# Validators by the hash of their schema, checking a schema and creating its validator is
+# done once per process
+_validators = {}
+
+
+def get_validator(schema: dict):
+    digest = hashlib.sha256(json.dumps(schema, sort_keys=True).encode()).hexdigest()
+    if digest not in _validators:
+        cls = validator_for(schema)
+        cls.check_schema(schema)
+        _validators[digest] = cls(schema)
+    return _validators[digest]
+
+
+# Write generated file only if its content changed, so that an unchanged file keeps its
+# timestamp and does not trigger rebuilds of files depending on it
+def write_if_changed(path: str, content: str) -> bool:
+    if os.path.exists(path):
+        with open(path, encoding="utf-8") as f:
+            if f.read() == content:
+                return False
+    with open(path, mode="w", encoding="utf-8") as f:
+        f.write(content)
+    return True
+
+
 # General I3C configuration
 # Contains parameters defined in the YAML configuration file
 # and is utilized to separate subset of configurations for
@@ -0,0 +1,349 @@
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Smoke tests over a sample of the legal I3C core configurations
+
+The supported configurations in i3c_core_configs.yaml are only two points of the space
+allowed by i3c_core_config.schema.json. The sweep varies each parameter of the supported
+configurations over values taken from the schema (minimum, maximum, the supported value and,
+for FIFO/DAT/DCT depths, a power of two in between) and selects configurations covering all
+combinations of values of any `--strength` parameters (a covering array, 2 = pairwise).
+
+Each configuration is generated into its own copy of the repository under --work-dir, named
+after the hash of the configuration, and the chosen smoke tests run in it. The copies are
+kept, so a repeated sweep only regenerates configurations and rebuilds models affected by
+changed sources:
+
+    python config_sweep.py --strength 2 --jobs 8
+    python config_sweep.py --param FrontendBusDataWidth=32,64 --list
+"""
+
+import argparse
+import hashlib
+import itertools
+import json
+import math
+import os
+import random
+import shutil
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from xml.etree import ElementTree
+
+import yaml
+from jsonschema.exceptions import best_match
+
+from common import ConfigException, get_validator
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+SCHEMA_FILE = os.path.join(os.path.dirname(__file__), "i3c_core_config.schema.json")
+CONFIG_FILE = os.path.join(ROOT_DIR, "i3c_core_configs.yaml")
+
+# Smoke tests run for each configuration, <test group>/<test module>. {bus} is replaced by
+# the lowercase bus interface of the configuration.
+SMOKE_TESTS = [
+    "hci_queues_{bus}/test_threshold",
+    "hci_queues_{bus}/test_clear",
+    "i3c_{bus}/test_i3c_target",
+]
+
+# Encoded as 2^(N+1) in the CSRs (see `RegGenConfig`), other sizes can not be represented
+POWER_OF_TWO = ["RxFifoDepth", "TxFifoDepth"]
+
+# Written by `make config`, only copied to new configuration trees
+GENERATED = [
+    "src/i3c_defines.svh",
+    "src/csr/",
+    "src/rdl/docs/",
+    "sw/",
+    "verification/cocotb/common/reg_map.py",
+]
+# Inputs of `make config`, the configuration is generated again if any of them changed
+GENERATOR_INPUTS = ["Makefile", "src/rdl/", "tools/i3c_config/", "tools/reg_gen/"]
+
+# Configuration generated in a tree
+STAMP_FILE = ".config_sweep.json"
+
+
+def load_schema():
+    with open(SCHEMA_FILE) as f:
+        return json.load(f)
+
+
+def load_base_configs(filename=CONFIG_FILE):
+    """
+    Supported configurations, one per bus interface
+    """
+    with open(filename) as f:
+        configs = yaml.load(f, Loader=yaml.SafeLoader)
+    return {cfg["FrontendBusInterface"]: cfg for cfg in configs.values()}
+
+
+def schema_levels(name, prop, value):
+    """
+    Values of a parameter swept around `value` of a supported configuration
+    """
+    if prop["type"] == "boolean":
+        return [False, True]
+    if prop["type"] == "string":
+        return [value]
+    lo, hi = prop["minimum"], prop["maximum"]
+    levels = {lo, hi, value}
+    if name.endswith("Depth"):
+        # Typical sizes, powers of two between the bounds
+        levels.add(2 ** round((math.log2(max(lo, 1)) + math.log2(hi)) / 2))
+    if name in POWER_OF_TWO:
+        levels = {2 ** math.floor(math.log2(v)) for v in levels}
+    return sorted(levels)
+
+
+def parse_param(text):
+    """
+    Parse "<parameter>=<value>,<value>,..." with YAML typed values
+    """
+    name, sep, values = text.partition("=")
+    if not sep:
+        raise ConfigException(f"Invalid parameter values {text!r}, expected <name>=<v>,<v>,...")
+    return name, [yaml.safe_load(v) for v in values.split(",")]
+
+
+def covering_array(levels, strength=2, seed=0, candidates=20):
+    """
+    Rows (dicts) containing every combination of values of any `strength` parameters
+
+    Rows are built greedily: each candidate row starts from an uncovered combination and the
+    remaining parameters take the values covering the most uncovered combinations, the best
+    of `candidates` rows is kept. The result is deterministic for a given `seed`.
+    """
+    names = list(levels)
+    strength = min(strength, len(names))
+    if strength == len(names):
+        return [dict(zip(names, values)) for values in itertools.product(*levels.values())]
+
+    def combinations(row):
+        assigned = [name for name in names if name in row]
+        return {
+            tuple((name, row[name]) for name in combo)
+            for combo in itertools.combinations(assigned, strength)
+        }
+
+    uncovered = set()
+    for combo in itertools.combinations(names, strength):
+        for values in itertools.product(*(levels[name] for name in combo)):
+            uncovered.add(tuple(zip(combo, values)))
+
+    order = {name: i for i, name in enumerate(names)}
+
+    def gain(row, name, value):
+        """
+        Uncovered combinations completed by assigning `value` to `name`
+        """
+        row = {**row, name: value}
+        assigned = [other for other in row if other != name]
+        return sum(
+            tuple((n, row[n]) for n in sorted(combo + (name,), key=order.get)) in uncovered
+            for combo in itertools.combinations(assigned, strength - 1)
+        )
+
+    rng = random.Random(seed)
+    rows = []
+    while uncovered:
+        target = min(uncovered, key=repr)
+        best_row, best_covered = None, set()
+        for _ in range(candidates):
+            row = dict(target)
+            for name in rng.sample(names, len(names)):
+                if name in row:
+                    continue
+                row[name] = max(levels[name], key=lambda value: gain(row, name, value))
+            covered = combinations(row) & uncovered
+            if len(covered) > len(best_covered):
+                best_row, best_covered = {name: row[name] for name in names}, covered
+        rows.append(best_row)
+        uncovered -= best_covered
+    return rows
+
+
+def config_name(config):
+    digest = hashlib.sha1(json.dumps(config, sort_keys=True).encode()).hexdigest()
+    return f"{config['FrontendBusInterface'].lower()}_{digest[:8]}"
+
+
+def sweep_configs(base_configs, schema, strength=2, overrides=None, seed=0):
+    """
+    Named configurations of the sweep, validated against the schema
+    """
+    overrides = overrides or {}
+    configs = {}
+    for base in base_configs.values():
+        levels = {
+            name: overrides.get(name) or schema_levels(name, schema["properties"][name], value)
+            for name, value in base.items()
+        }
+        for config in covering_array(levels, strength, seed):
+            err = best_match(get_validator(schema).iter_errors(config))
+            if err is not None:
+                raise ConfigException(f"Invalid swept configuration {config}: {err.message}")
+            configs[config_name(config)] = config
+    return configs
+
+
+def sync_tree(tree):
+    """
+    Mirror the files tracked in the repository to `tree`, returns the updated paths
+    """
+    files = subprocess.run(
+        ["git", "-C", ROOT_DIR, "ls-files"], check=True, capture_output=True, text=True
+    ).stdout.splitlines()
+    updated = []
+    for path in files:
+        src, dst = os.path.join(ROOT_DIR, path), os.path.join(tree, path)
+        if path.startswith("third_party/") or not os.path.isfile(src):
+            continue
+        if path.startswith(tuple(GENERATED)) and os.path.exists(dst):
+            continue
+        src_stat = os.stat(src)
+        if os.path.exists(dst):
+            dst_stat = os.stat(dst)
+            if (dst_stat.st_size, dst_stat.st_mtime) == (src_stat.st_size, src_stat.st_mtime):
+                continue
+        os.makedirs(os.path.dirname(dst), exist_ok=True)
+        shutil.copy2(src, dst)
+        updated.append(path)
+    third_party = os.path.join(tree, "third_party")
+    if not os.path.lexists(third_party):
+        os.symlink(os.path.join(ROOT_DIR, "third_party"), third_party)
+    return updated
+
+
+def generate(tree, name, config, config_file, updated):
+    """
+    Generate the configuration in `tree` unless it is up to date
+    """
+    stamp = os.path.join(tree, STAMP_FILE)
+    if os.path.exists(stamp) and not any(p.startswith(tuple(GENERATOR_INPUTS)) for p in updated):
+        with open(stamp) as f:
+            if json.load(f) == config:
+                return
+    with open(os.path.join(tree, "config.log"), "w") as log:
+        subprocess.run(
+            ["make", "-C", tree, "config", f"CFG_NAME={name}", f"CFG_FILE={config_file}"],
+            check=True,
+            stdout=log,
+            stderr=subprocess.STDOUT,
+        )
+    with open(stamp, "w") as f:
+        json.dump(config, f, indent=2)
+
+
+def test_dir(tree, group):
+    for kind in ["block", "top"]:
+        path = os.path.join(tree, "verification", "cocotb", kind, group)
+        if os.path.isdir(path):
+            return path
+    raise ConfigException(f"Test group {group} not found")
+
+
+def run_test(tree, test):
+    """
+    Run a smoke test in `tree`, the models are rebuilt only if their sources changed
+    """
+    group, module = test.split("/")
+    path = test_dir(tree, group)
+    results = os.path.join(path, f"results_{module}.xml")
+    env = dict(os.environ, I3C_ROOT_DIR=tree)
+    env.setdefault("CALIPTRA_ROOT", os.path.join(tree, "third_party", "caliptra-rtl"))
+    with open(os.path.join(path, f"{module}.log"), "w") as log:
+        subprocess.run(
+            ["make", "-C", path, "all", f"MODULE={module}", f"COCOTB_RESULTS_FILE={results}"],
+            env=env,
+            stdout=log,
+            stderr=subprocess.STDOUT,
+        )
+    if not os.path.exists(results):
+        return False
+    testcases = ElementTree.parse(results).getroot().iter("testcase")
+    return all(case.find("failure") is None and case.find("error") is None for case in testcases)
+
+
+def run_config(name, config, config_file, work_dir, tests):
+    """
+    Generate a configuration in its tree and run the smoke tests, returns the results
+    """
+    tree = os.path.join(work_dir, name)
+    result = {"name": name, "config": config, "tests": {}}
+    try:
+        generate(tree, name, config, config_file, sync_tree(tree))
+    except subprocess.CalledProcessError:
+        result["status"] = "generation failed"
+        return result
+    bus = config["FrontendBusInterface"].lower()
+    for test in tests:
+        test = test.format(bus=bus)
+        result["tests"][test] = "passed" if run_test(tree, test) else "failed"
+    passed = all(status == "passed" for status in result["tests"].values())
+    result["status"] = "passed" if passed else "failed"
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "--strength",
+        type=int,
+        default=2,
+        help="Cover all value combinations of this many parameters, 2 (pairwise) by default",
+    )
+    parser.add_argument(
+        "--param",
+        action="append",
+        default=[],
+        help="Values of a parameter, <name>=<value>,<value>,... instead of the schema's",
+    )
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the covering array")
+    parser.add_argument(
+        "--test", action="append", help=f"Smoke tests, by default {' '.join(SMOKE_TESTS)}"
+    )
+    parser.add_argument("--work-dir", default="config_sweep", help="Configuration trees")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count(), help="Parallel configurations")
+    parser.add_argument("--list", action="store_true", help="Only print the configurations")
+    args = parser.parse_args()
+
+    try:
+        overrides = dict(parse_param(text) for text in args.param)
+        configs = sweep_configs(load_base_configs(), load_schema(), args.strength, overrides)
+    except ConfigException as e:
+        print(e, file=sys.stderr)
+        return 1
+
+    if args.list:
+        print(yaml.safe_dump(configs, sort_keys=False), end="")
+        return 0
+
+    work_dir = os.path.abspath(args.work_dir)
+    os.makedirs(work_dir, exist_ok=True)
+    # All configurations in one file, e.g. to reproduce a failure with `make config`
+    config_file = os.path.join(work_dir, "configs.yaml")
+    with open(config_file, "w") as f:
+        yaml.safe_dump(configs, f, sort_keys=False)
+
+    tests = args.test or SMOKE_TESTS
+    with ThreadPoolExecutor(max_workers=args.jobs) as pool:
+        results = list(
+            pool.map(lambda item: run_config(*item, config_file, work_dir, tests), configs.items())
+        )
+
+    with open(os.path.join(work_dir, "summary.json"), "w") as f:
+        json.dump(results, f, indent=2)
+    for result in results:
+        print(f"{result['name']}: {result['status']}")
+        for test, status in result["tests"].items():
+            print(f"    {test}: {status}")
+    return 0 if all(result["status"] == "passed" for result in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,23 +3,33 @@
 # https://github.com/lowRISC/ibex/blob/f8b6d468c336a0a96f6e774a70420fb370a68699/util/ibex_config.py
 
 import argparse
+import hashlib
 import json
 import os
 
 import yaml
-from jsonschema import ValidationError, validate
-from py2svh import cfg2svh
-
-from common import ConfigException, I3CCoreConfig, I3CGenericConfig, RegGenConfig
+from jsonschema.exceptions import best_match
+from py2svh import DefinesSVH, cfg2svh
+
+from common import (
+    ConfigException,
+    I3CCoreConfig,
+    I3CGenericConfig,
+    RegGenConfig,
+    get_validator,
+    write_if_changed,
+)
 
 _DEFAULT_CONFIG_FILE = "i3c_core_configs.yaml"
 _DEFAULT_OUT_DEFINES_FILE = "i3c_defines.svh"
 _DEFAULT_I3C_CONFIG_NAME = "default"
+_DEFAULT_OUT_DIR = "."
+_MANIFEST_FILE = "manifest.json"
+_SCHEMA_FILE = os.path.join(os.path.dirname(__file__), "i3c_core_config.schema.json")
 
 
 def parse_and_validate_config(name: str, filename: str) -> I3CGenericConfig:
-    schema_path = os.path.join(os.path.dirname(__file__), "i3c_core_config.schema.json")
-    with open(filename) as config_file, open(schema_path, "r") as s:
+    with open(filename) as config_file, open(_SCHEMA_FILE, "r") as s:
         try:
             yml = yaml.load(config_file, Loader=yaml.SafeLoader)
         except yaml.YAMLError as err:
@@ -30,12 +40,9 @@ def parse_and_validate_config(name: str, filename: str) -> I3CGenericConfig:
 
         schema = json.load(s)
 
-        try:
-            validate(yml[name], schema)
-        except ValidationError as err:
-            raise ConfigException(
-                f"{filename!r}: Invalid I3C core configuration: {err.message}"
-            ) from None
+        err = best_match(get_validator(schema).iter_errors(yml[name]))
+        if err is not None:
+            raise ConfigException(f"{filename!r}: Invalid I3C core configuration: {err.message}")
 
         return I3CGenericConfig(yml[name], schema["properties"])
 
@@ -168,15 +175,70 @@ class SVHFile(BaseOpts):
         return f"Successfully saved configuration to {args.output_file}."
 
 
+class BatchOutputs(BaseOpts):
+    """
+    Produces all outputs from a single validation of the configuration: the System Verilog
+    file, a file with the options of each command line target and a JSON manifest listing
+    them. Files are only rewritten when their content changes.
+    """
+
+    def __init__(self, cmdline_targets) -> None:
+        super().__init__("batch", "all outputs and their JSON manifest")
+        self.cmdline_targets = cmdline_targets
+
+    def setup_args(self, subparser: argparse._SubParsersAction):
+        super().setup_args(subparser)
+        self.argparser.add_argument(
+            "--output-dir",
+            help=("Directory of the manifest and the option files"),
+            default=_DEFAULT_OUT_DIR,
+        )
+        self.argparser.add_argument(
+            "--svh-file",
+            help=("Path to the output System Verilog file"),
+            default=_DEFAULT_OUT_DEFINES_FILE,
+        )
+        self.argparser.add_argument(
+            "--ins-hier-path",
+            help=("Hierarchical path to the instance to set " "configuration parameters on"),
+            default="",
+        )
+
+    def output(self, config: I3CGenericConfig, args):
+        os.makedirs(args.output_dir, exist_ok=True)
+        options, files = {}, {}
+        for target in self.cmdline_targets:
+            options[target.name] = target.output(config, args)
+            files[target.name] = os.path.join(args.output_dir, target.name)
+            write_if_changed(files[target.name], options[target.name] + "\n")
+
+        write_if_changed(args.svh_file, DefinesSVH(config).render())
+        files["svh_file"] = args.svh_file
+
+        with open(_SCHEMA_FILE, "rb") as s:
+            schema_hash = hashlib.sha256(s.read()).hexdigest()
+        manifest = {
+            "config_name": args.config_name,
+            "config_filename": os.path.abspath(args.config_filename),
+            "schema_sha256": schema_hash,
+            "config": dict(config.items()),
+            "options": options,
+            "files": {name: os.path.abspath(path) for name, path in files.items()},
+        }
+        manifest_path = os.path.join(args.output_dir, _MANIFEST_FILE)
+        write_if_changed(manifest_path, json.dumps(manifest, indent=2) + "\n")
+        return f"Successfully saved configuration outputs listed in {manifest_path}."
+
+
 def main():
-    supported_targets = [
-        SVHFile(),
+    cmdline_targets = [
         RegGenOpts(),
         QuestaSimOpts(),
         QuestaCompileOpts(),
         VCSOpts(),
         VerilatorSimOpts(),
     ]
+    supported_targets = [SVHFile(), *cmdline_targets, BatchOutputs(cmdline_targets)]
 
     argparser = argparse.ArgumentParser(
         description=(
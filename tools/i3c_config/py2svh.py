@@ -4,7 +4,7 @@ import os
 
 from jinja2 import Environment, FileSystemLoader
 
-from common import I3CCoreConfig, I3CGenericConfig
+from common import I3CCoreConfig, I3CGenericConfig, write_if_changed
 
 
 # Traverse I3CCoreConfig and pass it to the SVH configuration template
@@ -22,19 +22,21 @@ class DefinesSVH:
         self._defines = I3CCoreConfig(cfg)._defines
         self._just_level = max([len(n) for n in self._defines])
 
-    def save_to_file(self, file: os.path = "i3c_defines.svh"):
+    def render(self) -> str:
         template_path = os.path.join(os.path.dirname(__file__), "templates/")
         env = Environment(loader=FileSystemLoader(template_path))
         template = env.get_template("defines.txt")
 
-        file_content = template.render(
+        return template.render(
             generator_tool_name="py2svh.py",
             cfg_guard="I3C_CONFIG",
             defines=self._defines,
             just_level=self._just_level,
         )
-        with open(file, mode="w", encoding="utf-8") as out:
-            out.write(file_content)
+
+    def save_to_file(self, file: os.path = "i3c_defines.svh"):
+        # Unchanged file is not rewritten, so it does not trigger RTL rebuilds
+        write_if_changed(file, self.render())
 
 
 def cfg2svh(config: I3CGenericConfig, file: os.path = "i3c_defines.svh") -> None:
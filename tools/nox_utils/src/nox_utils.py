@@ -1,8 +1,12 @@
 # SPDX-License-Identifier: Apache-2.0
 
+import errno
 import logging
 import os
 import re
+import subprocess
+import time
+from contextlib import contextmanager
 from xml.etree import ElementTree
 
 """
@@ -133,11 +137,39 @@ class VerificationTest:
     def rename_default(self, dest: str):
         os.rename(self.paths[f"{dest}_default"], self.paths[dest])
 
-    def rename_defaults(self, coverage: str | None):
+    def rename_defaults(self, coverage: str | None, vcd: bool = True):
         if coverage:
             self.rename_default("cov")
             self.rename_default("log")
-        self.rename_default("vcd")
+        if vcd:
+            self.rename_default("vcd")
+
+
+@contextmanager
+def trace_pipe(path: str, analyzer: list[str]):
+    """
+    Replace the waveform file with a named pipe consumed by `analyzer` (command followed by
+    the pipe path) while the simulation runs, so the trace is never stored on disk
+    """
+    if os.path.lexists(path):
+        os.remove(path)
+    os.mkfifo(path)
+    proc = subprocess.Popen(analyzer + [path])
+    try:
+        yield proc
+    finally:
+        # Unblock the analyzer if the simulator exited without opening the pipe. Opening fails
+        # until the analyzer opens its end, and is harmless once the trace was written.
+        while proc.poll() is None:
+            try:
+                os.close(os.open(path, os.O_WRONLY | os.O_NONBLOCK))
+                break
+            except OSError as e:
+                if e.errno != errno.ENXIO:
+                    raise
+                time.sleep(0.1)
+        proc.wait()
+        os.remove(path)
 
 
 def create_test_id(session_name: str, args: list[str]):
@@ -0,0 +1,132 @@
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Packed observation bus of a test wrapper
+
+Checkers which sample many status signals on every cycle pay for a separate GPI read of each
+of them. The test wrappers concatenate such signals into a single output port instead, which
+is read once per cycle and decoded in Python. Both sides are generated from a YAML
+description listing the fields, the first one at bit 0:
+
+    name: hci_queues_obs
+    fields:
+      - name: hci_rx_queue_empty
+        signal: hci_rx_queue_empty_o
+      - name: target_fsm_state
+        signal: xcore.xtarget_fsm.state_d
+        width: 7
+
+The SystemVerilog include defines `<NAME>_WIDTH` and `<NAME>_ASSIGN(port)`, the Python module
+defines `WIDTH` and `FIELDS` (name -> (offset, width)) for `common/observation.py`.
+"""
+
+import argparse
+import os
+import re
+import sys
+
+import yaml
+
+IDENTIFIER = re.compile(r"^[A-Za-z_]\w*$")
+# Hierarchical reference of a signal, optionally with a bit select
+SIGNAL = re.compile(r"^[A-Za-z_][\w.]*(\[\d+(:\d+)?\])?$")
+
+
+class DescriptionError(Exception):
+    pass
+
+
+def load_fields(description):
+    """
+    Validate the description, returns a list of (name, signal, offset, width)
+    """
+    name = description.get("name")
+    if not isinstance(name, str) or not IDENTIFIER.match(name):
+        raise DescriptionError(f"Invalid observation bus name: {name!r}")
+    entries = description.get("fields")
+    if not entries:
+        raise DescriptionError(f"{name}: no fields")
+
+    fields, offset = [], 0
+    for entry in entries:
+        field_name = entry.get("name")
+        if not isinstance(field_name, str) or not IDENTIFIER.match(field_name):
+            raise DescriptionError(f"{name}: invalid field name {field_name!r}")
+        if any(field_name == f[0] for f in fields):
+            raise DescriptionError(f"{name}: duplicated field {field_name}")
+        signal = entry.get("signal", field_name)
+        if not isinstance(signal, str) or not SIGNAL.match(signal):
+            raise DescriptionError(f"{name}: invalid signal {signal!r} of {field_name}")
+        width = entry.get("width", 1)
+        if not isinstance(width, int) or width < 1:
+            raise DescriptionError(f"{name}: invalid width {width!r} of {field_name}")
+        fields.append((field_name, signal, offset, width))
+        offset += width
+    return fields
+
+
+def format_sv(name, fields, source):
+    macro = name.upper()
+    width = sum(f[3] for f in fields)
+    lines = [
+        "// SPDX-License-Identifier: Apache-2.0",
+        f"// Generated by tools/observation/obs_gen.py from {source}, do not edit",
+        "",
+        f"`ifndef {macro}_SVH",
+        f"`define {macro}_SVH",
+        "",
+        f"`define {macro}_WIDTH {width}",
+        "",
+        f"`define {macro}_ASSIGN(port) \\",
+    ]
+    for field_name, signal, offset, field_width in fields:
+        lines.append(f"  assign port[{offset} +: {field_width}] = {signal};  /* {field_name} */ \\")
+    lines[-1] = lines[-1].removesuffix(" \\")
+    lines += ["", "`endif", ""]
+    return "\n".join(lines)
+
+
+def format_py(name, fields, source):
+    width = sum(f[3] for f in fields)
+    lines = [
+        "# SPDX-License-Identifier: Apache-2.0",
+        f"# Generated by tools/observation/obs_gen.py from {source}, do not edit",
+        "",
+        f"WIDTH = {width}",
+        "",
+        "# Field name -> (offset, width)",
+        "FIELDS = {",
+    ]
+    for field_name, _, offset, field_width in fields:
+        lines.append(f'    "{field_name}": ({offset}, {field_width}),')
+    lines += ["}", ""]
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("description", help="YAML description of the observation bus")
+    parser.add_argument(
+        "--output-dir", help="Directory of the generated files, defaults to the description's"
+    )
+    args = parser.parse_args()
+
+    with open(args.description) as f:
+        description = yaml.safe_load(f)
+    try:
+        fields = load_fields(description)
+    except DescriptionError as e:
+        print(f"{args.description}: {e}", file=sys.stderr)
+        return 1
+
+    name = description["name"]
+    source = os.path.basename(args.description)
+    output_dir = args.output_dir or os.path.dirname(os.path.abspath(args.description))
+    for ext, fmt in ((".svh", format_sv), (".py", format_py)):
+        with open(os.path.join(output_dir, name + ext), "w") as f:
+            f.write(fmt(name, fields, source))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,294 @@
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Calibration of the timing registers against simulation
+
+Programs the timing registers of SOCMGMTIF with each point of a sweep, runs a short private
+write and an IBI on the top-level model, measures how long the target takes to react to
+bus events and compares it with the values the timing tools assume:
+
+    python calibration.py --sweep T_HD_DAT_REG=1:8 --sweep T_FREE_REG=20,40 --jobs 8
+
+Registers which are not swept keep the values of `timing_settings.settings_for` and of
+the bus condition timing of a pure bus at the system clock of the model, which is taken
+from the simulation. The model is built once (Verilator) and the points run as parallel
+simulations of it, each in its own directory under --work-dir. The simulation side is
+verification/cocotb/top/lib_i3c_top/timing_calibration.py.
+"""
+
+import argparse
+import itertools
+import json
+import os
+import shutil
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from checker import edges, last_before, level_at
+from solver import write_table
+from specification import IXCModes
+from timing_settings import settings_for
+from timing_utils import f2T, norm_ceil
+
+# Swept values of the point are passed to the simulation in this environment variable (JSON)
+POINT_ENV = "TIMING_CALIBRATION_POINT"
+# System clock, register values and measurements written by the simulation to its working
+# directory
+CALIBRATION_FILE = "calibration.json"
+
+REGISTERS = [
+    "T_R_REG",
+    "T_F_REG",
+    "T_SU_DAT_REG",
+    "T_HD_DAT_REG",
+    "T_FREE_REG",
+    "T_AVAL_REG",
+    "T_IDLE_REG",
+]
+
+# Bus condition timing of a pure bus (t_CAS, t_AVAL, t_IDLE)
+T_FREE = 38.4e-9
+T_AVAL = 1e-6
+T_IDLE = 200e-6
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+TEST_DIR = os.path.join(ROOT_DIR, "verification", "cocotb", "top", "i3c_axi")
+
+
+def base_point(sys_clk):
+    """
+    Register values used for registers which are not swept
+    """
+    timings = settings_for(IXCModes.I3C_SDR_12M5_PP, sys_clk)
+    sys_period = f2T(sys_clk)
+    return {
+        "T_R_REG": timings.t_r,
+        "T_F_REG": timings.t_f,
+        "T_SU_DAT_REG": timings.t_su_dat,
+        "T_HD_DAT_REG": timings.t_hd_dat,
+        "T_FREE_REG": norm_ceil(T_FREE, sys_period),
+        "T_AVAL_REG": norm_ceil(T_AVAL, sys_period),
+        "T_IDLE_REG": norm_ceil(T_IDLE, sys_period),
+    }
+
+
+def parse_sweep(text):
+    """
+    Parse "<register>=<start>:<stop>[:<step>]" (including stop) or "<register>=<v>,<v>,..."
+    """
+    name, sep, values = text.partition("=")
+    if not sep or name not in REGISTERS:
+        raise ValueError(f"Invalid sweep {text!r}, expected <register>=<values> of {REGISTERS}")
+    if ":" in values:
+        start, stop, *step = (int(v, 0) for v in values.split(":"))
+        return name, list(range(start, stop + 1, step[0] if step else 1))
+    return name, [int(v, 0) for v in values.split(",")]
+
+
+def sweep_points(sweeps):
+    """
+    All combinations of the swept values, the simulation takes the other registers from
+    `base_point`
+    """
+    names = [name for name, _ in sweeps]
+    return [
+        dict(zip(names, values)) for values in itertools.product(*(values for _, values in sweeps))
+    ]
+
+
+def predict(point):
+    """
+    Delays (cycles) the timing tools assume for the register values of `point`
+    """
+    return {
+        # Edges on the bus are detected after the rise/fall time
+        "start_detect": point["T_F_REG"],
+        "stop_detect": point["T_R_REG"],
+        # Data is held for t_f + thd_dat after SCL falls, see timing.firmware_to_timings
+        "target_hold": point["T_F_REG"] + point["T_HD_DAT_REG"],
+        # The target drives IBI data T_R + T_SU_DAT after SCL falls
+        "target_setup": point["T_R_REG"] + point["T_SU_DAT_REG"],
+        # Bus conditions are timed from the STOP
+        "bus_free": point["T_FREE_REG"],
+        "bus_available": point["T_AVAL_REG"],
+        "bus_idle": point["T_IDLE_REG"],
+    }
+
+
+def _following(events, reactions):
+    """
+    Delay from each of `events` to the first of `reactions` at or after it, events without
+    a reaction before the next event are skipped
+    """
+    if not len(reactions):
+        return np.zeros(0)
+    idx = np.searchsorted(reactions, events, side="left")
+    valid = idx < len(reactions)
+    delays = reactions[np.minimum(idx, len(reactions) - 1)] - events
+    valid[:-1] &= delays[:-1] < np.diff(events)
+    return delays[valid]
+
+
+def measure(traces, ibi_start, sys_period):
+    """
+    Delays (cycles) of the reactions of the target to bus events
+
+    `traces` maps signal names to (times, values) arrays of their changes: "scl" and "sda"
+    of the bus, "sda_o" driven by the target, and the "start_detect", "stop_detect",
+    "bus_free", "bus_available" and "bus_idle" flags of the core. Changes of "sda_o" before
+    `ibi_start` belong to the private write, later ones to the IBI.
+    """
+    scl_t, scl_v = traces["scl"]
+    _, scl_fall = edges(*traces["scl"])
+    sda_rise, sda_fall = edges(*traces["sda"])
+    start = sda_fall[level_at(scl_t, scl_v, sda_fall) == 1]
+    stop = sda_rise[level_at(scl_t, scl_v, sda_rise) == 1]
+    start_det, _ = edges(*traces["start_detect"])
+    stop_det, _ = edges(*traces["stop_detect"])
+
+    delays = {
+        "start_detect": _following(start, start_det),
+        "stop_detect": _following(stop, stop_det),
+    }
+
+    # Target drives SDA while SCL is low, timed from the SCL falling edge
+    out_rise, out_fall = edges(*traces["sda_o"])
+    changes = np.sort(np.concatenate([out_rise, out_fall]))
+    changes = changes[level_at(scl_t, scl_v, changes) == 0]
+    idx = last_before(scl_fall, changes)
+    changes, held = changes[idx >= 0], changes[idx >= 0] - scl_fall[idx[idx >= 0]]
+    delays["target_hold"] = held[changes < ibi_start]
+    delays["target_setup"] = held[changes >= ibi_start]
+
+    # Counters of the bus conditions restart on a detected STOP
+    for name in ["bus_free", "bus_available", "bus_idle"]:
+        rise, _ = edges(*traces[name])
+        delays[name] = _following(stop_det, rise)
+
+    result = {}
+    for name, values in delays.items():
+        # Edges are aligned to the clock, rounding only removes float errors
+        cycles = np.round(values / sys_period, 3)
+        result[name] = (
+            {
+                "median": float(np.median(cycles)),
+                "min": float(cycles.min()),
+                "max": float(cycles.max()),
+                "count": len(cycles),
+            }
+            if len(cycles)
+            else None
+        )
+    return result
+
+
+def calibration_row(index, swept, result):
+    """
+    Row of the calibration table from the `result` of the simulation of the `swept` values
+    (None if it failed), offsets are measured medians minus predictions (cycles)
+    """
+    if result is None:
+        return {"point": index, "sys_clk": None, **swept, "status": "failed"}
+    point, measured = result["point"], result["measured"]
+    row = {"point": index, "sys_clk": result["sys_clk"], **point, "status": "ok"}
+    for name, predicted in predict(point).items():
+        summary = measured.get(name)
+        row[f"{name}_predicted"] = predicted
+        if summary:
+            row[f"{name}_measured"] = round(summary["median"], 2)
+            row[f"{name}_min"] = round(summary["min"], 2)
+            row[f"{name}_max"] = round(summary["max"], 2)
+            row[f"{name}_offset"] = round(summary["median"] - predicted, 2)
+    return row
+
+
+def build(test_dir, sim_build):
+    """
+    Build the model once, the points only run it
+    """
+    subprocess.run(
+        ["make", "-C", test_dir, f"SIM_BUILD={sim_build}", os.path.join(sim_build, "Vtop")],
+        check=True,
+    )
+
+
+def run_point(index, swept, test_dir, sim_build, work_dir):
+    """
+    Simulate one point in its own directory, returns the contents of CALIBRATION_FILE or
+    None on failure
+    """
+    point_dir = os.path.join(work_dir, f"point_{index:04d}")
+    shutil.rmtree(point_dir, ignore_errors=True)
+    os.makedirs(point_dir)
+    env = dict(os.environ, **{POINT_ENV: json.dumps(swept)})
+    args = [
+        "make",
+        "-C",
+        test_dir,
+        "all",
+        "MODULE=timing_calibration",
+        f"SIM_BUILD={sim_build}",
+        f"COCOTB_RESULTS_FILE={os.path.join(point_dir, 'results.xml')}",
+        # The model writes its waveform and logs to the working directory
+        f"SIM_CMD_PREFIX=env -C {point_dir}",
+    ]
+    with open(os.path.join(point_dir, "sim.log"), "w") as log:
+        proc = subprocess.run(args, env=env, stdout=log, stderr=subprocess.STDOUT)
+    result_file = os.path.join(point_dir, CALIBRATION_FILE)
+    if proc.returncode or not os.path.exists(result_file):
+        return None
+    with open(result_file) as f:
+        return json.load(f)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "--sweep",
+        action="append",
+        default=[],
+        help="Swept register, <register>=<start>:<stop>[:<step>] or <register>=<v>,<v>,...",
+    )
+    parser.add_argument("--test-dir", default=TEST_DIR, help="Directory of the top-level tests")
+    parser.add_argument("--work-dir", default="timing_calibration", help="Simulation directories")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count(), help="Parallel simulations")
+    parser.add_argument("--format", choices=["csv", "json"], default="csv")
+    parser.add_argument("--out", default="timing_calibration.csv", help="Calibration table")
+    args = parser.parse_args()
+
+    try:
+        sweeps = [parse_sweep(text) for text in args.sweep]
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        return 1
+    points = sweep_points(sweeps)
+
+    work_dir = os.path.abspath(args.work_dir)
+    sim_build = os.path.join(work_dir, "sim_build")
+    os.makedirs(work_dir, exist_ok=True)
+    build(os.path.abspath(args.test_dir), sim_build)
+
+    with ThreadPoolExecutor(max_workers=args.jobs) as pool:
+        results = pool.map(
+            lambda item: run_point(*item, os.path.abspath(args.test_dir), sim_build, work_dir),
+            enumerate(points),
+        )
+        rows = [
+            calibration_row(index, swept, result)
+            for (index, swept), result in zip(enumerate(points), results)
+        ]
+
+    with open(args.out, "w", newline="") as f:
+        write_table(rows, f, args.format)
+    failed = [row["point"] for row in rows if row["status"] != "ok"]
+    if failed:
+        print(f"Simulation of points {failed} failed, see {work_dir}", file=sys.stderr)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,257 @@
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Offline bus timing compliance checker
+
+Measures I2C/I3C bus timings on SCL/SDA traces dumped by the simulator and compares
+them against the limits from IXCSpecification.
+"""
+
+import argparse
+import logging
+import sys
+from dataclasses import dataclass
+
+import numpy as np
+from engineering_notation import EngNumber as EN
+from specification import IXCModes, IXCSpecification
+from timing_utils import f2T, setup_logger
+from waveform import UNKNOWN, load_signals
+
+# Parameters measured on the bus, each is checked against "<name>_min"/"<name>_max" entries
+# of the specification, if they are numeric
+MEASURED_PARAMETERS = [
+    "t_high",
+    "t_low",
+    "t_su_sta",
+    "t_hd_sta",
+    "t_su_dat",
+    "t_hd_dat",
+    "t_su_sto",
+    "t_buf",
+    "t_scl",
+]
+
+# Absolute tolerance of comparisons, absorbs rounding of timestamps converted to seconds
+TOLERANCE = 1e-15
+
+
+@dataclass
+class Violation:
+    parameter: str
+    time: float
+    measured: float
+    limit: float
+    kind: str
+
+    def __str__(self):
+        relation = "<" if self.kind == "min" else ">"
+        return (
+            f"{self.parameter} violation at {EN(self.time)}s: "
+            f"measured {EN(self.measured)}s {relation} {self.kind} {EN(self.limit)}s"
+        )
+
+
+def edges(times, values):
+    """
+    Return (rising, falling) edge timestamps of a 1-bit signal, transitions to and from
+    unknown values are ignored
+    """
+    known = values != UNKNOWN
+    times, values = times[known], values[known].astype(np.int8)
+    change = np.flatnonzero(np.diff(values)) + 1
+    rising = change[values[change] == 1]
+    falling = change[values[change] == 0]
+    return times[rising], times[falling]
+
+
+def level_at(times, values, at):
+    """
+    Sample signal level just before each of timestamps in `at`
+    """
+    idx = np.searchsorted(times, at, side="left") - 1
+    return np.where(idx >= 0, values[np.maximum(idx, 0)], UNKNOWN)
+
+
+def next_after(events, at):
+    """
+    For each timestamp in `at` return index of the first event strictly later, len(events)
+    if there is none
+    """
+    return np.searchsorted(events, at, side="right")
+
+
+def last_before(events, at):
+    """
+    For each timestamp in `at` return index of the last event strictly earlier, -1 if there
+    is none
+    """
+    return np.searchsorted(events, at, side="left") - 1
+
+
+def measure(scl, sda, t_r=0.0, t_f=0.0):
+    """
+    Measure bus timings
+
+    `scl` and `sda` are (times, values) tuples. Returns dict mapping each parameter to
+    (timestamps, durations) arrays, where timestamp marks the end of the measured interval.
+
+    The simulated bus has ideal edges. If nonzero `t_r` and `t_f` are given, each interval
+    is adjusted as if the edges it starts and ends with took that long.
+    """
+    scl_rise, scl_fall = edges(*scl)
+    sda_rise, sda_fall = edges(*sda)
+    scl_t, scl_v = scl
+
+    # START / STOP: SDA changes while SCL is high
+    start = sda_fall[level_at(scl_t, scl_v, sda_fall) == 1]
+    stop = sda_rise[level_at(scl_t, scl_v, sda_rise) == 1]
+    # Data changes: SDA changes while SCL is low
+    sda_edges = np.sort(np.concatenate([sda_rise, sda_fall]))
+    data = sda_edges[level_at(scl_t, scl_v, sda_edges) == 0]
+
+    def interval(begin, end, adjust):
+        # Negative timestamps mark intervals which could not be measured
+        ok = (begin >= 0) & (end >= 0)
+        return end[ok], end[ok] - begin[ok] - adjust
+
+    def pick(events, idx):
+        valid = (idx >= 0) & (idx < len(events))
+        out = np.full(len(idx), -1.0)
+        out[valid] = events[idx[valid]]
+        return out
+
+    result = {}
+
+    # t_high: SCL rising -> next SCL falling
+    fall = pick(scl_fall, next_after(scl_fall, scl_rise))
+    result["t_high"] = interval(np.where(fall >= 0, scl_rise, -1.0), fall, t_r)
+
+    # t_low: SCL falling -> next SCL rising
+    rise = pick(scl_rise, next_after(scl_rise, scl_fall))
+    result["t_low"] = interval(np.where(rise >= 0, scl_fall, -1.0), rise, t_f)
+
+    # t_hd_sta: START -> next SCL falling
+    fall = pick(scl_fall, next_after(scl_fall, start))
+    result["t_hd_sta"] = interval(np.where(fall >= 0, start, -1.0), fall, t_f)
+
+    # t_su_sta: SCL rising -> repeated START, i.e. there was no STOP since SCL rose
+    prev_rise = pick(scl_rise, last_before(scl_rise, start))
+    prev_stop = pick(stop, last_before(stop, start))
+    repeated = prev_rise > prev_stop
+    result["t_su_sta"] = interval(
+        np.where(repeated, prev_rise, -1.0), np.where(repeated, start, -1.0), t_r
+    )
+
+    # t_su_sto: SCL rising -> STOP
+    prev_rise = pick(scl_rise, last_before(scl_rise, stop))
+    result["t_su_sto"] = interval(prev_rise, np.where(prev_rise >= 0, stop, -1.0), t_r)
+
+    # t_buf: STOP -> next START
+    next_start = pick(start, next_after(start, stop))
+    result["t_buf"] = interval(np.where(next_start >= 0, stop, -1.0), next_start, 0.0)
+
+    # t_su_dat: last data change while SCL was low -> SCL rising
+    prev_data = pick(data, last_before(data, scl_rise))
+    prev_fall = pick(scl_fall, last_before(scl_fall, scl_rise))
+    setup = prev_data > prev_fall
+    result["t_su_dat"] = interval(
+        np.where(setup, prev_data, -1.0), np.where(setup, scl_rise, -1.0), t_r
+    )
+
+    # t_hd_dat: SCL falling -> first data change before SCL rises again
+    next_data = pick(data, next_after(data, scl_fall))
+    next_rise = pick(scl_rise, next_after(scl_rise, scl_fall))
+    hold = (next_data >= 0) & ((next_data < next_rise) | (next_rise < 0))
+    result["t_hd_dat"] = interval(
+        np.where(hold, scl_fall, -1.0), np.where(hold, next_data, -1.0), t_f
+    )
+
+    # t_scl: SCL period within a transfer, i.e. no STOP between consecutive rising edges
+    if len(scl_rise) > 1:
+        begin, end = scl_rise[:-1], scl_rise[1:]
+        stop_between = next_after(stop, begin) != next_after(stop, end)
+        result["t_scl"] = interval(np.where(stop_between, -1.0, begin), end, 0.0)
+    else:
+        result["t_scl"] = (np.empty(0), np.empty(0))
+
+    return result
+
+
+def spec_limits(spec):
+    """
+    Collect numeric limits of measured parameters from the specification
+    """
+    limits = {}
+    for param in MEASURED_PARAMETERS:
+        for kind in ["min", "max"]:
+            value = spec.spec.get(f"{param}_{kind}")
+            if isinstance(value, (int, float)) and value > 0:
+                limits[(param, kind)] = value
+    f_scl_max = spec.spec.get("f_scl_max")
+    if isinstance(f_scl_max, (int, float)):
+        limits[("t_scl", "min")] = f2T(f_scl_max)
+    return limits
+
+
+def check(measurements, spec):
+    """
+    Compare measurements against the specification, return list of violations sorted by time
+    """
+    violations = []
+    for (param, kind), limit in spec_limits(spec).items():
+        times, durations = measurements.get(param, ([], []))
+        if kind == "min":
+            bad = np.flatnonzero(durations < limit - TOLERANCE)
+        else:
+            bad = np.flatnonzero(durations > limit + TOLERANCE)
+        violations.extend(
+            Violation(param, float(times[i]), float(durations[i]), limit, kind) for i in bad
+        )
+    return sorted(violations, key=lambda v: v.time)
+
+
+def check_waveform(filename, mode, scl="bus_scl", sda="bus_sda", t_r=0.0, t_f=0.0):
+    signals = load_signals(filename, [scl, sda])
+    measurements = measure(signals[scl], signals[sda], t_r, t_f)
+    return check(measurements, IXCSpecification(mode))
+
+
+def summarize(measurements):
+    for param in MEASURED_PARAMETERS:
+        _, durations = measurements[param]
+        if len(durations):
+            logging.info(
+                f"{param:<10} count={len(durations):<6} "
+                f"min={EN(durations.min())}s max={EN(durations.max())}s"
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("waveform", help="VCD file")
+    parser.add_argument(
+        "--mode", required=True, choices=[m.name for m in IXCModes], help="Bus mode"
+    )
+    parser.add_argument("--scl", default="bus_scl", help="SCL signal name or path")
+    parser.add_argument("--sda", default="bus_sda", help="SDA signal name or path")
+    parser.add_argument("--t-r", type=float, default=0.0, help="Rise time to model [s]")
+    parser.add_argument("--t-f", type=float, default=0.0, help="Fall time to model [s]")
+    parser.add_argument("--log", default="timing_check.log", help="Log file")
+    args = parser.parse_args()
+
+    setup_logger(filename=args.log)
+    mode = IXCModes[args.mode]
+    signals = load_signals(args.waveform, [args.scl, args.sda])
+    measurements = measure(signals[args.scl], signals[args.sda], args.t_r, args.t_f)
+    summarize(measurements)
+
+    violations = check(measurements, IXCSpecification(mode))
+    for violation in violations:
+        logging.error(violation)
+    logging.info(f"{args.waveform}: {len(violations)} timing violation(s) in {mode.name} mode")
+    return 1 if violations else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,234 @@
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Live bus timing monitor
+
+Consumes a VCD stream (typically a named pipe the simulator writes its trace into) while the
+simulation runs, checks bus timings on the fly and keeps only short windows of the trace
+around each violation. Memory and disk usage do not grow with the length of the simulation.
+"""
+
+import argparse
+import logging
+import os
+import sys
+from collections import deque
+
+import numpy as np
+from checker import check, measure
+from specification import IXCModes, IXCSpecification
+from timing_utils import setup_logger
+from waveform import VcdReader, decode_value
+
+# Number of most recent SCL/SDA changes kept from the previous check, measurements need
+# a few preceding edges (e.g. last STOP before START)
+OVERLAP = 64
+
+
+def apply_change(state, line):
+    """
+    Update mapping of identifiers to values with a VCD value change line
+    """
+    head = line[0]
+    if head in "bBrR":
+        value, ident = line.split()
+        state[ident] = value + " "
+    elif head in "01xXzZ":
+        state[line[1:].strip()] = head
+
+
+def tap(stream, lines):
+    """
+    Pass lines through, keeping a copy
+    """
+    for line in stream:
+        lines.append(line)
+        yield line
+
+
+class TraceWindow:
+    """
+    Ring buffer of raw VCD body lines covering the last `retention` seconds.
+    Values of all signals at the start of the buffer are tracked, so that any part of the
+    buffer can be written out as a standalone VCD file.
+    """
+
+    def __init__(self, header, timescale, retention):
+        self.header = header
+        self.retention = round(retention / timescale)
+        self.timescale = timescale
+        self.steps = deque()
+        self.base = {}
+
+    def append(self, time, lines):
+        self.steps.append((time, lines))
+        while self.steps and self.steps[0][0] < time - self.retention:
+            _, old = self.steps.popleft()
+            for line in old:
+                apply_change(self.base, line)
+
+    def write(self, filename, begin, end):
+        """
+        Write time steps from [begin, end] seconds as a VCD file
+        """
+        begin, end = round(begin / self.timescale), round(end / self.timescale)
+        state = dict(self.base)
+        body = []
+        for time, lines in self.steps:
+            if time < begin:
+                for line in lines:
+                    apply_change(state, line)
+            elif time <= end:
+                body.append(f"#{time}\n")
+                body.extend(lines)
+        with open(filename, "w") as f:
+            f.writelines(self.header)
+            f.write("$dumpvars\n")
+            f.writelines(f"{value}{ident}\n" for ident, value in state.items())
+            f.write("$end\n")
+            f.writelines(body)
+
+
+class TimingMonitor:
+    """
+    Incremental wrapper of checker.py, bus changes are checked in batches
+    """
+
+    def __init__(self, spec, t_r=0.0, t_f=0.0, batch=256):
+        self.spec = spec
+        self.t_r = t_r
+        self.t_f = t_f
+        self.batch = batch
+        self.scl = ([], [])
+        self.sda = ([], [])
+        self.pending = 0
+        self.checked_until = -1.0
+
+    def add(self, signal, time, value):
+        times, values = signal
+        times.append(time)
+        values.append(value)
+        self.pending += 1
+
+    def check(self):
+        """
+        Check changes collected since the last call, return new violations
+        """
+        if not self.pending:
+            return []
+        scl = tuple(np.asarray(x) for x in self.scl)
+        sda = tuple(np.asarray(x) for x in self.sda)
+        violations = [
+            v
+            for v in check(measure(scl, sda, self.t_r, self.t_f), self.spec)
+            if v.time > self.checked_until
+        ]
+        self.checked_until = max([self.checked_until] + self.scl[0][-1:] + self.sda[0][-1:])
+        for times, values in [self.scl, self.sda]:
+            del times[:-OVERLAP]
+            del values[:-OVERLAP]
+        self.pending = 0
+        return violations
+
+
+def monitor(stream, mode, scl, sda, out_dir, before, after, t_r=0.0, t_f=0.0):
+    """
+    Process VCD stream, returns number of violations found
+    """
+    header = []
+    reader = VcdReader(tap(stream, header))
+    scl_id, sda_id = reader.find(scl).ident, reader.find(sda).ident
+    timescale = reader.timescale
+
+    window = TraceWindow(header, timescale, before + 2 * after)
+    timing = TimingMonitor(IXCSpecification(mode), t_r, t_f)
+    flagged = []
+    violations = 0
+    time, lines = 0, []
+    last_check = 0.0
+
+    def collect(found):
+        nonlocal violations
+        for v in found:
+            logging.error(v)
+            violations += 1
+            # Violations close to each other share a window
+            if not flagged or v.time - flagged[-1].time > after:
+                flagged.append(v)
+
+    def save(v):
+        filename = os.path.join(out_dir, f"violation_{round(v.time * 1e9)}ns_{v.parameter}.vcd")
+        window.write(filename, v.time - before, v.time + after)
+        logging.info(f"Saved trace window {filename}")
+
+    def end_of_step():
+        nonlocal last_check
+        window.append(time, lines)
+        now = time * timescale
+        if timing.pending >= timing.batch or (timing.pending and now - last_check >= after):
+            last_check = now
+            collect(timing.check())
+        while flagged and now >= flagged[0].time + after:
+            save(flagged.pop(0))
+
+    for line in stream:
+        head = line[:1]
+        if head == "#":
+            end_of_step()
+            time, lines = int(line[1:]), []
+        elif head in ["", "$", "\n"]:
+            continue
+        else:
+            lines.append(line)
+            if head in "01xXzZ":
+                ident = line[1:].strip()
+                if ident == scl_id:
+                    timing.add(timing.scl, time * timescale, decode_value(head.lower()))
+                elif ident == sda_id:
+                    timing.add(timing.sda, time * timescale, decode_value(head.lower()))
+
+    end_of_step()
+    collect(timing.check())
+    for v in flagged:
+        save(v)
+
+    return violations
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("trace", help="VCD file or named pipe")
+    parser.add_argument(
+        "--mode", required=True, choices=[m.name for m in IXCModes], help="Bus mode"
+    )
+    parser.add_argument("--scl", default="bus_scl", help="SCL signal name or path")
+    parser.add_argument("--sda", default="bus_sda", help="SDA signal name or path")
+    parser.add_argument("--t-r", type=float, default=0.0, help="Rise time to model [s]")
+    parser.add_argument("--t-f", type=float, default=0.0, help="Fall time to model [s]")
+    parser.add_argument("--before", type=float, default=20e-6, help="Context before violation")
+    parser.add_argument("--after", type=float, default=20e-6, help="Context after violation")
+    parser.add_argument("--out-dir", default=".", help="Directory for saved trace windows")
+    parser.add_argument("--log", default="timing_monitor.log", help="Log file")
+    args = parser.parse_args()
+
+    setup_logger(filename=args.log)
+    os.makedirs(args.out_dir, exist_ok=True)
+    mode = IXCModes[args.mode]
+    with open(args.trace, "r") as stream:
+        violations = monitor(
+            stream,
+            mode,
+            args.scl,
+            args.sda,
+            args.out_dir,
+            args.before,
+            args.after,
+            args.t_r,
+            args.t_f,
+        )
+    logging.info(f"{args.trace}: {violations} timing violation(s) in {mode.name} mode")
+    return 1 if violations else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,277 @@
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Search for timing register values with the highest SCL frequency or margins
+
+`timing.get_firmware_settings` rounds each limit up separately and assumes T_HIGH = T_LOW,
+which leaves part of the bus bandwidth unused. The baseline of the optimizer are these
+settings made legal by `solver.solve`. The optimizer enumerates the integer values
+of T_R, T_F, THD_DAT and T_HIGH around their lower bounds, derives T_LOW and the bus
+condition registers from them, and keeps the settings meeting every limit of the
+specification (see `checker.spec_limits`) which:
+
+    * f_scl  - give the shortest SCL period, ties are broken by the minimum margin
+    * margin - give the largest minimum margin of the SCL clock timings at the SCL period
+               of the baseline (or of `f_scl`), or of the f_scl optimum if the baseline
+               violates the specification or no settings meet it at its period
+
+    python optimizer.py --sys-clk 333.333e6 --objective f_scl
+"""
+
+import argparse
+import functools
+import logging
+import math
+import sys
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+from checker import TOLERANCE
+from engineering_notation import EngNumber as EN
+from solver import THIGH_MIN, margins, solve
+from specification import IXCModes, IXCSpecification
+from timing import firmware_to_timings, get_firmware_settings, rise_fall_time
+from timing_utils import f2T, setup_logger
+
+OBJECTIVES = ["f_scl", "margin"]
+
+# Timings of a single SCL clock cycle, the margin objective balances their margins
+CLOCK_PARAMETERS = ["t_high", "t_low", "t_su_dat", "t_hd_dat", "t_scl"]
+
+# Timing registers are 16 bits wide
+REG_MAX = 0xFFFF
+
+# Number of values above the lower bound searched for T_R/T_F and THD_DAT
+RF_SPAN = 2
+HD_DAT_SPAN = 4
+
+
+@dataclass(frozen=True)
+class Optimum:
+    mode: IXCModes
+    sys_clk: float
+    objective: str
+    settings: dict
+    timings: dict
+    min_margin: float
+    # None if the baseline violates the specification
+    baseline_timings: Optional[dict]
+    baseline_min_margin: Optional[float]
+
+    @property
+    def gain(self):
+        """
+        Relative increase of the SCL frequency over the baseline, None without a legal baseline
+        """
+        if self.baseline_timings is None:
+            return None
+        return self.timings["f_scl"] / self.baseline_timings["f_scl"] - 1
+
+
+def cycles(limit, sys_period):
+    """
+    Smallest number of cycles lasting at least `limit`, 0 for a missing limit
+    """
+    if not isinstance(limit, (int, float)) or limit <= 0:
+        return 0
+    return math.ceil((limit - TOLERANCE) / sys_period)
+
+
+def min_margin(spec, timings):
+    """
+    Minimum margin (s) of the SCL clock timings
+    """
+    spec_margins = margins(spec, timings)
+    return np.min(
+        np.stack(
+            [
+                value
+                for name, value in spec_margins.items()
+                if name.rsplit("_", 1)[0] in CLOCK_PARAMETERS
+            ]
+        ),
+        axis=0,
+    )
+
+
+def candidates(spec, sys_period, period):
+    """
+    Register values to evaluate as arrays, `period` bounds the SCL period (cycles) from
+    below for the f_scl objective and sets it for the margin objective
+    """
+    lim = spec.spec
+    rf = cycles(rise_fall_time(spec), sys_period)
+    # Counters of i2c_controller_fsm loaded with THD_DAT count down to 1
+    hd_dat = max(cycles(lim["t_hd_dat_min"], sys_period), 1)
+    t_high_lo = max(THIGH_MIN, cycles(lim["t_high_min"], sys_period) - rf - RF_SPAN)
+
+    t_r, t_f, thd_dat, t_high = (
+        grid.ravel()
+        for grid in np.meshgrid(
+            np.arange(rf, rf + RF_SPAN + 1),
+            np.arange(rf, rf + RF_SPAN + 1),
+            np.arange(hd_dat, hd_dat + HD_DAT_SPAN + 1),
+            np.arange(t_high_lo, max(t_high_lo, period) + 1),
+            indexing="ij",
+        )
+    )
+    settings = {"T_R": t_r, "T_F": t_f, "THD_DAT": thd_dat, "T_HIGH": t_high}
+    settings["TSU_STA_MIN"] = np.maximum(cycles(lim["t_su_sta_min"], sys_period) - t_r, 0)
+    settings["THD_STA_MIN"] = np.maximum(cycles(lim["t_hd_sta_min"], sys_period) - t_f, 0)
+    settings["T_STO_MIN"] = np.maximum(cycles(lim["t_su_sto_min"], sys_period) - t_r, 0)
+    # HoldStop counts T_R + T_BUF - TSU_STA cycles, which must not underflow
+    settings["T_BUF_MIN"] = np.maximum(
+        cycles(lim["t_buf_min"], sys_period) - 2 * t_r, settings["TSU_STA_MIN"]
+    )
+    return settings
+
+
+def baseline(spec, sys_clk):
+    """
+    Settings of `get_firmware_settings` made legal by `solver.solve` and their timings, None
+    if they still violate the specification
+    """
+    settings = dict(get_firmware_settings(spec, sys_clk=sys_clk))
+    settings.update({name: int(value[0]) for name, value in solve(spec, [sys_clk]).items()})
+    timings = firmware_to_timings(settings, sys_clk=sys_clk)
+    if min(margins(spec, timings).values()) < -TOLERANCE:
+        return None, None
+    return settings, timings
+
+
+def search(spec, sys_clk, objective, period):
+    """
+    Index of the best candidate, the candidates and their timings
+    """
+    sys_period = f2T(sys_clk)
+    settings = candidates(spec, sys_period, period)
+    t_r, t_f, t_high = settings["T_R"], settings["T_F"], settings["T_HIGH"]
+    if objective == "f_scl":
+        # Shortest SCL low phase meeting t_low, t_su_dat and the SCL period
+        settings["T_LOW"] = np.maximum.reduce(
+            [
+                cycles(spec.spec["t_low_min"], sys_period) - t_f,
+                settings["THD_DAT"] + max(cycles(spec.spec["t_su_dat_min"], sys_period), 1),
+                period - t_r - t_f - t_high,
+            ]
+        )
+    else:
+        settings["T_LOW"] = period - t_r - t_f - t_high
+
+    timings = firmware_to_timings(settings, sys_clk=sys_clk)
+    feasible = np.all(
+        np.stack([value >= -TOLERANCE for value in margins(spec, timings).values()]), axis=0
+    )
+    feasible &= settings["T_LOW"] > settings["THD_DAT"]
+    feasible &= np.all(np.stack([value <= REG_MAX for value in settings.values()]), axis=0)
+    if not feasible.any():
+        raise ValueError(
+            f"No settings of {spec.mode.name} meet the specification at {EN(sys_clk)}Hz"
+        )
+
+    idx = np.flatnonzero(feasible)
+    scl_cycles = (t_r + t_high + t_f + settings["T_LOW"])[idx]
+    clock_margin = min_margin(spec, timings)[idx]
+    if objective == "f_scl":
+        order = np.lexsort((-clock_margin, scl_cycles))
+    else:
+        order = np.lexsort((scl_cycles, -clock_margin))
+    return idx[order[0]], settings, timings
+
+
+@functools.lru_cache(maxsize=None)
+def optimize(mode, sys_clk, objective="f_scl", f_scl=None):
+    """
+    Best settings for `mode` at `sys_clk`, the result is cached per arguments
+    """
+    spec = IXCSpecification(mode)
+    sys_period = f2T(sys_clk)
+    base, base_timings = baseline(spec, sys_clk)
+
+    if objective == "f_scl":
+        period = cycles(f2T(spec.spec["f_scl_max"]), sys_period)
+    elif f_scl:
+        period = math.floor(f2T(f_scl) / sys_period + TOLERANCE)
+    elif base is not None:
+        period = base["T_R"] + base["T_HIGH"] + base["T_F"] + base["T_LOW"]
+    else:
+        period = None
+
+    try:
+        if period is None:
+            raise ValueError(f"No legal baseline of {mode.name} at {EN(sys_clk)}Hz")
+        best, settings, timings = search(spec, sys_clk, objective, period)
+    except ValueError:
+        if objective != "margin" or f_scl:
+            raise
+        # Balance the margins at the shortest legal SCL period instead
+        fastest = optimize(mode, sys_clk)
+        period = round(fastest.timings["t_scl"] / sys_period)
+        best, settings, timings = search(spec, sys_clk, objective, period)
+
+    result = dict(base if base is not None else get_firmware_settings(spec, sys_clk=sys_clk))
+    result.update({name: int(value[best]) for name, value in settings.items()})
+    result_timings = {name: float(value[best]) for name, value in timings.items()}
+    return Optimum(
+        mode=mode,
+        sys_clk=sys_clk,
+        objective=objective,
+        settings=result,
+        timings=result_timings,
+        min_margin=float(min_margin(spec, result_timings)),
+        baseline_timings=base_timings,
+        baseline_min_margin=None if base is None else float(min_margin(spec, base_timings)),
+    )
+
+
+def report(optimum):
+    logging.info(
+        f"*** {optimum.mode.name} at {EN(optimum.sys_clk)}Hz, objective {optimum.objective} ***"
+    )
+    if optimum.baseline_timings is None:
+        logging.info("No legal baseline, the heuristic violates the specification")
+        logging.info(f"f_scl      = {EN(optimum.timings['f_scl'])}Hz")
+        logging.info(f"min margin = {EN(optimum.min_margin)}s")
+    else:
+        logging.info(
+            f"f_scl      = {EN(optimum.baseline_timings['f_scl'])}Hz -> "
+            f"{EN(optimum.timings['f_scl'])}Hz ({optimum.gain:+.1%})"
+        )
+        logging.info(
+            f"min margin = {EN(optimum.baseline_min_margin)}s -> {EN(optimum.min_margin)}s"
+        )
+    logging.info(f"Settings={optimum.settings}")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--sys-clk", type=float, required=True, help="System clock frequency (Hz)")
+    parser.add_argument(
+        "--mode", choices=[m.name for m in IXCModes], nargs="+", help="Bus modes, all by default"
+    )
+    parser.add_argument("--objective", choices=OBJECTIVES, default="f_scl")
+    parser.add_argument(
+        "--f-scl",
+        type=float,
+        help="SCL frequency (Hz) of the margin objective, defaults to the baseline's",
+    )
+    parser.add_argument("--log", default="timing_optimizer.log", help="Log file")
+    args = parser.parse_args()
+
+    setup_logger(filename=args.log)
+    modes = [IXCModes[m] for m in args.mode] if args.mode else list(IXCModes)
+    status = 0
+    for mode in modes:
+        try:
+            report(optimize(mode, args.sys_clk, args.objective, args.f_scl))
+        except ValueError as e:
+            logging.error(e)
+            status = 1
+    return status
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,157 @@
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Timing register values for a range of system clock frequencies
+
+Computes the settings of `timing.get_firmware_settings` for every bus mode and a grid of
+system clocks at once, together with the resulting bus timings and their margins to the
+limits of the specification, and writes them as a CSV or JSON table. Unlike the heuristic,
+T_HIGH is kept within the minimum of the I2C controller FSM and the maximum SCL high time
+of the mode. Settings which still violate a limit (e.g. the open drain SCL high time at low
+system clocks) are listed with `compliant` set to false:
+
+    python solver.py --sys-clk-range 100e6 1e9 50e6 --out timing_settings.csv
+"""
+
+import argparse
+import csv
+import json
+import sys
+
+import numpy as np
+from checker import TOLERANCE, spec_limits
+from specification import IXCModes, IXCSpecification
+from timing import firmware_to_timings, rise_fall_time
+from timing_utils import f2T
+
+# i2c_controller_fsm requires thigh >= 4 to guarantee it does not miss clock stretching
+THIGH_MIN = 4
+
+
+def solve(spec, sys_clks):
+    """
+    Settings of `get_firmware_settings` for each system clock in `sys_clks`, as arrays, with
+    T_HIGH clamped to the FSM minimum and to `t_high_max`
+    """
+    sys_period = f2T(np.asarray(sys_clks, dtype=float))
+
+    def norm_ceil(val):
+        return np.ceil(val / sys_period).astype(np.int64)
+
+    settings = {
+        "THIGH_MIN": np.maximum(norm_ceil(spec.spec["t_high_min"]), 4),
+        "TLOW_MIN": norm_ceil(spec.spec["t_low_min"]),
+        "THD_STA_MIN": norm_ceil(spec.spec["t_hd_sta_min"]),
+        "TSU_STA_MIN": norm_ceil(spec.spec["t_su_sta_min"]),
+        "TSU_DAT_MIN": norm_ceil(spec.spec["t_su_dat_min"]),
+        "T_BUF_MIN": norm_ceil(spec.spec["t_buf_min"]),
+        "T_STO_MIN": norm_ceil(spec.spec["t_su_sto_min"]),
+    }
+    settings["T_R"] = settings["T_F"] = norm_ceil(rise_fall_time(spec))
+
+    t_r, t_f = settings["T_R"], settings["T_F"]
+    settings["MIN_PERIOD"] = norm_ceil(f2T(spec.spec["f_scl_max"]))
+    t_high = np.ceil(
+        np.maximum((settings["MIN_PERIOD"] - t_f - t_r) / 2, spec.spec["t_high_min"] / sys_period)
+    ).astype(np.int64)
+    t_high_max = spec.spec.get("t_high_max")
+    if isinstance(t_high_max, (int, float)) and t_high_max > 0:
+        # SCL is released for T_R + T_HIGH cycles
+        t_high = np.minimum(
+            t_high, np.floor((t_high_max + TOLERANCE) / sys_period).astype(np.int64) - t_r
+        )
+    settings["T_HIGH"] = np.maximum(t_high, THIGH_MIN)
+    # A shortened high phase is made up for by the low phase to keep the SCL period
+    settings["T_LOW"] = np.maximum.reduce(
+        [
+            settings["T_HIGH"],
+            settings["TLOW_MIN"] - t_f,
+            settings["MIN_PERIOD"] - t_r - t_f - settings["T_HIGH"],
+        ]
+    )
+    return settings
+
+
+def margins(spec, timings):
+    """
+    Distance (s) of each timing to its limit, negative if the limit is violated
+    """
+    result = {}
+    for (param, kind), limit in spec_limits(spec).items():
+        value = timings[param]
+        result[f"{param}_{kind}"] = value - limit if kind == "min" else limit - value
+    return result
+
+
+def solve_table(sys_clks, modes=tuple(IXCModes)):
+    """
+    Rows of settings, timings and margins for each mode and system clock
+    """
+    sys_clks = np.asarray(sys_clks, dtype=float)
+    rows = []
+    for mode in modes:
+        spec = IXCSpecification(mode)
+        settings = solve(spec, sys_clks)
+        timings = firmware_to_timings(settings, sys_clk=sys_clks)
+        spec_margins = margins(spec, timings)
+        min_margin = np.min(np.stack(list(spec_margins.values())), axis=0)
+        for i, sys_clk in enumerate(sys_clks):
+            row = {"mode": mode.name, "sys_clk": float(sys_clk)}
+            row.update({name: int(value[i]) for name, value in settings.items()})
+            row.update({name: float(value[i]) for name, value in timings.items()})
+            row.update({f"margin_{name}": float(value[i]) for name, value in spec_margins.items()})
+            row["min_margin"] = float(min_margin[i])
+            row["compliant"] = bool(min_margin[i] >= -TOLERANCE)
+            rows.append(row)
+    return rows
+
+
+def write_table(rows, out, fmt):
+    if fmt == "json":
+        json.dump(rows, out, indent=2)
+        out.write("\n")
+        return
+    # Modes are limited by different parameters, columns missing in a row are left empty
+    columns = list(dict.fromkeys(name for row in rows for name in row))
+    writer = csv.DictWriter(out, fieldnames=columns, restval="")
+    writer.writeheader()
+    writer.writerows(rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    clocks = parser.add_mutually_exclusive_group(required=True)
+    clocks.add_argument("--sys-clk", type=float, nargs="+", help="System clock frequencies (Hz)")
+    clocks.add_argument(
+        "--sys-clk-range",
+        type=float,
+        nargs=3,
+        metavar=("START", "STOP", "STEP"),
+        help="Range of system clock frequencies (Hz), including STOP",
+    )
+    parser.add_argument(
+        "--mode", choices=[m.name for m in IXCModes], nargs="+", help="Bus modes, all by default"
+    )
+    parser.add_argument("--format", choices=["csv", "json"], help="Defaults to --out extension")
+    parser.add_argument("--out", help="Output file, standard output by default")
+    args = parser.parse_args()
+
+    if args.sys_clk:
+        sys_clks = args.sys_clk
+    else:
+        start, stop, step = args.sys_clk_range
+        sys_clks = np.arange(start, stop + step / 2, step)
+    modes = [IXCModes[m] for m in args.mode] if args.mode else list(IXCModes)
+    fmt = args.format or ("json" if args.out and args.out.endswith(".json") else "csv")
+
+    rows = solve_table(sys_clks, modes)
+    if args.out:
+        with open(args.out, "w", newline="") as f:
+            write_table(rows, f, fmt)
+    else:
+        write_table(rows, sys.stdout, fmt)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
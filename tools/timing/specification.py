@@ -56,6 +56,55 @@ SPECIFICATIONS = {
         "t_buf_min": 0.5e-6,
         "t_spike_min": 0,
     },
+    # Table 86 I3C Open Drain Timing Parameters, mapped onto the parameters of legacy modes
+    IXCModes.I3C_SDR_12M5_OD: {
+        "f_scl_max": 12.5e6,
+        # t_CBP, t_CAS
+        "t_su_sta_min": 19.2e-9,
+        "t_hd_sta_min": 38.4e-9,
+        # t_LOW_OD
+        "t_low_min": 200e-9,
+        "t_dig_l_min": "t_low_od+t_f_da_od",
+        # t_HIGH is limited, so that the pulse is filtered out by the spike filters of I2C
+        # devices
+        "t_high_min": 24e-9,
+        "t_high_max": 41e-9,
+        "t_dig_h_min": "t_high+t_cr",
+        # t_SU_OD
+        "t_su_dat_min": 3e-9,
+        "t_hd_dat_min": None,
+        # t_CR, t_CF, 150e6 * bus period
+        "t_r_cl_min": 12e-9,
+        "t_f_cl_min": 12e-9,
+        "t_r_da_min": 12e-9,
+        "t_r_da_od_min": 12e-9,
+        "t_f_da_min": 12e-9,
+        # t_CBP, t_CAS of pure bus
+        "t_su_sto_min": 19.2e-9,
+        "t_buf_min": 38.4e-9,
+        "t_spike_min": 0,
+    },
+    # Table 87 I3C Push-Pull Timing Parameters for SDR Mode
+    IXCModes.I3C_SDR_12M5_PP: {
+        "f_scl_max": 12.5e6,
+        "t_su_sta_min": 19.2e-9,
+        "t_hd_sta_min": 38.4e-9,
+        "t_low_min": 24e-9,
+        "t_dig_l_min": "t_low+t_cf",
+        "t_high_min": 24e-9,
+        "t_dig_h_min": "t_high+t_cr",
+        # t_SU_PP
+        "t_su_dat_min": 3e-9,
+        "t_hd_dat_min": None,
+        "t_r_cl_min": 12e-9,
+        "t_f_cl_min": 12e-9,
+        "t_r_da_min": 12e-9,
+        "t_r_da_od_min": None,
+        "t_f_da_min": 12e-9,
+        "t_su_sto_min": 19.2e-9,
+        "t_buf_min": 38.4e-9,
+        "t_spike_min": 0,
+    },
 }
 
 
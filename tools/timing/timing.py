@@ -5,7 +5,19 @@ import math
 
 from engineering_notation import EngNumber as EN
 from specification import MODE_FREQ_DICT, IXCModes, IXCSpecification
-from utils import cycles2seconds, f2halfT, f2T, norm_ceil, setup_logger
+from timing_utils import T2f, cycles2seconds, f2halfT, f2T, norm_ceil, setup_logger
+
+
+def rise_fall_time(spec):
+    """
+    Rise/fall time of SCL assumed for the mode. Rise/fall times are not fw controlled, they
+    depend on electrical design.
+    """
+    # All rf in spec were the same, so simplifying
+    if spec.mode == IXCModes.LEGACY_1M:
+        # Specification does not constrain it, c.f. Table 85 Legacy Mode 1MHz/Fm+, t_r_cl
+        return 20e-9
+    return spec.spec["t_r_cl_min"]
 
 
 def get_firmware_settings(spec, sys_clk=100e6):
@@ -31,16 +43,7 @@ def get_firmware_settings(spec, sys_clk=100e6):
     }
 
     # Rise/fall time
-    # All rf in spec were the same, so simplifying
-    if spec.mode == IXCModes.LEGACY_1M:
-        T_R = T_F = norm_ceil(20e-9, sys_period)
-        logging.debug("Arbitrarily set T_R and T_F to 20ns")
-        logging.debug("Specification does not constrain it.")
-        logging.debug("C.f. Table 85 Legacy Mody 1MHz/Fm+, entry: t_r_cl")
-    else:
-        T_R = T_F = norm_ceil(spec.spec["t_r_cl_min"], sys_period)
-
-    logging.debug("Rise/fall times are not fw controlled. They depend on electrical design.")
+    T_R = T_F = norm_ceil(rise_fall_time(spec), sys_period)
     logging.debug(f"T_R = {EN(T_R)}")
     logging.debug(f"T_F = {EN(T_F)}")
     settings["T_R"] = T_R
@@ -55,7 +58,8 @@ def get_firmware_settings(spec, sys_clk=100e6):
     # Assuming THIGH=TLOW
     # 2*THIGH >= PERIOD - T_F - T_R
     T_HIGH = math.ceil(max((MIN_PERIOD - T_F - T_R) / 2, spec.spec["t_high_min"] / sys_period))
-    T_LOW = T_HIGH
+    # SCL is held low for T_F + T_LOW cycles, which must not fall below t_low_min
+    T_LOW = max(T_HIGH, TLOW_MIN - T_F)
     logging.debug(f"T_HIGH = {T_HIGH}")
     logging.debug(f"T_LOW = {T_LOW}")
 
@@ -88,9 +92,37 @@ def get_i3c_firmware_settings():
     bus_condition_timing_register(freq)
 
 
-# TODO: From discrete settings calculate physical values on bus to validate them (min,max)
-def firmware_to_timings():
-    pass
+def firmware_to_timings(settings, sys_clk=100e6):
+    """
+    Calculate timings observed on the bus for discrete settings returned by
+    `get_firmware_settings`.
+
+    Follows the counters of the I2C controller FSM, e.g. SCL is released for T_R + T_HIGH
+    cycles and pulled low for T_F + T_LOW cycles. The edges are ideal, so the result can be
+    compared directly with timings measured in simulation (see checker.py).
+    """
+    sys_period = f2T(sys_clk)
+    t_r = settings["T_R"]
+    t_f = settings["T_F"]
+    thd_dat = settings.get("THD_DAT", 0)
+
+    cycles = {
+        "t_high": t_r + settings["T_HIGH"],
+        "t_low": t_f + settings["T_LOW"],
+        "t_su_sta": t_r + settings["TSU_STA_MIN"],
+        "t_hd_sta": t_f + settings["THD_STA_MIN"],
+        "t_su_dat": settings["T_LOW"] - thd_dat,
+        "t_hd_dat": t_f + thd_dat,
+        "t_su_sto": t_r + settings["T_STO_MIN"],
+        # Bus free time spans HoldStop and SetupStart of the following transfer
+        "t_buf": 2 * t_r + settings["T_BUF_MIN"],
+    }
+    cycles["t_scl"] = cycles["t_high"] + cycles["t_low"]
+
+    timings = {name: cycles2seconds(value, sys_period) for name, value in cycles.items()}
+    timings["f_scl"] = T2f(timings["t_scl"])
+    logging.debug(f"Timings={timings}")
+    return timings
 
 
 # Fig 144 I3C Start Timing
@@ -264,7 +296,9 @@ def main():
         logging.info(f"mode             = {mode}")
         log_generic_timings(mode, sys_freq)
         spec = IXCSpecification(mode)
-        get_firmware_settings(spec=spec, sys_clk=sys_freq)
+        settings = get_firmware_settings(spec=spec, sys_clk=sys_freq)
+        timings = firmware_to_timings(settings, sys_clk=sys_freq)
+        logging.info(f"f_scl            = {EN(timings['f_scl'])}")
 
     bus_freq = 12.5e6
     bus_period = f2T(bus_freq)
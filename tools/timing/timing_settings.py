@@ -0,0 +1,72 @@
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Timing register values for testbenches
+
+The cocotb testbenches have tools/timing on their PYTHONPATH and can take the values of
+timing CSRs and ports from here instead of hardcoding them. They then run at the fastest bus
+timing meeting the specification at the simulated clock (see optimizer.py), consistently
+with the values the tools report:
+
+    timings = settings_for(IXCModes.LEGACY_400k, sys_clk_hz=2e6)
+    dut.thigh_i.value = timings.t_high
+
+Making them the default of the testbenches is deferred until the block and top-level suites
+have been run with them, until then the testbenches keep their previous values unless
+COCOTB_TB_SPEC_TIMING=1 is set (see `spec_timing_enabled`).
+"""
+
+import functools
+import os
+from dataclasses import dataclass
+
+from optimizer import optimize
+from specification import IXCModes
+
+
+@dataclass(frozen=True)
+class TimingSettings:
+    """
+    Values of the timing registers in system clock cycles
+    """
+
+    t_r: int
+    t_f: int
+    t_high: int
+    t_low: int
+    t_su_dat: int
+    t_hd_dat: int
+    t_su_sta: int
+    t_hd_sta: int
+    t_su_sto: int
+    t_buf: int
+
+
+def spec_timing_enabled():
+    """
+    Whether testbenches should program the settings of `settings_for`
+    """
+    return bool(os.getenv("COCOTB_TB_SPEC_TIMING"))
+
+
+@functools.lru_cache(maxsize=None)
+def settings_for(mode, sys_clk_hz):
+    """
+    Settings with the highest SCL frequency of `mode` (`IXCModes` or its name) at
+    `sys_clk_hz`, computed once per arguments
+    """
+    if isinstance(mode, str):
+        mode = IXCModes[mode]
+    settings = optimize(mode, float(sys_clk_hz)).settings
+    return TimingSettings(
+        t_r=settings["T_R"],
+        t_f=settings["T_F"],
+        t_high=settings["T_HIGH"],
+        t_low=settings["T_LOW"],
+        t_su_dat=settings["TSU_DAT_MIN"],
+        t_hd_dat=settings["THD_DAT"],
+        t_su_sta=settings["TSU_STA_MIN"],
+        t_hd_sta=settings["THD_STA_MIN"],
+        t_su_sto=settings["T_STO_MIN"],
+        t_buf=settings["T_BUF_MIN"],
+    )
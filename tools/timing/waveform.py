@@ -0,0 +1,168 @@
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Minimal streaming VCD reader
+
+Only the signals which are requested are decoded, every other value change is skipped
+without being stored, so large dumps can be processed with a constant memory footprint.
+"""
+
+import re
+from dataclasses import dataclass
+
+import numpy as np
+
+TIMESCALE_UNITS = {
+    "s": 1.0,
+    "ms": 1e-3,
+    "us": 1e-6,
+    "ns": 1e-9,
+    "ps": 1e-12,
+    "fs": 1e-15,
+}
+
+# Value used for bits which are neither 0 nor 1 (x, z)
+UNKNOWN = -1
+
+
+@dataclass
+class VcdSignal:
+    path: str
+    ident: str
+    width: int
+
+    @property
+    def name(self):
+        return self.path.split(".")[-1]
+
+
+def parse_timescale(text):
+    """
+    Convert VCD timescale declaration (e.g. "1ps", "10 ns") to seconds
+    """
+    match = re.fullmatch(r"\s*(\d+)\s*([munpf]?s)\s*", text)
+    if not match:
+        raise ValueError(f"Unsupported VCD timescale: '{text}'")
+    return int(match.group(1)) * TIMESCALE_UNITS[match.group(2)]
+
+
+def decode_value(value):
+    """
+    Convert VCD scalar or vector value to an integer, UNKNOWN if any bit is x/z
+    """
+    if value in ("0", "1"):
+        return int(value)
+    try:
+        return int(value, 2)
+    except ValueError:
+        return UNKNOWN
+
+
+class VcdReader:
+    """
+    Parses VCD header on construction, value changes are consumed with `changes`
+    """
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.timescale = 1e-12
+        self.signals = {}
+        self._parse_header()
+
+    def _declarations(self):
+        """
+        Yield header declarations as lists of tokens between a keyword and its `$end`
+        """
+        tokens = []
+        for line in self.stream:
+            for token in line.split():
+                tokens.append(token)
+                if token == "$end":
+                    yield tokens
+                    if tokens[0] == "$enddefinitions":
+                        return
+                    tokens = []
+
+    def _parse_header(self):
+        scope = []
+        for decl in self._declarations():
+            keyword, body = decl[0], decl[1:-1]
+            if keyword == "$timescale":
+                self.timescale = parse_timescale("".join(body))
+            elif keyword == "$scope":
+                scope.append(body[-1])
+            elif keyword == "$upscope":
+                scope.pop()
+            elif keyword == "$var":
+                width, ident, name = int(body[1]), body[2], body[3]
+                path = ".".join(scope + [name])
+                self.signals[path] = VcdSignal(path, ident, width)
+
+    def find(self, name):
+        """
+        Look up a signal by its full path, path suffix or leaf name.
+        The shallowest match is returned if the name is ambiguous.
+        """
+        if name in self.signals:
+            return self.signals[name]
+        matches = [s for p, s in self.signals.items() if p == name or p.endswith("." + name)]
+        if not matches:
+            raise KeyError(f"Signal '{name}' not found in waveform")
+        return min(matches, key=lambda s: s.path.count("."))
+
+    def changes(self, idents):
+        """
+        Yield (time, ident, value) for value changes of selected identifiers.
+        Time is expressed in timescale units.
+        """
+        idents = set(idents)
+        time = 0
+        for line in self.stream:
+            tokens = line.split()
+            i = 0
+            while i < len(tokens):
+                token = tokens[i]
+                head = token[0]
+                if head == "#":
+                    time = int(token[1:])
+                elif head in "bBrR":
+                    ident = tokens[i + 1]
+                    i += 1
+                    if ident in idents:
+                        yield time, ident, token[1:]
+                elif head in "01xXzZ":
+                    ident = token[1:]
+                    if ident in idents:
+                        yield time, ident, head
+                # $dumpvars, $end and other keywords carry no values on their own
+                i += 1
+
+
+def load_signals(filename, names):
+    """
+    Read selected signals from VCD file
+
+    Returns dict mapping each requested name to (times, values), where times are in seconds
+    and values are integers (UNKNOWN for x/z).
+    """
+    with open(filename, "r") as f:
+        reader = VcdReader(f)
+        signals = {name: reader.find(name) for name in names}
+        by_ident = {}
+        for name, signal in signals.items():
+            by_ident.setdefault(signal.ident, []).append(name)
+
+        times = {ident: [] for ident in by_ident}
+        values = {ident: [] for ident in by_ident}
+        for time, ident, value in reader.changes(by_ident):
+            times[ident].append(time)
+            values[ident].append(decode_value(value.lower()))
+
+    result = {}
+    for ident, names_ in by_ident.items():
+        t = np.asarray(times[ident], dtype=np.float64) * reader.timescale
+        dtype = np.int64 if signals[names_[0]].width < 63 else object
+        v = np.asarray(values[ident], dtype=dtype)
+        for name in names_:
+            result[name] = (t, v)
+    return result
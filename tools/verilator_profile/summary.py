@@ -0,0 +1,137 @@
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Per-source-file cost summary of a Verilator model
+
+The model has to be built with `--prof-cfuncs` and linked with `-pg`, so that running it
+leaves gmon.out behind. Verilator then names the generated functions after the basename of
+the source file and the line they evaluate (`..._PROF__<file>__l<line>`), which allows to
+attribute the time gprof measured to the source files of the design. A file usually holds
+one module, but the names do not tell modules apart.
+
+Unlike `verilator_profcfuncs`, the time outside of the design is split into the Verilated
+runtime and the cocotb/VPI layer, which tells whether the testbench or the model is slow.
+"""
+
+import argparse
+import re
+import subprocess
+import sys
+from collections import defaultdict
+from dataclasses import dataclass, field
+
+# Line of the gprof flat profile: % time, cumulative seconds, self seconds, and optional call
+# counts followed by the function name
+FLAT_PROFILE_LINE = re.compile(
+    r"^\s*[\d.]+\s+[\d.]+\s+(?P<seconds>[\d.]+)\s+(?:(?P<calls>\d+)\s+[\d.]+\s+[\d.]+\s+)?"
+    r"(?P<name>\S.*)$"
+)
+PROF_FUNCTION = re.compile(r"__PROF__(?P<file>\w+?)__l?(?P<line>\d+)")
+
+VERILATED = "(verilated runtime)"
+COCOTB = "(cocotb, VPI)"
+OTHER = "(other)"
+
+
+@dataclass
+class FileCost:
+    seconds: float = 0.0
+    functions: int = 0
+    # Source line -> seconds
+    lines: dict = field(default_factory=lambda: defaultdict(float))
+
+    def hottest_line(self):
+        if not self.lines:
+            return None
+        return max(self.lines.items(), key=lambda item: item[1])[0]
+
+
+def flat_profile(report):
+    """
+    Yield (function, self seconds) from a gprof report
+    """
+    in_profile = False
+    for line in report.splitlines():
+        if not in_profile:
+            # Header of the flat profile table
+            in_profile = line.split()[-1:] == ["name"] and "seconds" in line
+            continue
+        if not line.strip():
+            break
+        match = FLAT_PROFILE_LINE.match(line)
+        if match:
+            yield match["name"], float(match["seconds"])
+
+
+def classify(function):
+    """
+    Return the source file (basename) and line a function evaluates, or a group of
+    non-design code
+    """
+    match = PROF_FUNCTION.search(function)
+    if match:
+        return match["file"], int(match["line"])
+    if function.startswith("VL_") or "Verilated" in function:
+        return VERILATED, None
+    if re.match(r"(vpi_|gpi_|Py|_Py)", function) or re.search(r"cocotb|Gpi|Vpi", function):
+        return COCOTB, None
+    return OTHER, None
+
+
+def summarize(report):
+    """
+    Aggregate a gprof report into source file -> FileCost
+    """
+    files = defaultdict(FileCost)
+    for function, seconds in flat_profile(report):
+        name, line = classify(function)
+        cost = files[name]
+        cost.seconds += seconds
+        cost.functions += 1
+        if line is not None:
+            cost.lines[line] += seconds
+    return dict(files)
+
+
+def format_summary(files):
+    total = sum(cost.seconds for cost in files.values())
+    lines = [
+        f"Total sampled time: {total:.2f} s",
+        "",
+        f"{'seconds':>9} {'%':>6} {'functions':>10} {'hottest line':>13}  file",
+    ]
+    for name, cost in sorted(files.items(), key=lambda item: -item[1].seconds):
+        share = 100 * cost.seconds / total if total else 0
+        hottest = cost.hottest_line()
+        hottest = "" if hottest is None else f"l{hottest}"
+        lines.append(f"{cost.seconds:9.2f} {share:6.2f} {cost.functions:10d} {hottest:>13}  {name}")
+    return "\n".join(lines) + "\n"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("binary", help="Profiled model executable, e.g. sim_build/Vtop")
+    parser.add_argument("gmon", help="gmon.out written by the model")
+    parser.add_argument("--out", default="profile_rtl.txt", help="Summary file")
+    parser.add_argument("--gprof-out", help="Optionally keep the full gprof flat profile")
+    args = parser.parse_args()
+
+    report = subprocess.run(
+        ["gprof", "--brief", "--flat-profile", args.binary, args.gmon],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    if args.gprof_out:
+        with open(args.gprof_out, "w") as f:
+            f.write(report)
+
+    summary = format_summary(summarize(report))
+    with open(args.out, "w") as f:
+        f.write(summary)
+    print(summary, end="")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
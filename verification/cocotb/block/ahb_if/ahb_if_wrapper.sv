@@ -13,7 +13,11 @@ module ahb_if_wrapper
     parameter  int unsigned AhbAddrWidth = 32
 ) (
     // AHB-Lite interface
+`ifdef TB_HDL_CLOCK
+    output logic                      hclk,
+`else
     input  logic                      hclk,
+`endif
     input  logic                      hreset_n,
     input  logic [  AhbAddrWidth-1:0] haddr,
     input  logic [               2:0] hburst,
@@ -43,6 +47,13 @@ module ahb_if_wrapper
   logic                    s_cpuif_wr_ack;
   logic                    s_cpuif_wr_err;
 
+  // Clock generated in HDL instead of cocotb, see common/clocking.py
+`ifdef TB_HDL_CLOCK
+  tb_clk_gen xclk_gen (
+      .clk_o(hclk)
+  );
+`endif
+
   ahb_if #(
       .AhbDataWidth,
       .AhbAddrWidth
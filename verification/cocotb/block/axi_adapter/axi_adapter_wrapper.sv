@@ -17,7 +17,11 @@ module axi_adapter_wrapper
     parameter int unsigned AxiUserWidth = 32,
     parameter int unsigned AxiIdWidth   = 2
 ) (
+`ifdef TB_HDL_CLOCK
+    output logic aclk,  // clock
+`else
     input aclk,  // clock
+`endif
     input areset_n,  // active low reset
 
     // AXI Read Channels
@@ -74,6 +78,13 @@ module axi_adapter_wrapper
   logic                    s_cpuif_wr_ack;
   logic                    s_cpuif_wr_err;
 
+  // Clock generated in HDL instead of cocotb, see common/clocking.py
+`ifdef TB_HDL_CLOCK
+  tb_clk_gen xclk_gen (
+      .clk_o(aclk)
+  );
+`endif
+
   axi_adapter #(
       .AxiDataWidth,
       .AxiAddrWidth,
@@ -1,4 +1,7 @@
 BLOCK_DIR := $(abspath $(dir $(lastword $(MAKEFILE_LIST))))
 export PYTHONPATH := $(PYTHONPATH):$(BLOCK_DIR)/lib_hci_queues:$(BLOCK_DIR)/lib_adapter
 
+# Packed observation port of the HCI queues wrappers, see lib_hci_queues/hci_queues_obs.yaml
+VERILOG_INCLUDE_DIRS := $(BLOCK_DIR)/lib_hci_queues
+
 include $(BLOCK_DIR)/../common.mk
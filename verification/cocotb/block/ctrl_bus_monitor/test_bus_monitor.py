@@ -2,23 +2,36 @@
 
 from cocotb_helpers import reset_n
 from cocotbext_i3c.i3c_controller import I3cController
+from specification import IXCModes
+from tasks import background
+from timing_settings import settings_for, spec_timing_enabled
 
 import cocotb
 from cocotb.clock import Clock
 from cocotb.handle import SimHandleBase
 from cocotb.triggers import ClockCycles, RisingEdge
 
+# Frequency of the 2ns clock of the tests
+SYS_CLK_HZ = 500e6
+
 
 async def setup(dut):
     """
     Happy path testing, arbitrarily selected:
         - 5 -> 10ns for the data hold time (spec has no constraint)
         - 2 -> 4ns for the rise/fall time (spec lowest is 12ns)
+    or with COCOTB_TB_SPEC_TIMING=1 the timing settings of the push-pull SDR mode at the
+    simulated clock, see tools/timing/timing_settings.py
     """
+    if spec_timing_enabled():
+        timings = settings_for(IXCModes.I3C_SDR_12M5_PP, SYS_CLK_HZ)
+        t_hd_dat, t_r, t_f = timings.t_hd_dat, timings.t_r, timings.t_f
+    else:
+        t_hd_dat, t_r, t_f = 0x05, 0x02, 0x02
     dut.enable_i.value = 0
-    dut.t_hd_dat_i.value = 0x05
-    dut.t_r_i.value = 0x02
-    dut.t_f_i.value = 0x02
+    dut.t_hd_dat_i.value = t_hd_dat
+    dut.t_r_i.value = t_r
+    dut.t_f_i.value = t_f
     dut.is_in_hdr_mode_i.value = 0
     await ClockCycles(dut.clk_i, 10)
 
@@ -58,7 +71,7 @@ async def test_bus_monitor(dut: SimHandleBase):
     )
 
     clock = Clock(clk, 2, units="ns")
-    cocotb.start_soon(clock.start())
+    background.start_soon(clock.start())
 
     await setup(dut)
     await reset_n(clk, rst_n, cycles=5)
@@ -120,7 +133,7 @@ async def test_bus_monitor_hdr_exit(dut: SimHandleBase):
     )
 
     clock = Clock(clk, 2, units="ns")
-    cocotb.start_soon(clock.start())
+    background.start_soon(clock.start())
 
     await setup(dut)
     await reset_n(clk, rst_n, cycles=5)
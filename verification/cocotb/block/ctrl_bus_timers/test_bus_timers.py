@@ -1,6 +1,7 @@
 # SPDX-License-Identifier: Apache-2.0
 
-from cocotb_helpers import cycle, reset_n
+from cocotb_helpers import cycle, reset_n, wait_cycles
+from tasks import background
 
 import cocotb
 from cocotb.clock import Clock
@@ -28,7 +29,7 @@ async def test_bus_timers(dut: SimHandleBase):
     """
     # Start clock
     clock = Clock(dut.clk_i, 2, units="ns")
-    cocotb.start_soon(clock.start())
+    background.start_soon(clock.start())
 
     clk = dut.clk_i
     rst_n = dut.rst_ni
@@ -45,7 +46,7 @@ async def test_bus_timers(dut: SimHandleBase):
         assert dut.bus_free_o.value == 0
         assert dut.bus_available_o.value == 0
         assert dut.bus_idle_o.value == 0
-        await ClockCycles(dut.clk_i, 75)
+        await wait_cycles(dut.clk_i, 75)
         assert dut.bus_free_o.value == 1
         assert dut.bus_available_o.value == 1
         assert dut.bus_idle_o.value == 1
@@ -4,6 +4,8 @@ import logging
 import random
 
 from cocotb_helpers import cycle, reset_n
+from debug_log import get_logger
+from tasks import background
 
 import cocotb
 from cocotb.clock import Clock
@@ -30,6 +32,7 @@ class RxQueue:
         self.wready = dut.rx_queue_wready_i
         self.wdata = dut.rx_queue_wdata_o
         self.q = Queue()
+        self.log = get_logger(f"{dut._path}.rx_queue")
 
     async def bfm(self, dut):
         while True:
@@ -41,9 +44,9 @@ class RxQueue:
             if self.wvalid.value and self.wready.value:
                 try:
                     self.q.put_nowait(self.wdata.value)
-                    print(f"Data written to queue: {self.wdata.value}")
+                    self.log.debug("Data written to queue: %s", self.wdata.value)
                 except QueueFull:
-                    print("Queue is already full")
+                    self.log.debug("Queue is already full")
                     pass
             await ClockCycles(dut.clk_i, 1)
 
@@ -60,6 +63,7 @@ class TxQueue:
         self.rready = dut.tx_queue_rready_o
         self.rdata = dut.tx_queue_rdata_i
         self.q = Queue()
+        self.log = get_logger(f"{dut._path}.tx_queue")
         random.seed(10)
 
     def add_data(self, N):
@@ -87,9 +91,9 @@ class TxQueue:
             if self.rvalid.value and self.rready.value:
                 try:
                     self.rdata.value = self.q.get_nowait()
-                    print(f"Data read from queue: {self.rdata.value}")
+                    self.log.debug("Data read from queue: %s", self.rdata.value)
                 except QueueEmpty:
-                    print("Queue is already empty")
+                    self.log.debug("Queue is already empty")
                     pass
             await ClockCycles(dut.clk_i, 1)
 
@@ -122,7 +126,7 @@ async def test_rx(dut: SimHandleBase):
     cocotb.log.setLevel(logging.INFO)
     # Start clock
     clock = Clock(dut.clk_i, 2, units="ns")
-    cocotb.start_soon(clock.start())
+    background.start_soon(clock.start())
 
     # RxQueue
     rx_queue = RxQueue(dut)
@@ -135,8 +139,8 @@ async def test_rx(dut: SimHandleBase):
     await reset_n(clk, rst_n, cycles=5)
     await setup(dut)
 
-    cocotb.start_soon(rx_queue.bfm(dut))
-    cocotb.start_soon(tx_queue.bfm(dut))
+    background.start_soon(rx_queue.bfm(dut))
+    background.start_soon(tx_queue.bfm(dut))
 
     await bus_tx(dut)
 
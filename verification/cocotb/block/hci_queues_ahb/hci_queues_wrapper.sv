@@ -1,4 +1,5 @@
 // SPDX-License-Identifier: Apache-2.0
+`include "hci_queues_obs.svh"
 
 module hci_queues_wrapper
   import i3c_pkg::*;
@@ -44,7 +45,11 @@ module hci_queues_wrapper
     parameter int unsigned TtiTxThldWidth = 3,
     parameter int unsigned TtiIbiThldWidth = 8
 ) (
+`ifdef TB_HDL_CLOCK
+    output logic hclk,  // clock
+`else
     input hclk,  // clock
+`endif
     input hreset_n,  // active low reset
 
     // AHB-Lite interface
@@ -161,7 +166,10 @@ module hci_queues_wrapper
     output logic tti_ibi_queue_empty_o,
     output logic tti_ibi_queue_rvalid_o,
     input logic tti_ibi_queue_rready_i,
-    output logic [TtiIbiDataWidth-1:0] tti_ibi_queue_rdata_o
+    output logic [TtiIbiDataWidth-1:0] tti_ibi_queue_rdata_o,
+
+    // Status of the queues packed into one port, see lib_hci_queues/hci_queues_obs.yaml
+    output logic [`HCI_QUEUES_OBS_WIDTH-1:0] obs_o
 );
 
   // I3C SW CSR IF
@@ -178,6 +186,15 @@ module hci_queues_wrapper
   logic s_cpuif_wr_ack;
   logic s_cpuif_wr_err;
 
+  // Clock generated in HDL instead of cocotb, see common/clocking.py
+`ifdef TB_HDL_CLOCK
+  tb_clk_gen xclk_gen (
+      .clk_o(hclk)
+  );
+`endif
+
+  `HCI_QUEUES_OBS_ASSIGN(obs_o)
+
   ahb_if #(
       .AhbDataWidth(`AHB_DATA_WIDTH),
       .AhbAddrWidth(`AHB_ADDR_WIDTH)
@@ -1,4 +1,5 @@
 // SPDX-License-Identifier: Apache-2.0
+`include "hci_queues_obs.svh"
 
 module hci_queues_wrapper
   import i3c_pkg::*;
@@ -49,7 +50,11 @@ module hci_queues_wrapper
     parameter int unsigned TtiTxThldWidth = 3,
     parameter int unsigned TtiIbiThldWidth = 8
 ) (
+`ifdef TB_HDL_CLOCK
+    output logic aclk,  // clock
+`else
     input aclk,  // clock
+`endif
     input areset_n,  // active low reset
 
     // AXI4 Interface
@@ -192,7 +197,10 @@ module hci_queues_wrapper
     output logic tti_ibi_queue_empty_o,
     output logic tti_ibi_queue_rvalid_o,
     input logic tti_ibi_queue_rready_i,
-    output logic [TtiIbiDataWidth-1:0] tti_ibi_queue_rdata_o
+    output logic [TtiIbiDataWidth-1:0] tti_ibi_queue_rdata_o,
+
+    // Status of the queues packed into one port, see lib_hci_queues/hci_queues_obs.yaml
+    output logic [`HCI_QUEUES_OBS_WIDTH-1:0] obs_o
 );
 
   // I3C SW CSR IF
@@ -209,6 +217,15 @@ module hci_queues_wrapper
   logic s_cpuif_wr_ack;
   logic s_cpuif_wr_err;
 
+  // Clock generated in HDL instead of cocotb, see common/clocking.py
+`ifdef TB_HDL_CLOCK
+  tb_clk_gen xclk_gen (
+      .clk_o(aclk)
+  );
+`endif
+
+  `HCI_QUEUES_OBS_ASSIGN(obs_o)
+
   axi_adapter #(
       .AxiDataWidth,
       .AxiAddrWidth,
@@ -5,6 +5,7 @@ from typing import Any
 
 import i2c
 from cocotbext.i2c import I2cMaster
+from tasks import background
 from utils import Sequence, split_into_dwords
 
 import cocotb
@@ -75,7 +76,7 @@ async def run_test(dut):
 
     # Start clock
     clock = Clock(dut.clk_i, 0.5 / 4, units="us")
-    cocotb.start_soon(clock.start())
+    background.start_soon(clock.start())
 
     # Reset
 
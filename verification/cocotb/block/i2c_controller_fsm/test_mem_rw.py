@@ -10,6 +10,7 @@ from i2c import (
     init_i2c_controller_ports,
     reset_controller,
 )
+from tasks import background
 
 import cocotb
 from cocotb.clock import Clock
@@ -27,11 +28,11 @@ async def run_test(dut):
     # I2C target
     I2cMemory(sda=dut.sda_o, sda_o=dut.sda_i, scl=dut.scl_o, scl_o=dut.scl_i)
 
-    init_i2c_controller_ports(dut)
+    init_i2c_controller_ports(dut, sys_clk_hz=2e6)
 
     # Start clock
     clock = Clock(dut.clk_i, 0.5, units="us")
-    cocotb.start_soon(clock.start())
+    background.start_soon(clock.start())
 
     # Reset
     await reset_controller(dut)
@@ -7,6 +7,7 @@ from typing import Any
 import i2c
 from cocotbext.i2c import I2cMaster
 from hci import TxFifo
+from tasks import background
 from utils import Sequence, SequenceFailed, split_into_dwords
 
 import cocotb
@@ -116,7 +117,7 @@ async def run_test(dut):
 
     # Start clock
     clock = Clock(dut.clk_i, 0.5 / 4, units="us")
-    cocotb.start_soon(clock.start())
+    background.start_soon(clock.start())
 
     # Reset
     master.bus_active = True
@@ -8,7 +8,9 @@ import colorama
 import i2c
 from cocotbext.i2c import I2cMaster
 from hci import TxFifo
-from utils import Sequence, SequenceFailed, split_into_dwords
+from snapshot import SnapshotService
+from tasks import background
+from utils import Sequence, SequenceEngine, SequenceFailed, split_into_dwords
 
 import cocotb
 from cocotb.clock import Clock
@@ -66,20 +68,24 @@ async def test_write_restart_read_sequence(
 ):
     tx_fifo_data = [dword for dword, _ in split_into_dwords(response_data)]
 
+    # Signals are read once per cycle for all the sequences matched concurrently
+    snapshot = SnapshotService(dut.clk_i, dut)
+    i3c = snapshot.dut.i3c
+
     tx_fifo = TxFifo(
         clk=dut.clk_i,
-        data_port=dut.i3c.tti_tx_fifo_rdata,
-        valid_port=dut.i3c.tti_tx_fifo_rvalid,
-        ready_port=dut.i3c.tti_tx_fifo_rready,
+        data_port=i3c.tti_tx_fifo_rdata,
+        valid_port=i3c.tti_tx_fifo_rvalid,
+        ready_port=i3c.tti_tx_fifo_rready,
         content=tx_fifo_data,
         name="tx_fifo",
     )
 
     cmd_fifo = TxFifo(
         clk=dut.clk_i,
-        data_port=dut.i3c.tti_cmd_fifo_rdata,
-        valid_port=dut.i3c.tti_cmd_fifo_rvalid,
-        ready_port=dut.i3c.tti_cmd_fifo_rready,
+        data_port=i3c.tti_cmd_fifo_rdata,
+        valid_port=i3c.tti_cmd_fifo_rvalid,
+        ready_port=i3c.tti_cmd_fifo_rready,
         content=[len(response_data) << 16],
         name="cmd_fifo",
     )
@@ -121,34 +127,34 @@ async def test_write_restart_read_sequence(
     # Fire up the master
     i2c_transaction_task = cocotb.start_soon(master_write_read())
 
-    # Receive and check request
-    rx_tti_task = cocotb.start_soon(
-        rx_tti_seq.match(dut, dut.clk_i, timeout_cycles, noexcept=False, trace=True)
+    # Receive and check request, both sequences are evaluated by a single per-cycle driver
+    rx_engine = SequenceEngine(dut.clk_i)
+    rx_tti_match = rx_engine.add(
+        rx_tti_seq, snapshot.dut, timeout_cycles, noexcept=False, trace=True
     )
-    rx_fsm_task = cocotb.start_soon(
-        rx_fsm_seq.match(dut, dut.clk_i, timeout_cycles, noexcept=False, trace=True)
+    rx_fsm_match = rx_engine.add(
+        rx_fsm_seq, snapshot.dut, timeout_cycles, noexcept=False, trace=True
     )
-
-    for task in (rx_tti_task, rx_fsm_task):
-        await task
-    assert rx_tti_task.result().matched
-    assert rx_fsm_task.result().matched
+    await rx_engine.run()
+    assert rx_tti_match.matched
+    assert rx_fsm_match.matched
 
     dut._log.info(f"{colorama.Fore.GREEN}<== Request received successfully{colorama.Fore.RESET}")
 
     # Emit and check response
-    tx_tti_task = cocotb.start_soon(
-        tx_tti_seq.match(dut, dut.clk_i, timeout_cycles, noexcept=False, trace=True)
+    tx_engine = SequenceEngine(dut.clk_i)
+    tx_tti_match = tx_engine.add(
+        tx_tti_seq, snapshot.dut, timeout_cycles, noexcept=False, trace=True
     )
-    tx_fsm_task = cocotb.start_soon(
-        tx_fsm_seq.match(dut, dut.clk_i, timeout_cycles, noexcept=False, trace=True)
+    tx_fsm_match = tx_engine.add(
+        tx_fsm_seq, snapshot.dut, timeout_cycles, noexcept=False, trace=True
     )
-
-    for task in (tx_tti_task, tx_fsm_task, i2c_transaction_task):
-        await task
+    await tx_engine.run()
+    await i2c_transaction_task
     assert bytes(i2c_transaction_task.result()) == response_data
-    assert tx_tti_task.result().matched
-    assert tx_fsm_task.result().matched
+    assert tx_tti_match.matched
+    assert tx_fsm_match.matched
+    dut._log.debug(f"TTI TX predicates matched at cycles {tx_tti_match.match_cycles}")
 
     dut._log.info(f"{colorama.Fore.GREEN}==> Response emitted suuccessfully{colorama.Fore.RESET}")
 
@@ -173,7 +179,7 @@ async def run_test(dut):
 
     # Start clock
     clock = Clock(dut.clk_i, 0.5 / 4, units="us")
-    cocotb.start_soon(clock.start())
+    background.start_soon(clock.start())
 
     # Reset
     await reset(dut)
@@ -4,6 +4,7 @@ from functools import partial
 
 from cocotbext.i2c import I2cMaster
 from i2c import reset_controller
+from tasks import background
 from utils import Sequence, SequenceFailed
 
 import cocotb
@@ -60,7 +61,7 @@ async def run_test(dut):
 
     # Start clock
     clock = Clock(dut.clk_i, 0.5, units="us")
-    cocotb.start_soon(clock.start())
+    background.start_soon(clock.start())
 
     # Reset
     await reset_controller(dut)
@@ -6,7 +6,11 @@
     This module is a wrapper for phy and io modules.
 */
 module i3c_phy_io_wrapper (
+`ifdef TB_HDL_CLOCK
+    output logic clk_i,
+`else
     input logic clk_i,
+`endif
     input logic rst_ni,
 
     // I3C controller IO
@@ -30,6 +34,13 @@ module i3c_phy_io_wrapper (
     logic sda_io2phy;
     logic sel_od_pp;
 
+    // Clock generated in HDL instead of cocotb, see common/clocking.py
+`ifdef TB_HDL_CLOCK
+    tb_clk_gen #(.ClkPeriodPs(10000)) xclk_gen (
+        .clk_o(clk_i)
+    );
+`endif
+
     i3c_phy xphy(
         .clk_i(clk_i),
         .rst_ni(rst_ni),
@@ -1,15 +1,16 @@
 # Copyright (c) 2024 Antmicro
 # SPDX-License-Identifier: Apache-2.0
 
+from clocking import start_clock
+
 import cocotb
-from cocotb.clock import Clock
 from cocotb.triggers import ClockCycles
 
 
 async def init_phy(dut):
     clock = dut.clk_i
     reset_n = dut.rst_ni
-    cocotb.start_soon(Clock(clock, 10, "ns").start())
+    await start_clock(clock, (10, "ns"))
 
     dut.sel_od_pp_i.value = 0
     dut.ctrl_scl_i.value = 0
@@ -2,8 +2,10 @@
 
 from random import randint
 
+import hci_queues_obs
 from bus2csr import bytes2int, get_frontend_bus_if
 from hci import ErrorStatus, HCIBaseTestInterface, ResponseDescriptor
+from observation import ObservationBus
 from utils import expect_with_timeout, mask_bits
 
 from cocotb.handle import SimHandleBase
@@ -12,7 +14,7 @@ from cocotb.triggers import RisingEdge
 
 class HCIQueuesTestInterface(HCIBaseTestInterface):
     def __init__(self, dut: SimHandleBase) -> None:
-        super().__init__(dut, "hci")
+        super().__init__(dut, "hci", ObservationBus(dut.obs_o, hci_queues_obs.FIELDS))
 
     async def setup(self):
         await super()._setup(get_frontend_bus_if())
@@ -0,0 +1,52 @@
+# SPDX-License-Identifier: Apache-2.0
+# Generated by tools/observation/obs_gen.py from hci_queues_obs.yaml, do not edit
+
+WIDTH = 44
+
+# Field name -> (offset, width)
+FIELDS = {
+    "hci_resp_queue_empty": (0, 1),
+    "hci_resp_queue_full": (1, 1),
+    "hci_resp_queue_ready_thld_trig": (2, 1),
+    "hci_resp_queue_wready": (3, 1),
+    "hci_cmd_queue_empty": (4, 1),
+    "hci_cmd_queue_full": (5, 1),
+    "hci_cmd_queue_ready_thld_trig": (6, 1),
+    "hci_cmd_queue_rvalid": (7, 1),
+    "hci_rx_queue_empty": (8, 1),
+    "hci_rx_queue_full": (9, 1),
+    "hci_rx_queue_start_thld_trig": (10, 1),
+    "hci_rx_queue_ready_thld_trig": (11, 1),
+    "hci_rx_queue_wready": (12, 1),
+    "hci_tx_queue_empty": (13, 1),
+    "hci_tx_queue_full": (14, 1),
+    "hci_tx_queue_start_thld_trig": (15, 1),
+    "hci_tx_queue_ready_thld_trig": (16, 1),
+    "hci_tx_queue_rvalid": (17, 1),
+    "hci_ibi_queue_empty": (18, 1),
+    "hci_ibi_queue_full": (19, 1),
+    "hci_ibi_queue_ready_thld_trig": (20, 1),
+    "hci_ibi_queue_wready": (21, 1),
+    "tti_rx_desc_queue_empty": (22, 1),
+    "tti_rx_desc_queue_full": (23, 1),
+    "tti_rx_desc_queue_ready_thld_trig": (24, 1),
+    "tti_rx_desc_queue_wready": (25, 1),
+    "tti_tx_desc_queue_empty": (26, 1),
+    "tti_tx_desc_queue_full": (27, 1),
+    "tti_tx_desc_queue_ready_thld_trig": (28, 1),
+    "tti_tx_desc_queue_rvalid": (29, 1),
+    "tti_rx_queue_empty": (30, 1),
+    "tti_rx_queue_full": (31, 1),
+    "tti_rx_queue_start_thld_trig": (32, 1),
+    "tti_rx_queue_ready_thld_trig": (33, 1),
+    "tti_rx_queue_wready": (34, 1),
+    "tti_tx_queue_empty": (35, 1),
+    "tti_tx_queue_full": (36, 1),
+    "tti_tx_queue_start_thld_trig": (37, 1),
+    "tti_tx_queue_ready_thld_trig": (38, 1),
+    "tti_tx_queue_rvalid": (39, 1),
+    "tti_ibi_queue_empty": (40, 1),
+    "tti_ibi_queue_full": (41, 1),
+    "tti_ibi_queue_ready_thld_trig": (42, 1),
+    "tti_ibi_queue_rvalid": (43, 1),
+}
@@ -2,8 +2,10 @@
 
 from random import randint
 
+import hci_queues_obs
 from bus2csr import bytes2int, dword2int, get_frontend_bus_if, int2dword
 from hci import HCIBaseTestInterface
+from observation import ObservationBus
 from utils import expect_with_timeout
 
 from cocotb.handle import SimHandleBase
@@ -13,7 +15,7 @@ from cocotb.triggers import RisingEdge
 # TODO: Merge `tti_queues.py` with `hci_queues.py` by creating a common class
 class TTIQueuesTestInterface(HCIBaseTestInterface):
     def __init__(self, dut: SimHandleBase) -> None:
-        super().__init__(dut, "tti")
+        super().__init__(dut, "tti", ObservationBus(dut.obs_o, hci_queues_obs.FIELDS))
 
     async def setup(self):
         await super()._setup(get_frontend_bus_if())
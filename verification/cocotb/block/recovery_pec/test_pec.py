@@ -4,6 +4,7 @@
 import random
 
 import crc
+from tasks import background
 
 import cocotb
 from cocotb.clock import Clock
@@ -34,7 +35,7 @@ async def run_test(dut):
 
     # Drive clock
     clock = Clock(dut.clk_i, 1, "ns")
-    await cocotb.start(clock.start())
+    await background.start(clock.start())
 
     # Deassert reset
     await ClockCycles(dut.clk_i, 5)
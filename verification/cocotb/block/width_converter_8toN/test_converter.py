@@ -3,6 +3,9 @@
 
 import random
 
+from cocotb_helpers import wait_cycles
+from tasks import background
+
 import cocotb
 from cocotb.clock import Clock
 from cocotb.triggers import ClockCycles, Join, RisingEdge, with_timeout
@@ -58,7 +61,7 @@ async def run_test(dut):
 
     # Drive clock
     clock = Clock(dut.clk_i, 1, "ns")
-    await cocotb.start(clock.start())
+    await background.start(clock.start())
 
     # Reset
     dut.rst_ni.value = 0
@@ -71,10 +74,10 @@ async def run_test(dut):
 
     # Feed data to the module, collect output
     t1 = await cocotb.start(data_feeder(dut, inp_bytes))
-    await cocotb.start(data_receiver(dut, out_words))
+    await background.start(data_receiver(dut, out_words))
 
     await with_timeout(Join(t1), 1, "us")
-    await ClockCycles(dut.clk_i, 100)  # Ensure that all output is collected
+    await wait_cycles(dut.clk_i, 100)  # Ensure that all output is collected
 
     # Convert input to words
     inp_words = []
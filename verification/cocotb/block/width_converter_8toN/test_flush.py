@@ -3,6 +3,8 @@
 
 import random
 
+from tasks import background
+
 import cocotb
 from cocotb.clock import Clock
 from cocotb.triggers import ClockCycles, RisingEdge, with_timeout
@@ -59,7 +61,7 @@ async def run_test(dut):
 
     # Drive clock
     clock = Clock(dut.clk_i, 1, "ns")
-    await cocotb.start(clock.start())
+    await background.start(clock.start())
 
     # Make output always ready
     dut.source_ready_i.value = 1
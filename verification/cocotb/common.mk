@@ -11,8 +11,13 @@ CFGDIR :=
 CONFIG :=
 $(info From common.mk, CURDIR is $(CURDIR))
 
-# Set pythonpath so that tests can access common modules
-export PYTHONPATH := $(PYTHONPATH):$(CURDIR)/common
+# Set pythonpath so that tests can access common modules and timing settings (tools/timing)
+export PYTHONPATH := $(PYTHONPATH):$(CURDIR)/common:$(I3C_ROOT)/tools/timing
+
+# Testbench plugins, see common/regression_hooks.py
+# Imported by cocotb before the test modules, each of them is configured in its docstring
+export TB_PLUGINS := profiler,telemetry,debug_log,tasks
+override MODULE := $(TB_PLUGINS),$(MODULE)
 
 # Common sources
 COMMON_SOURCES  = \
@@ -22,12 +27,24 @@ COMMON_SOURCES  = \
     $(CALIPTRA_ROOT)/src/caliptra_prim/rtl/caliptra_prim_flop.sv \
     $(CALIPTRA_ROOT)/src/caliptra_prim/rtl/caliptra_prim_flop_2sync.sv
 
-VERILOG_INCLUDE_DIRS= \
+VERILOG_INCLUDE_DIRS += \
     $(CALIPTRA_ROOT)/src/libs/rtl \
     $(CALIPTRA_ROOT)/src/caliptra_prim/rtl \
     $(I3C_ROOT)/src \
     $(I3C_ROOT)/src/libs/axi
 
+# Clocks generated by the test wrappers instead of cocotb, see common/clocking.py
+# The period (in ps) defaults to the one used by the tests
+HDL_CLOCK ?=
+ifeq ($(HDL_CLOCK), 1)
+    COMMON_SOURCES += $(CURDIR)/common/tb_clk_gen.sv
+    COMPILE_ARGS += -DTB_HDL_CLOCK
+    PLUSARGS += +tb_hdl_clock
+    ifneq ($(HDL_CLOCK_PERIOD_PS),)
+        PLUSARGS += +tb_clk_period_ps=$(HDL_CLOCK_PERIOD_PS)
+    endif
+endif
+
 $(info VERILOG_SOURCES = $(VERILOG_SOURCES))
 VERILOG_SOURCES := $(COMMON_SOURCES) $(VERILOG_SOURCES)
 $(info VERILOG_SOURCES = $(VERILOG_SOURCES))
@@ -54,14 +71,24 @@ ifeq ($(SIM), verilator)
     EXTRA_ARGS += --trace --trace-structs
     EXTRA_ARGS += $(VERILATOR_COVERAGE)
     EXTRA_ARGS += -Wno-DECLFILENAME -Wno-TIMESCALEMOD
+
+    # Execution profiling of the model, see tools/verilator_profile
+    ifeq ($(VERILATOR_PROFILE), 1)
+        COMPILE_ARGS += --prof-exec --prof-cfuncs -CFLAGS -pg -LDFLAGS -pg
+        PLUSARGS += +verilator+prof+exec+file+profile_exec.dat
+    endif
 endif
 
 COCOTB_HDL_TIMEUNIT         = 1ns
 COCOTB_HDL_TIMEPRECISION    = 10ps
 
-# Build directory
-ifneq ($(COVERAGE_TYPE),)
-    SIM_BUILD := sim-build-$(COVERAGE_TYPE)
+# Build directory, named after all enabled options which change the model, so that the model
+# is rebuilt when they change
+SIM_BUILD_SUFFIX := $(if $(COVERAGE_TYPE),-$(COVERAGE_TYPE))
+SIM_BUILD_SUFFIX := $(SIM_BUILD_SUFFIX)$(if $(filter 1,$(VERILATOR_PROFILE)),-profile)
+SIM_BUILD_SUFFIX := $(SIM_BUILD_SUFFIX)$(if $(filter 1,$(HDL_CLOCK)),-hdl-clock)
+ifneq ($(SIM_BUILD_SUFFIX),)
+    SIM_BUILD := sim-build$(SIM_BUILD_SUFFIX)
 endif
 
 include $(shell cocotb-config --makefiles)/Makefile.sim
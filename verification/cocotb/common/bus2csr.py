@@ -5,6 +5,8 @@ from importlib import import_module
 from math import log2
 from typing import List, Tuple
 
+from clocking import start_clock, wait_reset_release
+
 # AHB
 from cocotb_AHB.AHB_common.InterconnectInterface import InterconnectWrapper
 from cocotb_AHB.drivers.DutSubordinate import DUTSubordinate
@@ -14,10 +16,10 @@ from cocotb_AHB.interconnect.SimInterconnect import SimInterconnect
 # AXI
 from cocotbext.axi import AxiBus, AxiMaster
 from reg_map import reg_map
+from tasks import background
 
 # Cocotb
 import cocotb
-from cocotb.clock import Clock
 from cocotb.handle import SimHandleBase
 from cocotb.triggers import ClockCycles, RisingEdge, Timer, with_timeout
 
@@ -27,7 +29,7 @@ async def setup_dut(clk, rst_n, clk_period: Tuple[int, str]) -> None:
     """
     Setup clock & reset the unit
     """
-    await cocotb.start(Clock(clk, *clk_period).start())
+    await start_clock(clk, clk_period)
     rst_n.value = 0
     await ClockCycles(clk, 10)
     await RisingEdge(clk)
@@ -74,7 +76,7 @@ class FrontBusTestInterface:
         self.reg_map = reg_map
 
     async def register_test_interfaces(self):
-        await cocotb.start(setup_dut(self.clk, self.rst_n, (2, "ns")))
+        await background.start(setup_dut(self.clk, self.rst_n, (2, "ns")))
 
     async def read_csr(
         self, addr: int, size: int = 4, timeout: int = 1, units: str = "us"
@@ -126,8 +128,8 @@ class AHBTestInterface(FrontBusTestInterface):
         )
         self.wrapper.register_interconnect(self.interconnect)
 
-        await cocotb.start(self.AHBManager.start())
-        await cocotb.start(self.wrapper.start())
+        await background.start(self.AHBManager.start())
+        await background.start(self.wrapper.start())
 
         await super().register_test_interfaces()
 
@@ -166,10 +168,10 @@ class AXITestInterface(FrontBusTestInterface):
 
     async def register_test_interfaces(self):
         await super().register_test_interfaces()
-        # TODO: Investigate if there's a neater solution
-        # wait before issuing any transactions:
-        # workaround for cocotbext-axi issuing transactions during reset
-        await ClockCycles(self.clk, 10)
+        # cocotbext-axi drops transactions issued while it is in reset, it leaves the reset
+        # state on the release of rst_n, the transactions start at the following edge
+        await wait_reset_release(self.rst_n)
+        await RisingEdge(self.clk)
 
     async def read_csr(
         self, addr: int, size: int = 4, timeout: int = 1, units: str = "us"
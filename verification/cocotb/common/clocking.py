@@ -0,0 +1,54 @@
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Clocks and resets of the tested designs
+
+By default clocks are driven by cocotb. Models built with HDL_CLOCK=1 generate the clock of
+the test wrappers in HDL instead (common/tb_clk_gen.sv), so that clock edges no Python code
+waits for do not go through the cocotb scheduler. The clock port is then an output, which
+the helpers below only wait on. Resets are driven by the tests in both modes, so that every
+test starts from a reset design.
+"""
+
+from typing import Tuple
+
+from tasks import background
+
+import cocotb
+from cocotb.clock import Clock
+from cocotb.handle import SimHandleBase
+from cocotb.triggers import RisingEdge
+
+
+def hdl_clock() -> bool:
+    """
+    Check if clocks and resets are generated by the test wrapper
+    """
+    return "tb_hdl_clock" in cocotb.plusargs
+
+
+async def start_clock(clk: SimHandleBase, clk_period: Tuple[int, str]) -> None:
+    """
+    Start driving `clk`, unless the test wrapper generates it
+    """
+    if hdl_clock():
+        return
+    await background.start(Clock(clk, *clk_period).start())
+
+
+async def wait_reset_release(rst_n: SimHandleBase) -> None:
+    """
+    Wait until the active low reset is released
+    """
+    if rst_n.value == 0:
+        await RisingEdge(rst_n)
+
+
+def clock_frequency(clk_period_ps: int) -> float:
+    """
+    Frequency (Hz) of the clock started with `clk_period_ps`, or of the clock generated by the
+    test wrapper, whose period may be overridden with the +tb_clk_period_ps plusarg
+    """
+    if hdl_clock():
+        clk_period_ps = int(cocotb.plusargs.get("tb_clk_period_ps", clk_period_ps))
+    return 1e12 / clk_period_ps
@@ -0,0 +1,117 @@
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Logging for hot paths of the testbench helpers
+
+Helpers invoked every clock cycle should log through a cached logger with %-style arguments,
+so that nothing is formatted unless the record is emitted:
+
+    log = get_logger(dut)
+    log.debug("[FIFO `%s`] popping word %#x", name, data)
+
+When enabled, the testbench plugin keeps the last debug records of these loggers in memory
+for each test, while the console still shows only records at the level of the cocotb logger.
+Records are formatted and written to debug_<test>.log only if the test fails. Other loggers,
+such as the ones of the bus models, and the global log level are left alone.
+    COCOTB_TB_DEBUG_LOG=1           - enables the buffer
+    COCOTB_TB_DEBUG_LOG_RECORDS=N   - number of records kept, 10000 by default
+"""
+
+import logging
+import os
+from collections import deque
+from functools import lru_cache
+from typing import Any, Optional
+
+from regression_hooks import on_test_end, on_test_start, test_name
+
+from cocotb.log import SimLogFormatter, SimTimeContextFilter
+
+DEFAULT_RECORDS = 10000
+
+
+@lru_cache(maxsize=None)
+def _get_logger(name: str) -> logging.Logger:
+    log = logging.getLogger(f"cocotb.{name}")
+    if _buffer is not None:
+        # Debug records go only to the buffer, the others are passed on to the parent loggers
+        # at their current level
+        log.setLevel(logging.DEBUG)
+        log.propagate = False
+        log.addHandler(_buffer)
+        log.addHandler(_forward)
+    return log
+
+
+def get_logger(scope: Any) -> logging.Logger:
+    """
+    Logger of a DUT handle (named after its path) or of a name
+    """
+    return _get_logger(getattr(scope, "_path", scope))
+
+
+class RingBufferHandler(logging.Handler):
+    """
+    Keeps the last `capacity` records unformatted
+    """
+
+    def __init__(self, capacity: int) -> None:
+        super().__init__(logging.DEBUG)
+        self.records = deque(maxlen=capacity)
+        self.dropped = 0
+
+    def emit(self, record: logging.LogRecord) -> None:
+        if len(self.records) == self.records.maxlen:
+            self.dropped += 1
+        self.records.append(record)
+
+    def clear(self) -> None:
+        self.records.clear()
+        self.dropped = 0
+
+    def write(self, filename: str) -> None:
+        with open(filename, "w") as f:
+            if self.dropped:
+                f.write(f"... {self.dropped} earlier record(s) dropped\n")
+            for record in self.records:
+                f.write(self.format(record) + "\n")
+
+
+class ForwardHandler(logging.Handler):
+    """
+    Passes records on to the parent of their logger if it is enabled for their level
+    """
+
+    def emit(self, record: logging.LogRecord) -> None:
+        parent = logging.getLogger(record.name).parent
+        if parent.isEnabledFor(record.levelno):
+            parent.handle(record)
+
+
+_buffer: Optional[RingBufferHandler] = None
+_forward = ForwardHandler()
+
+
+def _clear_buffer(test: Any) -> None:
+    _buffer.clear()
+
+
+def _flush_buffer(test: Any, passed: Optional[bool], testcase: Any) -> None:
+    if passed is False:
+        _buffer.write(f"debug_{test_name(test)}.log")
+    _buffer.clear()
+
+
+def _install() -> None:
+    global _buffer
+    _buffer = RingBufferHandler(int(os.getenv("COCOTB_TB_DEBUG_LOG_RECORDS", DEFAULT_RECORDS)))
+    # Sim time is captured when the record is created, formatting happens on failure
+    _buffer.addFilter(SimTimeContextFilter())
+    _buffer.setFormatter(SimLogFormatter())
+
+    on_test_start(_clear_buffer)
+    on_test_end(_flush_buffer)
+
+
+if os.getenv("COCOTB_TB_DEBUG_LOG"):
+    _install()
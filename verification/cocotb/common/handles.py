@@ -0,0 +1,57 @@
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Signal handles resolved once
+
+Every `getattr` on a simulator handle walks the GPI hierarchy, which adds up when the same
+signals are sampled on every cycle or reached through long hierarchical paths. Test
+interfaces resolve the handles they need when they are created instead, so missing signals
+are reported at startup and each access is a plain attribute lookup.
+"""
+
+from typing import Dict, Optional
+
+from cocotb.handle import SimHandleBase
+
+
+def resolve(root: SimHandleBase, path: str) -> SimHandleBase:
+    """
+    Handle of the signal or scope at the dot-separated `path` below `root`
+    """
+    handle = root
+    for part in path.split("."):
+        try:
+            handle = getattr(handle, part)
+        except AttributeError:
+            raise AttributeError(f"{root._path} has no {path} ({part} not found)") from None
+    return handle
+
+
+def resolve_optional(root: SimHandleBase, path: str) -> Optional[SimHandleBase]:
+    try:
+        return resolve(root, path)
+    except AttributeError:
+        return None
+
+
+class SignalAliases:
+    """
+    Symbolic names of signals deep in the design, e.g. `signals.bus_stop`
+    """
+
+    def __init__(self, root: SimHandleBase, aliases: Dict[str, str]) -> None:
+        self.paths = dict(aliases)
+        for name, path in aliases.items():
+            setattr(self, name, resolve(root, path))
+
+
+class QueueHandles:
+    """
+    Status signals of a queue, None for the ones the queue does not have
+    """
+
+    __slots__ = ("empty", "full", "start_thld", "ready_thld", "start_thld_trig", "ready_thld_trig")
+
+    def __init__(self, root: SimHandleBase, prefix: str) -> None:
+        for kind in self.__slots__:
+            setattr(self, kind, resolve_optional(root, f"{prefix}_{kind}_o"))
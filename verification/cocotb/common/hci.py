@@ -1,16 +1,19 @@
 # SPDX-License-Identifier: Apache-2.0
 
+import logging
 from dataclasses import dataclass
 from enum import IntEnum
 from functools import reduce
 from random import randint
-from typing import Any, Callable, Iterable
+from typing import Any, Callable, Iterable, Optional
 
 from bus2csr import FrontBusTestInterface, dword2int, int2dword
+from debug_log import get_logger
+from handles import QueueHandles
+from observation import ObservationBus
 from reg_map import reg_map
 from utils import SequenceFailed
 
-import cocotb
 from cocotb.handle import SimHandleBase
 from cocotb.triggers import ClockCycles, RisingEdge, Timer
 
@@ -179,12 +182,29 @@ class ResponseDescriptor:
 class HCIBaseTestInterface:
     supported_queues = ["cmd", "tx", "tx_desc", "resp", "rx", "rx_desc", "ibi"]
 
-    def __init__(self, dut: SimHandleBase, if_name: str) -> None:
+    def __init__(
+        self, dut: SimHandleBase, if_name: str, obs: Optional[ObservationBus] = None
+    ) -> None:
         assert if_name in ["hci", "tti"]
         self.dut = dut
         self.if_name = if_name
         self.log = dut._log
         self.reg_map = reg_map
+        # Status signals of the queues, sampled on every cycle by some tests
+        self.queues = {
+            queue: QueueHandles(dut, f"{if_name}_{queue}_queue") for queue in self.supported_queues
+        }
+        # Observation port of the test wrapper, flags packed into it are read from there
+        self.obs = obs
+        # (queue, kind) -> field of the observation port or handle of the status signal
+        self._status = {}
+        for queue, handles in self.queues.items():
+            for kind in QueueHandles.__slots__:
+                name = f"{if_name}_{queue}_queue_{kind}"
+                if obs is not None and name in obs:
+                    self._status[(queue, kind)] = getattr(obs, name)
+                elif getattr(handles, kind) is not None:
+                    self._status[(queue, kind)] = getattr(handles, kind)
 
         # Uncomment to enable debug logging
         # self.log.setLevel("DEBUG")
@@ -208,20 +228,36 @@ class HCIBaseTestInterface:
         self.rst_n.value = 1
         await RisingEdge(self.clk)
 
+    def queue_signal(self, queue: str, kind: str) -> SimHandleBase:
+        signal = getattr(self.queues[queue], kind)
+        if signal is None:
+            raise AttributeError(f"{self.if_name} {queue} queue has no {kind} signal")
+        return signal
+
+    def queue_status(self, queue: str, kind: str) -> int:
+        """
+        Value of a status signal of the queue, all signals packed into the observation port
+        are fetched with a single read per cycle
+        """
+        signal = self._status.get((queue, kind))
+        if signal is None:
+            signal = self.queue_signal(queue, kind)
+        return signal.value
+
     def get_empty(self, queue: str):
-        return getattr(self.dut, f"{self.if_name}_{queue}_queue_empty_o").value
+        return self.queue_status(queue, "empty")
 
     def get_full(self, queue: str):
-        return getattr(self.dut, f"{self.if_name}_{queue}_queue_full_o").value
+        return self.queue_status(queue, "full")
 
     def get_thld(self, queue: str, type: str):
         assert type in ["start", "ready"]
-        return getattr(self.dut, f"{self.if_name}_{queue}_queue_{type}_thld_o").value
+        return self.queue_signal(queue, f"{type}_thld").value
 
     def get_thld_status(self, queue: str, type: str):
         assert type in ["start", "ready"]
         assert queue in self.supported_queues
-        return getattr(self.dut, f"{self.if_name}_{queue}_queue_{type}_thld_trig_o").value
+        return self.queue_status(queue, f"{type}_thld_trig")
 
     # Helper functions to fetch / put data to either side
     # of the queues
@@ -291,8 +327,9 @@ class TxFifo:
 
     def _pop(self, dut: Any):
         data = self.queue[0]
-        log = cocotb.logging.getLogger(f"cocotb.{dut._path}")
-        log.info(f"[FIFO `{self.name}`] popping word {hex(data)} ('{chr(data & 0xff)}')")
+        log = get_logger(dut)
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("[FIFO `%s`] popping word %#x ('%s')", self.name, data, chr(data & 0xFF))
         self.queue.pop(0)
 
     def MatchPop(self, dut: Any) -> bool:
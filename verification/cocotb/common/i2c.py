@@ -2,12 +2,31 @@
 
 from typing import Any
 
+from cocotb_helpers import wait_for_change
+from specification import IXCModes
+from timing_settings import TimingSettings, settings_for, spec_timing_enabled
 from utils import SequenceFailed
 
 from cocotb.triggers import ClockCycles, FallingEdge, RisingEdge, with_timeout
 
 I3C_PHY_DELAY = 2
 
+# Timing port values used unless COCOTB_TB_SPEC_TIMING is set
+# TODO: Drop them for `settings_for` once the block suites pass with COCOTB_TB_SPEC_TIMING=1,
+#       see docs/source/timings.md
+DEFAULT_TIMINGS = TimingSettings(
+    t_r=1,
+    t_f=1,
+    t_high=10,
+    t_low=10,
+    t_su_dat=1,
+    t_hd_dat=1,
+    t_su_sta=1,
+    t_hd_sta=1,
+    t_su_sto=1,
+    t_buf=1,
+)
+
 
 async def i2c_cmd(
     dut,
@@ -26,9 +45,9 @@ async def i2c_cmd(
 
     async def issue_command():
         resp_ack = True
+        watched = (dut.rx_fifo_wvalid_o, dut.event_nak_o, dut.fmt_fifo_rready_o)
+        await RisingEdge(dut.clk_i)
         while True:
-            await RisingEdge(dut.clk_i)
-
             if dut.rx_fifo_wvalid_o.value:
                 resp_dat.append(int(dut.rx_fifo_wdata_o.value))
 
@@ -38,6 +57,12 @@ async def i2c_cmd(
             if dut.fmt_fifo_rready_o.value:
                 dut.fmt_fifo_rvalid_i.value = 0
                 break
+
+            # Sample every cycle while the FSM signals something, otherwise sleep until it does
+            if any(signal.value for signal in watched):
+                await RisingEdge(dut.clk_i)
+            else:
+                await wait_for_change(dut.clk_i, *watched)
         return resp_ack
 
     await RisingEdge(dut.clk_i)
@@ -114,24 +139,28 @@ async def reset_controller(dut):
     await ClockCycles(dut.clk_i, 2)
 
 
-def init_i2c_controller_ports(dut):
+def init_i2c_controller_ports(dut, sys_clk_hz, mode=IXCModes.LEGACY_400k):
     # Drive constant DUT inputs
     dut.host_enable_i.value = 1
 
-    # TODO: Calculate timing values compatible with specification:
-    #       https://opentitan.org/book/hw/ip/i2c/doc/programmers_guide.html
-    dut.thigh_i.value = 10
-    dut.tlow_i.value = 10
-    dut.t_r_i.value = 1
-    dut.t_f_i.value = 1
-
-    dut.tsu_sta_i.value = 1
-    dut.thd_sta_i.value = 1
-    dut.tsu_sto_i.value = 1
-    dut.tsu_dat_i.value = 1
-    dut.thd_dat_i.value = 1
-
-    dut.t_buf_i.value = 1
+    # With COCOTB_TB_SPEC_TIMING, the fastest bus timing compatible with the specification,
+    # see tools/timing/optimizer.py
+    if spec_timing_enabled():
+        timings = settings_for(mode, sys_clk_hz)
+    else:
+        timings = DEFAULT_TIMINGS
+    dut.thigh_i.value = timings.t_high
+    dut.tlow_i.value = timings.t_low
+    dut.t_r_i.value = timings.t_r
+    dut.t_f_i.value = timings.t_f
+
+    dut.tsu_sta_i.value = timings.t_su_sta
+    dut.thd_sta_i.value = timings.t_hd_sta
+    dut.tsu_sto_i.value = timings.t_su_sto
+    dut.tsu_dat_i.value = timings.t_su_dat
+    dut.thd_dat_i.value = timings.t_hd_dat
+
+    dut.t_buf_i.value = timings.t_buf
 
     dut.stretch_timeout_i.value = 0
     dut.timeout_enable_i.value = 0
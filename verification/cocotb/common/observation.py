@@ -0,0 +1,94 @@
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Status signals sampled through the packed observation port of a test wrapper
+
+The wrapper concatenates the signals a testbench checks on every cycle into `obs_o`, see
+tools/observation/obs_gen.py. The port is read once per callback from the simulator and its
+fields are exposed like signal handles, so checkers written for the DUT hierarchy work unchanged:
+
+    obs = ObservationBus(dut.obs_o, i3c_top_obs.FIELDS)
+    await Sequence(partial(MatchTTIDataExact, 0xAB, mask=0xFF)).match(obs, tb.clk, 1000)
+
+Fields are read-only, inputs of the DUT are still driven through their handles.
+"""
+
+from typing import Any, Dict, Tuple
+
+from regression_hooks import callback_count
+
+from cocotb.handle import SimHandleBase
+
+
+class ObservedSignal:
+    """
+    Stand-in for the handle of a signal packed into the observation port
+    """
+
+    def __init__(self, bus: "ObservationBus", name: str, offset: int, width: int):
+        self._bus = bus
+        self._name = name
+        self._offset = offset
+        self._mask = (1 << width) - 1
+        self._width = width
+
+    @property
+    def value(self) -> int:
+        return (self._bus.raw() >> self._offset) & self._mask
+
+    def __len__(self) -> int:
+        return self._width
+
+    def __repr__(self) -> str:
+        return f"ObservedSignal({self._name})"
+
+
+class ObservationBus:
+    """
+    Decoder of the observation port, e.g. `obs.tti_rx_queue_wvalid.value`
+    """
+
+    def __init__(self, handle: SimHandleBase, fields: Dict[str, Tuple[int, int]]):
+        assert len(handle) == sum(width for _, width in fields.values()), (
+            f"{handle._path} does not match the observation bus description, "
+            "regenerate it with tools/observation/obs_gen.py"
+        )
+        self.handle = handle
+        self.fields = fields
+        self._log = handle._log
+        self._signals = {
+            name: ObservedSignal(self, name, offset, width)
+            for name, (offset, width) in fields.items()
+        }
+        self._raw = 0
+        self._callback = None
+
+    def raw(self, refresh: bool = False) -> int:
+        """
+        Value of the whole port, read from the simulator once per callback from the simulator
+        (or on `refresh`), so reads after different triggers of a time step see its updates
+        """
+        callback = callback_count()
+        if refresh or callback != self._callback:
+            self._raw = self.handle.value.integer
+            self._callback = callback
+        return self._raw
+
+    def sample(self) -> Dict[str, int]:
+        """
+        Values of all fields in the current callback from the simulator
+        """
+        raw = self.raw()
+        return {
+            name: (raw >> offset) & ((1 << width) - 1)
+            for name, (offset, width) in self.fields.items()
+        }
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._signals
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            return self.__dict__["_signals"][name]
+        except KeyError:
+            raise AttributeError(f"Observation bus has no field {name}") from None
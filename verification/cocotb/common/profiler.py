@@ -0,0 +1,152 @@
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Per-coroutine profiler of the cocotb scheduler
+
+Enabled with COCOTB_TB_PROFILE=1 environment variable or +tb_profile plusarg. For every
+coroutine and trigger type it records the number of wake-ups, Python time spent until the
+coroutine yields again and the simulated time span between its first and last wake-up.
+After each test it writes into the simulation directory:
+    profile_<test>.txt    - report sorted by Python time
+    profile_<test>.folded - folded stacks, input for flamegraph.pl or speedscope
+
+Set COCOTB_TB_PROFILE_TRACEMALLOC=1 to append the top memory allocations of each test to
+the report.
+"""
+
+import os
+import time
+import tracemalloc
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from regression_hooks import on_test_end, on_test_start, test_name
+
+import cocotb
+from cocotb.scheduler import Scheduler
+from cocotb.utils import get_sim_time
+
+TRACEMALLOC_TOP = 20
+
+
+@dataclass
+class CoroutineStats:
+    wakeups: int = 0
+    python_time: float = 0.0
+
+
+class Profile:
+    def __init__(self) -> None:
+        # (coroutine, trigger type) -> CoroutineStats
+        self.stats = defaultdict(CoroutineStats)
+        # Folded stack -> Python time
+        self.stacks = defaultdict(float)
+        # Task -> sim time of its first and last wake-up
+        self.spans = {}
+        self.snapshot = None
+
+    def record(self, task: Any, trigger: str, stack: list[str], elapsed: float) -> None:
+        stats = self.stats[(coroutine_name(task), trigger)]
+        stats.wakeups += 1
+        stats.python_time += elapsed
+        self.stacks[";".join(stack + [trigger])] += elapsed
+
+        now = get_sim_time("ns")
+        first, _ = self.spans.get(task, (now, now))
+        self.spans[task] = (first, now)
+
+    def write(self, name: str) -> None:
+        # Sim time spans are accumulated per coroutine over all of its tasks
+        sim_time = defaultdict(float)
+        for task, (first, last) in self.spans.items():
+            sim_time[coroutine_name(task)] += last - first
+
+        rows = sorted(self.stats.items(), key=lambda item: -item[1].python_time)
+        total = sum(s.python_time for s in self.stats.values())
+        with open(f"profile_{name}.txt", "w") as f:
+            f.write(f"Test: {name}\n")
+            f.write(f"Python time in coroutines: {total:.3f} s\n\n")
+            f.write(
+                f"{'python [s]':>12} {'%':>6} {'wake-ups':>10} {'us/wake-up':>11} "
+                f"{'sim span [ns]':>14}  coroutine (trigger)\n"
+            )
+            for (coro, trigger), s in rows:
+                share = 100 * s.python_time / total if total else 0
+                per_wakeup = 1e6 * s.python_time / s.wakeups
+                f.write(
+                    f"{s.python_time:12.4f} {share:6.2f} {s.wakeups:10d} {per_wakeup:11.2f} "
+                    f"{sim_time[coro]:14.0f}  {coro} ({trigger})\n"
+                )
+            if self.snapshot is not None:
+                f.write(f"\nTop {TRACEMALLOC_TOP} allocations:\n")
+                diff = tracemalloc.take_snapshot().compare_to(self.snapshot, "lineno")
+                for stat in diff[:TRACEMALLOC_TOP]:
+                    f.write(f"{stat}\n")
+
+        with open(f"profile_{name}.folded", "w") as f:
+            for stack, elapsed in sorted(self.stacks.items()):
+                # Sample values are integers, use microseconds
+                f.write(f"{stack} {max(1, round(elapsed * 1e6))}\n")
+
+
+def coroutine_name(task: Any) -> str:
+    coro = getattr(task, "_coro", task)
+    return getattr(coro, "__qualname__", type(coro).__name__)
+
+
+def await_stack(task: Any) -> list[str]:
+    """
+    Names of coroutines the task is suspended in, from the outermost one
+    """
+    stack = []
+    coro = getattr(task, "_coro", None)
+    while coro is not None and hasattr(coro, "cr_await"):
+        stack.append(coro.__qualname__)
+        coro = coro.cr_await
+    return stack
+
+
+def enabled() -> bool:
+    return bool(os.getenv("COCOTB_TB_PROFILE")) or "tb_profile" in cocotb.plusargs
+
+
+_profile: Optional[Profile] = None
+_schedule = Scheduler._schedule
+
+
+def _schedule_profiled(self, coroutine, trigger=None):
+    if _profile is None:
+        return _schedule(self, coroutine, trigger)
+
+    stack = await_stack(coroutine)
+    start = time.perf_counter()
+    try:
+        return _schedule(self, coroutine, trigger)
+    finally:
+        elapsed = time.perf_counter() - start
+        trigger_name = type(trigger).__name__ if trigger is not None else "start"
+        _profile.record(coroutine, trigger_name, stack, elapsed)
+
+
+def _start_profile(test: Any) -> None:
+    global _profile
+    _profile = Profile()
+    if os.getenv("COCOTB_TB_PROFILE_TRACEMALLOC"):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+        _profile.snapshot = tracemalloc.take_snapshot()
+
+
+def _write_profile(test: Any, passed: Optional[bool], testcase: Any) -> None:
+    global _profile
+    if _profile is None:
+        return
+    _profile.write(test_name(test))
+    _profile = None
+
+
+if enabled():
+    Scheduler._schedule = _schedule_profiled
+    on_test_start(_start_profile)
+    on_test_end(_write_profile)
@@ -0,0 +1,113 @@
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Callbacks invoked by the cocotb regression manager around each test, and by the scheduler
+around each callback from the simulator
+
+Testbench plugins (listed in TB_PLUGINS in common.mk) are imported by cocotb together with
+the test modules, before the first test starts, and register their callbacks here.
+"""
+
+from typing import Any, Callable, Optional
+from xml.etree.ElementTree import Element
+
+from cocotb.regression import RegressionManager
+from cocotb.scheduler import Scheduler
+
+# Called with the test object, right before the test starts
+_test_start_hooks: list[Callable[[Any], None]] = []
+# Called with the test object, result (None if skipped) and its <testcase> element in the
+# results XML, before the XML is written
+_test_end_hooks: list[Callable[[Any, Optional[bool], Element], None]] = []
+# Called with the trigger which fired, before and after the scheduler reacts to it
+_callback_start_hooks: list[Callable[[Any], None]] = []
+_callback_end_hooks: list[Callable[[Any], None]] = []
+# Number of callbacks the scheduler reacted to so far
+_callbacks = 0
+
+
+def on_test_start(hook: Callable[[Any], None]) -> Callable[[Any], None]:
+    _test_start_hooks.append(hook)
+    return hook
+
+
+def on_test_end(
+    hook: Callable[[Any, Optional[bool], Element], None]
+) -> Callable[[Any, Optional[bool], Element], None]:
+    _test_end_hooks.append(hook)
+    return hook
+
+
+def on_callback_start(hook: Callable[[Any], None]) -> Callable[[Any], None]:
+    _callback_start_hooks.append(hook)
+    return hook
+
+
+def on_callback_end(hook: Callable[[Any], None]) -> Callable[[Any], None]:
+    _callback_end_hooks.append(hook)
+    return hook
+
+
+def callback_count() -> int:
+    """
+    Number of callbacks the scheduler reacted to. Signals keep their values while the
+    testbench reacts to one (writes are applied afterwards), they may change between two
+    callbacks of the same time step, e.g. RisingEdge before and ReadOnly after the evaluation
+    of the model.
+    """
+    return _callbacks
+
+
+def test_name(test: Any) -> str:
+    return test.__qualname__
+
+
+_start_test = RegressionManager._start_test
+_record_result = RegressionManager._record_result
+_react = Scheduler._react
+
+
+def _start_test_with_hooks(self) -> None:
+    for hook in _test_start_hooks:
+        hook(self._test)
+    _start_test(self)
+
+
+def _record_result_with_hooks(self, test, outcome, wall_time_s, sim_time_ns) -> None:
+    failures = self.failures
+    # Simulator failure makes the manager write the results and stop the simulator, postpone
+    # it until hooks have a chance to annotate the results
+    tear_down_requested = []
+    self._tear_down = lambda: tear_down_requested.append(True)
+    try:
+        _record_result(self, test, outcome, wall_time_s, sim_time_ns)
+    finally:
+        del self._tear_down
+
+    passed = None if outcome is None else self.failures == failures
+    for hook in _test_end_hooks:
+        hook(test, passed, self.xunit.last_testcase)
+
+    if tear_down_requested:
+        self._tear_down()
+
+
+def _react_with_hooks(self, trigger) -> None:
+    # Nested calls only queue the trigger within the current callback
+    if self._is_reacting:
+        return _react(self, trigger)
+
+    global _callbacks
+    _callbacks += 1
+    for hook in _callback_start_hooks:
+        hook(trigger)
+    try:
+        return _react(self, trigger)
+    finally:
+        for hook in _callback_end_hooks:
+            hook(trigger)
+
+
+RegressionManager._start_test = _start_test_with_hooks
+RegressionManager._record_result = _record_result_with_hooks
+Scheduler._react = _react_with_hooks
@@ -0,0 +1,227 @@
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Replay of recorded waveforms through Python checkers
+
+Signal values are sampled once per rising edge of the clock and exposed through a fake
+`dut` handle, so `Sequence` predicates (and other code reading `dut.<path>.value`) can be
+evaluated without running the simulator:
+
+    store = WaveformStore.from_vcd("dump_test_read.vcd", clock="clk_i")
+    dut = ReplayDut(store)
+    fifo = TxFifo(dut.clk_i, dut.data_i, dut.valid_i, dut.ready_o, [0xAB])
+    match_ = replay(Sequence(fifo.MatchPop), dut, cycle_cnt=1000)
+
+Values written to signals are ignored, the waveform already contains what was driven.
+The VCD reader is shared with the bus timing checker, so both `verification/cocotb/common`
+and `tools/timing` have to be on PYTHONPATH, as set by common.mk for the testbenches.
+"""
+
+import logging
+from typing import Any, Iterable, Optional
+
+import numpy as np
+from utils import Sequence, SequenceMatch, SequenceMatcher
+from waveform import UNKNOWN, VcdReader, decode_value
+
+
+class ReplayValue(int):
+    """
+    Recorded signal value, mimics the parts of `cocotb.binary.BinaryValue` used by checkers
+    """
+
+    def __new__(cls, value: int, n_bits: int):
+        resolvable = value != UNKNOWN
+        obj = super().__new__(cls, value if resolvable else 0)
+        obj.n_bits = n_bits
+        obj.is_resolvable = resolvable
+        return obj
+
+    @property
+    def integer(self) -> int:
+        return int(self)
+
+    def __len__(self) -> int:
+        return self.n_bits
+
+
+class WaveformStore:
+    """
+    Values of signals sampled at consecutive rising edges of a clock
+    """
+
+    def __init__(self, samples: dict[str, np.ndarray], widths: dict[str, int], times: np.ndarray):
+        self.samples = samples
+        self.widths = widths
+        self.times = times
+
+    def __len__(self) -> int:
+        return len(self.times)
+
+    def value(self, path: str, cycle: int) -> ReplayValue:
+        return ReplayValue(int(self.samples[path][cycle]), self.widths[path])
+
+    @classmethod
+    def from_vcd(
+        cls,
+        filename: str,
+        clock: str,
+        signals: Optional[Iterable[str]] = None,
+        edge: str = "post",
+    ) -> "WaveformStore":
+        """
+        Load VCD file and sample signals on rising edges of `clock`.
+
+        Only signals from the scope of the clock are loaded, optionally limited to `signals`
+        (paths relative to that scope). With `edge="post"` values are taken after the edge,
+        which is what predicates observe in cocotb after `ClockCycles`/`RisingEdge`, while
+        `edge="pre"` returns values from just before the edge.
+        """
+        assert edge in ["pre", "post"], f"Unknown sampling edge '{edge}'"
+        with open(filename, "r") as f:
+            reader = VcdReader(f)
+            clk = reader.find(clock)
+            root = clk.path.rsplit(".", 1)[0]
+
+            if signals is None:
+                selected = [s for p, s in reader.signals.items() if p.startswith(root + ".")]
+            else:
+                selected = [reader.signals[f"{root}.{name}"] for name in signals]
+                selected.append(clk)
+
+            paths = {}
+            for signal in selected:
+                paths.setdefault(signal.ident, []).append(signal.path)
+            changes = {ident: ([], []) for ident in paths}
+            for time, ident, value in reader.changes(paths):
+                times, values = changes[ident]
+                times.append(time)
+                values.append(decode_value(value.lower()))
+
+        def as_arrays(ident):
+            times, values = changes[ident]
+            return np.asarray(times, dtype=np.int64), np.asarray(values, dtype=object)
+
+        clk_t, clk_v = as_arrays(clk.ident)
+        rising = clk_t[1:][(clk_v[1:] == 1) & (clk_v[:-1] != 1)]
+        side = "right" if edge == "post" else "left"
+
+        samples, widths = {}, {}
+        for ident, signal_paths in paths.items():
+            times, values = as_arrays(ident)
+            idx = np.searchsorted(times, rising, side=side) - 1
+            sampled = np.where(idx >= 0, values[np.maximum(idx, 0)], UNKNOWN)
+            for path in signal_paths:
+                relative = path.removeprefix(root + ".")
+                samples[relative] = sampled
+                widths[relative] = reader.signals[path].width
+
+        return cls(samples, widths, rising * reader.timescale)
+
+
+class ReplaySignal:
+    """
+    Stand-in for a simulator signal handle
+    """
+
+    def __init__(self, dut: "ReplayDut", path: str):
+        self._dut = dut
+        self._path = path
+        self._name = path.rsplit(".", 1)[-1]
+        self._log = dut._log
+
+    @property
+    def value(self) -> ReplayValue:
+        return self._dut.store.value(self._path, self._dut.cycle)
+
+    @value.setter
+    def value(self, value: Any) -> None:
+        # Recorded values already include whatever was driven in simulation
+        pass
+
+    def setimmediatevalue(self, value: Any) -> None:
+        pass
+
+    def __len__(self) -> int:
+        return self._dut.store.widths[self._path]
+
+    def __repr__(self) -> str:
+        return f"ReplaySignal({self._path})"
+
+
+class ReplayScope:
+    """
+    Stand-in for a simulator hierarchy handle, resolves children from the waveform store
+    """
+
+    def __init__(self, dut: "ReplayDut", path: str):
+        self._dut = dut
+        self._path = path
+        self._name = path.rsplit(".", 1)[-1]
+        self._log = dut._log
+        self._children = {}
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        if name not in self._children:
+            self._children[name] = self._dut._lookup(self._path, name)
+        return self._children[name]
+
+
+class ReplayDut(ReplayScope):
+    """
+    Fake `dut` handle backed by a `WaveformStore`, `advance` moves to the next clock cycle
+    """
+
+    def __init__(self, store: WaveformStore, name: str = "replay"):
+        self.store = store
+        self.cycle = 0
+        self._log = logging.getLogger(f"cocotb.{name}")
+        self._scopes = set()
+        for path in store.samples:
+            parts = path.split(".")
+            self._scopes.update(".".join(parts[:i]) for i in range(1, len(parts)))
+        self._dut = self
+        self._path = ""
+        self._name = name
+        self._children = {}
+
+    def _lookup(self, scope: str, name: str) -> Any:
+        path = f"{scope}.{name}" if scope else name
+        if path in self.store.samples:
+            return ReplaySignal(self, path)
+        if path in self._scopes:
+            return ReplayScope(self, path)
+        raise AttributeError(f"{self._name} contains no object named {path}")
+
+    def advance(self, cycles: int = 1) -> bool:
+        """
+        Move forward by `cycles`, returns False when the end of the recording is reached
+        """
+        self.cycle += cycles
+        return self.cycle < len(self.store)
+
+    @property
+    def time(self) -> float:
+        """
+        Time of the current clock edge in seconds
+        """
+        return float(self.store.times[min(self.cycle, len(self.store) - 1)])
+
+
+def replay(
+    sequence: Sequence,
+    dut: ReplayDut,
+    cycle_cnt: int = 0,
+    noexcept: bool = True,
+    trace: bool = False,
+) -> SequenceMatch:
+    """
+    Offline counterpart of `Sequence.match`, starts at the current cycle of `dut`
+    """
+    matcher = SequenceMatcher(sequence, dut, cycle_cnt, noexcept, trace)
+    while not matcher.step():
+        if not dut.advance():
+            break
+    return matcher.match_
@@ -0,0 +1,210 @@
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Values of DUT signals sampled once per clock cycle and shared by all checkers
+
+Predicates of concurrent `Sequence.match` tasks, FIFO models and monitors often read the
+same signals on the same clock edge, each read being a separate GPI call. A snapshot reads
+every signal its consumers use once per cycle and serves the values from a plain record:
+
+    snapshot = SnapshotService(dut.clk_i, dut)
+    rx_task = cocotb.start_soon(snapshot.match(rx_seq, timeout_cycles))
+    fsm_task = cocotb.start_soon(snapshot.match(fsm_seq, timeout_cycles))
+
+`snapshot.dut` mimics the DUT hierarchy, so predicates written for handles work unchanged.
+Signals are registered when first accessed through it (or with `register`) and read in all
+following cycles. Writes go directly to the DUT. Sampling stops at the first clock edge at
+which no consumer waits for a snapshot and resumes with the next `next` or `match`, so a
+single sequence gains nothing over `Sequence.match`.
+
+By default the values are taken at the rising edge of the clock, which is what predicates
+see after `ClockCycles`/`RisingEdge` and allows them to drive the DUT. With `read_only=True`
+they are taken in the `ReadOnly` phase of the edge, consumers must not drive signals then.
+"""
+
+from typing import Any, Dict, Optional
+
+from handles import resolve
+from tasks import background
+from utils import Sequence, SequenceMatch, SequenceMatcher
+
+from cocotb.handle import RegionObject, SimHandleBase
+from cocotb.triggers import Event, ReadOnly, RisingEdge
+from cocotb.utils import get_sim_time
+
+
+class Snapshot:
+    """
+    Values of the registered signals (path -> int) at one clock cycle
+    """
+
+    __slots__ = ("cycle", "time", "values")
+
+    def __init__(self, cycle: int, time: int, values: Dict[str, Any]):
+        self.cycle = cycle
+        self.time = time
+        self.values = values
+
+    def __getitem__(self, path: str) -> Any:
+        return self.values[path]
+
+
+class SnapshotSignal:
+    """
+    Stand-in for a signal handle, reads from the snapshot and writes to the DUT
+    """
+
+    def __init__(self, service: "SnapshotService", path: str, handle: SimHandleBase):
+        self._service = service
+        self._path = path
+        self._handle = handle
+        self._name = handle._name
+        self._log = handle._log
+
+    @property
+    def value(self) -> Any:
+        return self._service.value(self._path)
+
+    @value.setter
+    def value(self, value: Any) -> None:
+        self._handle.value = value
+
+    def setimmediatevalue(self, value: Any) -> None:
+        self._handle.setimmediatevalue(value)
+
+    def __len__(self) -> int:
+        return len(self._handle)
+
+    def __repr__(self) -> str:
+        return f"SnapshotSignal({self._path})"
+
+
+class SnapshotScope:
+    """
+    Stand-in for a hierarchy handle, resolves children once
+    """
+
+    def __init__(self, service: "SnapshotService", path: str, handle: SimHandleBase):
+        self._service = service
+        self._path = path
+        self._handle = handle
+        self._name = handle._name
+        self._log = handle._log
+        self._children = {}
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        if name not in self._children:
+            path = f"{self._path}.{name}" if self._path else name
+            handle = resolve(self._handle, name)
+            if isinstance(handle, RegionObject):
+                child = SnapshotScope(self._service, path, handle)
+            else:
+                self._service._add(path, handle)
+                child = SnapshotSignal(self._service, path, handle)
+            self._children[name] = child
+        return self._children[name]
+
+
+def _read(handle: SimHandleBase) -> Any:
+    value = handle.value
+    # Unresolved values are kept as they are, so checkers fail the same way as on handles
+    return value.integer if value.is_resolvable else value
+
+
+class SnapshotService:
+    def __init__(self, clk: SimHandleBase, root: SimHandleBase, read_only: bool = False):
+        self.clk = clk
+        self.root = root
+        self.read_only = read_only
+        self.dut = SnapshotScope(self, "", root)
+        self._handles: Dict[str, SimHandleBase] = {}
+        self._snapshot = Snapshot(-1, -1, {})
+        self._taken = Event("snapshot")
+        self._task = None
+        # Consumers waiting for the next snapshot
+        self._waiters = 0
+        self.cycle = 0
+
+    def register(self, *paths: str) -> None:
+        """
+        Sample the signals at `paths` (relative to the root) from the next cycle on
+        """
+        for path in paths:
+            self._add(path, resolve(self.root, path))
+
+    def _add(self, path: str, handle: SimHandleBase) -> None:
+        if path not in self._handles:
+            self._handles[path] = handle
+            if self._snapshot.time == get_sim_time():
+                self._snapshot.values[path] = _read(handle)
+
+    def _take(self) -> Snapshot:
+        values = {path: _read(handle) for path, handle in self._handles.items()}
+        self._snapshot = Snapshot(self.cycle, get_sim_time(), values)
+        return self._snapshot
+
+    def current(self) -> Snapshot:
+        """
+        Values in the current simulation step, sampled now if no clock edge occurred yet
+        """
+        if self._snapshot.time != get_sim_time():
+            self._take()
+        return self._snapshot
+
+    def value(self, path: str) -> Any:
+        return self.current().values[path]
+
+    def start(self) -> None:
+        """
+        Start sampling on every clock edge, done automatically by `next` and `match`
+        """
+        if self._task is None:
+            self._task = background.start_soon(self._run())
+
+    async def _run(self) -> None:
+        edge = RisingEdge(self.clk)
+        while True:
+            await edge
+            if not self._waiters:
+                self._task = None
+                return
+            if self.read_only:
+                await ReadOnly()
+            self.cycle += 1
+            self._take()
+            self._taken.set()
+            self._taken.clear()
+
+    async def _wait(self) -> None:
+        self._waiters += 1
+        try:
+            self.start()
+            await self._taken.wait()
+        finally:
+            self._waiters -= 1
+
+    async def next(self) -> Snapshot:
+        """
+        Wait for the snapshot of the next clock cycle
+        """
+        await self._wait()
+        return self._snapshot
+
+    async def match(
+        self,
+        sequence: Sequence,
+        cycle_cnt: int,
+        noexcept: bool = True,
+        trace: bool = False,
+        dut: Optional[Any] = None,
+    ) -> SequenceMatch:
+        """
+        `Sequence.match` with predicates evaluated on the snapshots, `dut` is a scope of
+        `self.dut` passed to them instead of the root
+        """
+        matcher = SequenceMatcher(sequence, dut or self.dut, cycle_cnt, noexcept, trace)
+        while not matcher.step():
+            await self._wait()
+        return matcher.match_
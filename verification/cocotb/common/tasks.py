@@ -0,0 +1,147 @@
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Ownership of background tasks of a test
+
+Coroutines which run for the whole test (clocks, bus models, timeouts, BFM loops) should be
+started through the `background` registry:
+
+    background.start_soon(Clock(dut.clk_i, 2, "ns").start())
+    await background.start(setup_dut(clk, rst_n, (2, "ns")))
+
+Cocotb itself kills all tasks which are still pending when a test ends, so the registry is
+not needed to keep tasks from running into the following testcases. It lets a test or an
+agent cancel a group of tasks mid-test. Tasks started by code which is not aware of the
+registry (e.g. constructors of bus models) are taken over with:
+
+    agent_tasks = TaskRegistry(parent=background)
+    with agent_tasks.adopt():
+        agent = I3CTarget(...)
+
+As a testbench plugin the module reports tasks defined in the test modules which are still
+running at the end of a test without being owned by the registry. Tasks of libraries, such
+as the processes of bus models, are not reported.
+"""
+
+import os
+from contextlib import contextmanager
+from typing import Any, Coroutine, Iterator, Optional, Union
+
+import cocotb
+from cocotb.decorators import Task
+from cocotb.scheduler import Scheduler
+
+
+class TaskRegistry:
+    def __init__(self, parent: Optional["TaskRegistry"] = None) -> None:
+        self._tasks: list[Task] = []
+        # Tasks are also owned by the parent, which cancels them at the end of the test
+        self._parent = parent
+
+    def register(self, task: Task) -> Task:
+        # Forget finished tasks, so that long tests do not accumulate them
+        if len(self._tasks) >= 64:
+            self._tasks = [t for t in self._tasks if not t.done()]
+        self._tasks.append(task)
+        if self._parent is not None:
+            self._parent.register(task)
+        return task
+
+    @contextmanager
+    def adopt(self) -> Iterator["TaskRegistry"]:
+        """
+        Take ownership of all tasks created within the block
+        """
+        _adopting.append(self)
+        try:
+            yield self
+        finally:
+            _adopting.remove(self)
+
+    def start_soon(self, coro: Union[Coroutine, Task]) -> Task:
+        """
+        Schedule `coro` like `cocotb.start_soon` and take ownership of it
+        """
+        return self.register(cocotb.start_soon(coro))
+
+    async def start(self, coro: Union[Coroutine, Task]) -> Task:
+        """
+        Start `coro` immediately like `cocotb.start` and take ownership of it
+        """
+        return self.register(await cocotb.start(coro))
+
+    def owns(self, task: Any) -> bool:
+        return task in self._tasks
+
+    def forget(self) -> None:
+        """
+        Drop all owned tasks without killing them
+        """
+        self._tasks = []
+
+    def cancel_all(self) -> int:
+        """
+        Kill the owned tasks which are still running, returns their number
+        """
+        tasks, self._tasks = self._tasks, []
+        cancelled = 0
+        for task in reversed(tasks):
+            if not task.done():
+                task.kill()
+                cancelled += 1
+        return cancelled
+
+
+# Registry of the running test
+background = TaskRegistry()
+# Registries adopting new tasks, innermost last
+_adopting: list[TaskRegistry] = []
+
+
+def running_tasks(scheduler: Scheduler) -> list[Any]:
+    """
+    Tasks waiting on a trigger, being scheduled or queued, except for the test itself
+    """
+    tasks = []
+    for waiting in scheduler._trigger2coros.values():
+        tasks.extend(waiting)
+    tasks.extend(scheduler._scheduling)
+    tasks.extend(scheduler._pending_coros)
+    return [t for t in dict.fromkeys(tasks) if t is not scheduler._test]
+
+
+_create_task = Scheduler.create_task
+_cleanup = Scheduler._cleanup
+
+
+def _create_task_adopted(coroutine: Any) -> Task:
+    task = _create_task(coroutine)
+    if _adopting:
+        _adopting[-1].register(task)
+    return task
+
+
+# Modules passed to cocotb, the testbench plugins are not tests
+_test_modules = set(os.getenv("MODULE", "").split(",")) - set(
+    os.getenv("TB_PLUGINS", "").split(",")
+)
+
+
+def _in_test_module(task: Any) -> bool:
+    frame = getattr(task._coro, "cr_frame", None)
+    return frame is not None and frame.f_globals.get("__name__") in _test_modules
+
+
+def _cleanup_tasks(self) -> None:
+    # Called once the test finished, cocotb kills the remaining tasks afterwards
+    if self._test is not None:
+        leaked = [t for t in running_tasks(self) if _in_test_module(t) and not background.owns(t)]
+        if leaked:
+            names = ", ".join(sorted(t._coro.__qualname__ for t in leaked))
+            self.log.warning(f"{len(leaked)} task(s) leaked by {self._test}: {names}")
+        background.forget()
+    _cleanup(self)
+
+
+Scheduler.create_task = staticmethod(_create_task_adopted)
+Scheduler._cleanup = _cleanup_tasks
@@ -0,0 +1,24 @@
+// SPDX-License-Identifier: Apache-2.0
+
+/*
+    Clock generator of the test wrappers, used instead of cocotb clocks in models built with
+    HDL_CLOCK=1 (see common/clocking.py). The reset is still driven by each test.
+
+    The period can be overridden at runtime with the +tb_clk_period_ps=<ps> plusarg.
+*/
+module tb_clk_gen #(
+    parameter int unsigned ClkPeriodPs = 2000
+) (
+    output logic clk_o
+);
+  int unsigned period_ps;
+
+  initial begin
+    period_ps = ClkPeriodPs;
+    void'($value$plusargs("tb_clk_period_ps=%d", period_ps));
+
+    clk_o = 1'b0;
+    forever #(period_ps * 0.5ps) clk_o = ~clk_o;
+  end
+
+endmodule
@@ -0,0 +1,114 @@
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Simulation speed telemetry
+
+Adds properties describing the simulation speed of each test to its <testcase> entry in the
+results XML:
+    sim_time_ns         - simulated time
+    wall_time_s         - wall clock time
+    clock_period_ns     - period of the fastest cocotb Clock started in the test
+    cycles_per_second   - simulated clock cycles per wall clock second
+    python_time_s       - time spent in Python, handling simulator callbacks
+    simulator_time_s    - remaining wall clock time, spent in the simulator
+    python_share        - python_time_s / wall_time_s
+    gpi_callbacks       - number of callbacks from the simulator (GPI triggers which fired)
+    peak_rss_mb         - peak resident set size of the simulation process
+
+Disable with COCOTB_TB_TELEMETRY=0.
+"""
+
+import os
+import resource
+import time
+from typing import Any, Optional
+from xml.etree.ElementTree import Element, SubElement
+
+from regression_hooks import (
+    on_callback_end,
+    on_callback_start,
+    on_test_end,
+    on_test_start,
+)
+
+from cocotb.clock import Clock
+from cocotb.triggers import GPITrigger
+from cocotb.utils import get_sim_time, get_time_from_sim_steps
+
+
+class Telemetry:
+    def __init__(self) -> None:
+        self.wall_start = time.perf_counter()
+        self.sim_start = get_sim_time("ns")
+        self.python_time = 0.0
+        self.callbacks = 0
+        self.clock_period_ns = None
+
+    def properties(self) -> dict[str, str]:
+        wall_time = time.perf_counter() - self.wall_start
+        sim_time = get_sim_time("ns") - self.sim_start
+        props = {
+            "sim_time_ns": f"{sim_time:.0f}",
+            "wall_time_s": f"{wall_time:.3f}",
+            "python_time_s": f"{self.python_time:.3f}",
+            "simulator_time_s": f"{max(wall_time - self.python_time, 0):.3f}",
+            "python_share": f"{self.python_time / wall_time if wall_time else 0:.3f}",
+            "gpi_callbacks": str(self.callbacks),
+            # ru_maxrss is expressed in kilobytes on Linux
+            "peak_rss_mb": f"{resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:.1f}",
+        }
+        if self.clock_period_ns:
+            cycles = sim_time / self.clock_period_ns
+            props["clock_period_ns"] = f"{self.clock_period_ns:g}"
+            props["cycles_per_second"] = f"{cycles / wall_time if wall_time else 0:.1f}"
+        return props
+
+
+_telemetry: Optional[Telemetry] = None
+_callback_start = 0.0
+_clock_start = Clock.start
+
+
+def _start_callback(trigger: Any) -> None:
+    global _callback_start
+    _callback_start = time.perf_counter()
+
+
+def _end_callback(trigger: Any) -> None:
+    if _telemetry is None:
+        return
+    _telemetry.python_time += time.perf_counter() - _callback_start
+    # Python triggers (events, locks) fire from within coroutines, not from the simulator
+    if isinstance(trigger, GPITrigger):
+        _telemetry.callbacks += 1
+
+
+def _clock_start_measured(self, *args, **kwargs):
+    if _telemetry is not None:
+        period = get_time_from_sim_steps(self.period, "ns")
+        if _telemetry.clock_period_ns is None or period < _telemetry.clock_period_ns:
+            _telemetry.clock_period_ns = period
+    return _clock_start(self, *args, **kwargs)
+
+
+def _start_telemetry(test: Any) -> None:
+    global _telemetry
+    _telemetry = Telemetry()
+
+
+def _write_telemetry(test: Any, passed: Optional[bool], testcase: Element) -> None:
+    global _telemetry
+    if _telemetry is None:
+        return
+    properties = SubElement(testcase, "properties")
+    for name, value in _telemetry.properties().items():
+        SubElement(properties, "property", name=name, value=value)
+    _telemetry = None
+
+
+if os.getenv("COCOTB_TB_TELEMETRY", "1") != "0":
+    on_callback_start(_start_callback)
+    on_callback_end(_end_callback)
+    Clock.start = _clock_start_measured
+    on_test_start(_start_telemetry)
+    on_test_end(_write_telemetry)
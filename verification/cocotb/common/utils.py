@@ -6,6 +6,7 @@ from random import randint
 from typing import Any, Callable, Iterable, Iterator, Optional, TypeVar, Union
 
 import colorama
+from cocotb_helpers import wait_for_value
 
 import cocotb
 from cocotb.triggers import ClockCycles, ReadOnly, RisingEdge, with_timeout
@@ -32,12 +33,8 @@ def clog2(val: int):
 
 
 async def expect_with_timeout(signal, expected, clk, timeout: int = 2, units: str = "ms"):
-    async def wait_cond():
-        while signal.value != expected:
-            await RisingEdge(clk)
-
     # Apply timeout
-    await with_timeout(wait_cond(), timeout, units)
+    await with_timeout(wait_for_value(signal, expected, clk), timeout, units)
 
 
 def rand_bits(width):
@@ -57,6 +54,10 @@ class SequenceMatch:
         self.matched = False
         self.cycle = 0
         self.match_count = 0
+        # Cycle at which each predicate passed, in order
+        self.match_cycles: list[int] = []
+        # Number of times the sequence was restarted by `SequenceRetry`
+        self.retries = 0
 
     def __str__(self) -> str:
         s = "SequenceMatch { "
@@ -67,6 +68,8 @@ class SequenceMatch:
         )
 
         s += f", cycle: {self.cycle}, match_count: {self.match_count}"
+        if self.retries:
+            s += f", retries: {self.retries}"
         s += " }"
         return s
 
@@ -162,7 +165,8 @@ class Sequence:
         def __init__(
             self, s1: Iterable[Callable[[Any], bool]], s2: Iterable[Callable[[Any], bool]]
         ) -> None:
-            self.s = zip(s1, s2)
+            self.s1 = s1
+            self.s2 = s2
 
         class Iter(Iterator[Callable[[Any], bool]]):
             def __init__(
@@ -194,7 +198,8 @@ class Sequence:
                 return f"({self.p[0]} & {self.p[1]})"
 
         def __iter__(self) -> Iterator:
-            return self.Iter(self.s.__iter__())
+            # Zipped on each iteration, so that the sequence can be restarted
+            return self.Iter(zip(self.s1, self.s2))
 
     def __and__(self, other: "Sequence") -> "Sequence":
         return Sequence(self.AndSeqState(self.sequence, other.sequence))
@@ -202,49 +207,120 @@ class Sequence:
     async def match(
         self, dut, clk, cycle_cnt: int, noexcept: bool = True, trace: bool = False
     ) -> SequenceMatch:
-        match_ = SequenceMatch()
+        engine = SequenceEngine(clk)
+        match_ = engine.add(self, dut, cycle_cnt, noexcept, trace)
+        await engine.run()
+        return match_
 
-        it = self.sequence.__iter__()
-        predicate = None
 
-        match_.matched = False
-        match_.cycle = 0
-        new_predicate = False
+class SequenceMatcher:
+    """
+    Evaluates predicates of a `Sequence` one clock cycle at a time.
 
-        while cycle_cnt == 0 or match_.cycle < cycle_cnt:
-            if predicate is None:
-                try:
-                    predicate = it.__next__()
-                    new_predicate = True
-                except StopIteration:
-                    match_.matched = True
-                    return match_
+    The matcher does not wait for the clock on its own, the caller advances the time between
+    calls to `step`. This allows the same predicates to be evaluated in simulation
+    (`Sequence.match`) and on recorded waveforms (see `replay.py`).
+    """
 
+    def __init__(
+        self, sequence: Sequence, dut, cycle_cnt: int, noexcept: bool = True, trace: bool = False
+    ):
+        self.sequence = sequence
+        self.dut = dut
+        self.cycle_cnt = cycle_cnt
+        self.noexcept = noexcept
+        self.trace = trace
+
+        self.match_ = SequenceMatch()
+        self.it = sequence.sequence.__iter__()
+        self.predicate = None
+        self.new_predicate = False
+
+    def step(self) -> bool:
+        """
+        Evaluate the current predicate, returns True once matching is finished
+        """
+        match_ = self.match_
+        if self.cycle_cnt != 0 and match_.cycle >= self.cycle_cnt:
+            if not match_.matched and self.trace:
+                self.dut._log.warning("Sequence timed out")
+            return True
+
+        if self.predicate is None:
             try:
-                if new_predicate and trace:
-                    dut._log.info(f"Matching predicate `{predicate}`")
-                if predicate(dut):
-                    predicate = None
-                    match_.match_count += 1
-            except SequenceFailed as e:
-                dut._log.error(
-                    f"Sequence {self} failed at cycle {match_.cycle}, predicate {predicate}"
-                )
-                if not noexcept:
-                    raise SequenceFailed(e.desc, match_)
-                return match_
-            except SequenceRetry:
-                predicate = None
-                it = self.sequence.__iter__()
-
-            new_predicate = False
-            await ClockCycles(clk, 1)
-            match_.cycle += 1
-
-        if not match_ and trace:
-            dut._log.warning("Sequence timed out")
-
-        return match_
+                self.predicate = self.it.__next__()
+                self.new_predicate = True
+            except StopIteration:
+                match_.matched = True
+                return True
+
+        try:
+            if self.new_predicate and self.trace:
+                self.dut._log.info(f"Matching predicate `{self.predicate}`")
+            if self.predicate(self.dut):
+                self.predicate = None
+                match_.match_count += 1
+                match_.match_cycles.append(match_.cycle)
+        except SequenceFailed as e:
+            self.dut._log.error(
+                f"Sequence {self.sequence} failed at cycle {match_.cycle}, "
+                f"predicate {self.predicate}"
+            )
+            if not self.noexcept:
+                raise SequenceFailed(e.desc, match_)
+            return True
+        except SequenceRetry:
+            self.predicate = None
+            self.it = self.sequence.sequence.__iter__()
+            match_.retries += 1
+
+        self.new_predicate = False
+        match_.cycle += 1
+        return False
+
+
+class SequenceEngine:
+    """
+    Evaluates any number of sequences from a single driver woken once per clock cycle.
+
+    Each sequence is turned into a `SequenceMatcher`, the state machine stepping through its
+    predicates and combinators, when it is added. Sequences may be infinite or built from
+    generators (e.g. `Sequence(repeat(CheckNoStretch)) & seq`), so they are expanded one
+    predicate at a time instead of upfront.
+
+        engine = SequenceEngine(dut.clk_i)
+        rx_match = engine.add(rx_seq, dut, timeout_cycles)
+        fsm_match = engine.add(fsm_seq, dut, timeout_cycles)
+        await engine.run()
+    """
+
+    def __init__(self, clk) -> None:
+        self.clk = clk
+        self.matchers: list[SequenceMatcher] = []
+
+    def add(
+        self, sequence: Sequence, dut, cycle_cnt: int, noexcept: bool = True, trace: bool = False
+    ) -> SequenceMatch:
+        """
+        Add a sequence to be evaluated by the next `run`, returns its match updated in place
+        """
+        matcher = SequenceMatcher(sequence, dut, cycle_cnt, noexcept, trace)
+        self.matchers.append(matcher)
+        return matcher.match_
+
+    async def run(self) -> list[SequenceMatch]:
+        """
+        Step all sequences on every rising edge of the clock until each of them finished.
+        A sequence failing with `noexcept=False` stops the others.
+        """
+        active, self.matchers = self.matchers, []
+        matches = [matcher.match_ for matcher in active]
+        edge = RisingEdge(self.clk)
+        while True:
+            active = [matcher for matcher in active if not matcher.step()]
+            if not active:
+                return matches
+            await edge
 
 
 def split_into_dwords(data: bytes) -> Iterable[tuple[int, int]]:
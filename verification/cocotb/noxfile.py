@@ -1,9 +1,10 @@
 # SPDX-License-Identifier: Apache-2.0
 
 import os
+from contextlib import nullcontext
 
 import nox
-from nox_utils import VerificationTest, isCocotbSimFailure, nox_config
+from nox_utils import VerificationTest, isCocotbSimFailure, nox_config, trace_pipe
 
 # Common nox configuration
 nox = nox_config(nox)
@@ -13,6 +14,14 @@ nox = nox_config(nox)
 # Test configuration
 pip_requirements_path = "../../requirements.txt"
 
+# Bus timing checker, see tools/timing/checker.py
+timing_tool_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "../../tools/timing")
+
+# Per-source-file cost summary of Verilator models, see tools/verilator_profile/summary.py
+profile_tool_path = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "../../tools/verilator_profile"
+)
+
 # Coverage types to collect
 coverage_types = ["all", "branch", "toggle"] if os.getenv("TEST_COVERAGE_ENABLE") else None
 
@@ -21,7 +30,33 @@ def _verify(session, test_group, test_type, test_name, coverage=None, simulator=
     session.install("-r", pip_requirements_path)
     test = VerificationTest(test_group, test_type, test_name, coverage)
 
-    with open(test.paths["log_default"], "w") as test_log:
+    # Optionally check bus timings of top-level tests, e.g. TIMING_CHECK_MODE=LEGACY_400k
+    timing_check_mode = os.getenv("TIMING_CHECK_MODE") if test_type == "top" else None
+    # With TRACE_PIPE set, the waveform is analyzed while the simulation runs and only windows
+    # around violations are stored
+    piped = bool(timing_check_mode and os.getenv("TRACE_PIPE"))
+    if piped:
+        monitor = [
+            "python",
+            os.path.join(timing_tool_path, "monitor.py"),
+            "--mode",
+            timing_check_mode,
+            "--out-dir",
+            os.path.join(test.testPath, f"timing_{test_name}"),
+            "--log",
+            os.path.join(test.testPath, f"timing_check_{test_name}.log"),
+        ]
+        trace = trace_pipe(test.paths["vcd_default"], monitor)
+    else:
+        trace = nullcontext()
+
+    # With VERILATOR_PROFILE=1, the model is built with execution profiling and a per-file
+    # cost summary is written next to the test results
+    profile = bool(os.getenv("VERILATOR_PROFILE")) and simulator in [None, "verilator"]
+    # With HDL_CLOCK=1, the clocks of the test wrappers are generated in HDL
+    hdl_clock = bool(os.getenv("HDL_CLOCK"))
+
+    with open(test.paths["log_default"], "w") as test_log, trace as monitor_proc:
         args = [
             "make",
             "-C",
@@ -37,6 +72,13 @@ def _verify(session, test_group, test_type, test_name, coverage=None, simulator=
         if simulator:
             args.append("SIM=" + simulator)
 
+        if profile:
+            args.append("VERILATOR_PROFILE=1")
+
+        # Generate the clocks of the test wrappers in HDL instead of cocotb
+        if hdl_clock:
+            args.append("HDL_CLOCK=1")
+
         session.run(
             *args,
             external=True,
@@ -44,7 +86,40 @@ def _verify(session, test_group, test_type, test_name, coverage=None, simulator=
             stderr=test_log,
         )
     # Prevent coverage.dat and test log from being overwritten
-    test.rename_defaults(coverage)
+    test.rename_defaults(coverage, vcd=not piped)
+
+    if piped:
+        if monitor_proc.returncode:
+            raise Exception("Bus timing violations found, see timing check log.")
+    elif timing_check_mode:
+        session.run(
+            "python",
+            os.path.join(timing_tool_path, "checker.py"),
+            test.paths["vcd"],
+            "--mode",
+            timing_check_mode,
+            "--log",
+            os.path.join(test.testPath, f"timing_check_{test_name}.log"),
+        )
+
+    if profile:
+        # Same build directory as in common.mk
+        sim_build = "sim-build" + (f"-{coverage}" if coverage else "") + "-profile"
+        sim_build += "-hdl-clock" if hdl_clock else ""
+        session.run(
+            "python",
+            os.path.join(profile_tool_path, "summary.py"),
+            os.path.join(test.testPath, sim_build, "Vtop"),
+            os.path.join(test.testPath, "gmon.out"),
+            "--out",
+            os.path.join(test.testPath, f"profile_rtl_{test_name}.txt"),
+            "--gprof-out",
+            os.path.join(test.testPath, f"gprof_{test_name}.txt"),
+        )
+        os.rename(
+            os.path.join(test.testPath, "profile_exec.dat"),
+            os.path.join(test.testPath, f"profile_exec_{test_name}.dat"),
+        )
 
     # Add check from results.xml to notify nox that test failed
     isTBFailure = isCocotbSimFailure(resultsFile=test.paths["xml"])
@@ -1,5 +1,6 @@
 // SPDX-License-Identifier: Apache-2.0
 `include "i3c_defines.svh"
+`include "i3c_top_obs.svh"
 
 
 `define VERILATOR
@@ -24,7 +25,11 @@ module i3c_test_wrapper #(
     parameter int unsigned CsrDataWidth = I3CCSR_pkg::I3CCSR_DATA_WIDTH
 )(
 `ifdef I3C_USE_AHB
+`ifdef TB_HDL_CLOCK
+    output logic hclk,
+`else
     input logic hclk,
+`endif
     input logic hreset_n,
     // AHB-Lite interface
     input  logic [  AhbAddrWidth-1:0] haddr,
@@ -41,7 +46,11 @@ module i3c_test_wrapper #(
     input  logic                      hsel,
     input  logic                      hready,
 `elsif I3C_USE_AXI
+`ifdef TB_HDL_CLOCK
+    output logic aclk,
+`else
     input logic aclk,
+`endif
     input logic areset_n,
     // AXI4 Interface
     // AXI Read Channels
@@ -97,7 +106,10 @@ module i3c_test_wrapper #(
 
     // I3C Bus signals
     output logic bus_sda,
-    output logic bus_scl
+    output logic bus_scl,
+
+    // Signals of the core packed into one port, see i3c_top_obs.yaml
+    output logic [`I3C_TOP_OBS_WIDTH-1:0] obs_o
 );
 
 logic clk_i;
@@ -111,6 +123,17 @@ assign clk_i = aclk;
 assign rst_ni = areset_n;
 `endif
 
+// Clock generated in HDL instead of cocotb, see common/clocking.py
+`ifdef TB_HDL_CLOCK
+tb_clk_gen xclk_gen (
+`ifdef I3C_USE_AHB
+    .clk_o(hclk)
+`elsif I3C_USE_AXI
+    .clk_o(aclk)
+`endif
+);
+`endif
+
 localparam int unsigned NumDevices = 3; // 2 Targets, 1 Controller
 
 logic [NumDevices-1:0] sda_i;
@@ -132,6 +155,8 @@ i3c_bus_harness #(
 
 logic sel_od_pp;
 
+`I3C_TOP_OBS_ASSIGN(obs_o)
+
 i3c_wrapper xi3c_wrapper (
     .clk_i,
     .rst_ni,
@@ -0,0 +1,19 @@
+# SPDX-License-Identifier: Apache-2.0
+# Generated by tools/observation/obs_gen.py from i3c_top_obs.yaml, do not edit
+
+WIDTH = 55
+
+# Field name -> (offset, width)
+FIELDS = {
+    "tti_rx_queue_wvalid": (0, 1),
+    "tti_rx_queue_wready": (1, 1),
+    "tti_rx_queue_wdata": (2, 8),
+    "tti_rx_queue_empty": (10, 1),
+    "tti_rx_desc_queue_wvalid": (11, 1),
+    "tti_rx_desc_queue_wready": (12, 1),
+    "tti_rx_desc_queue_wdata": (13, 32),
+    "tti_rx_desc_queue_empty": (45, 1),
+    "bus_stop": (46, 1),
+    "recovery_cmd_done": (47, 1),
+    "target_fsm_state": (48, 7),
+}
@@ -1,13 +1,72 @@
 # SPDX-License-Identifier: Apache-2.0
 
+from typing import Any, Awaitable, Callable, Optional
+
+import i3c_top_obs
 from bus2csr import get_frontend_bus_if
-from cocotb_helpers import reset_n
+from clocking import clock_frequency, start_clock
+from cocotb_helpers import reset_n, wait_cycles
+from cocotbext_i3c.i3c_controller import I3cController
+from cocotbext_i3c.i3c_target import I3CTarget
+from handles import SignalAliases
+from irq import IrqHub
+from observation import ObservationBus
 from reg_map import reg_map
+from tasks import TaskRegistry, background
 
-import cocotb
-from cocotb.clock import Clock
+from cocotb.decorators import Task
 from cocotb.handle import SimHandleBase
-from cocotb.triggers import ClockCycles
+from cocotb.triggers import RisingEdge, with_timeout
+
+
+class BusAgent:
+    """
+    I3C bus model attached to the bus on first use.
+
+    Agents wake up Python on every edge of SDA/SCL, so they are only created when needed.
+    A detached agent releases its lines, the bus is a wired AND of all devices.
+    """
+
+    def __init__(self, factory: Callable[[], Any], sda: SimHandleBase, scl: SimHandleBase):
+        self.factory = factory
+        self.sda = sda
+        self.scl = scl
+        self.agent = None
+        self.tasks = None
+        self.release()
+
+    def release(self) -> None:
+        self.sda.value = 1
+        self.scl.value = 1
+
+    def get(self) -> Any:
+        if self.agent is None:
+            self.tasks = TaskRegistry(parent=background)
+            with self.tasks.adopt():
+                self.agent = self.factory()
+        return self.agent
+
+    def detach(self) -> None:
+        """
+        Stop monitoring the bus, the agent is created again on the next use
+        """
+        if self.agent is None:
+            return
+        self.tasks.cancel_all()
+        self.agent = None
+        self.tasks = None
+        self.release()
+
+
+# Period of the system clock, also the default of the clock generated by the test wrapper
+CLK_PERIOD_PS = 2000
+
+# Signals inside the core used by the tests, see `I3CTopTestInterface.signals`
+CORE_SIGNALS = {
+    "core": "xi3c_wrapper.i3c",
+    "bus_stop": "xi3c_wrapper.i3c.bus_stop",
+    "recovery_cmd_done": "xi3c_wrapper.i3c.xrecovery_handler.cmd_done",
+}
 
 
 class I3CTopTestInterface:
@@ -20,13 +79,106 @@ class I3CTopTestInterface:
         self.busIf = self.bus_if_cls(dut)
         self.clk = self.busIf.clk
         self.rst_n = self.busIf.rst_n
+        self.clk_freq = clock_frequency(CLK_PERIOD_PS)
         self.read_csr = self.busIf.read_csr
         self.write_csr = self.busIf.write_csr
 
-    async def setup(self):
+        # Handles of the signals inside the core, resolved once
+        self.signals = SignalAliases(dut, CORE_SIGNALS)
+        # Signals of the core sampled on every cycle, packed by the wrapper into one port
+        self.obs = ObservationBus(dut.obs_o, i3c_top_obs.FIELDS)
+
+        # Interrupt sources of the core, see `irq`
+        self._irq: Optional[IrqHub] = None
+
+        # I3C agents on the bus, see `i3c_controller` and `i3c_target`
+        self.controller_agent = BusAgent(
+            lambda: I3cController(
+                sda_i=dut.bus_sda,
+                sda_o=dut.sda_sim_ctrl_i,
+                scl_i=dut.bus_scl,
+                scl_o=dut.scl_sim_ctrl_i,
+                debug_state_o=None,
+                speed=12.5e6,
+            ),
+            dut.sda_sim_ctrl_i,
+            dut.scl_sim_ctrl_i,
+        )
+        self.target_agent = BusAgent(
+            lambda: I3CTarget(
+                sda_i=dut.bus_sda,
+                sda_o=dut.sda_sim_target_i,
+                scl_i=dut.bus_scl,
+                scl_o=dut.scl_sim_target_i,
+                debug_state_o=None,
+                speed=12.5e6,
+            ),
+            dut.sda_sim_target_i,
+            dut.scl_sim_target_i,
+        )
+
+    @property
+    def irq(self) -> IrqHub:
+        """
+        Interrupt sources of the core observed without bus transactions, monitored from the
+        first use
+        """
+        if self._irq is None:
+            self._irq = IrqHub(self.signals.core)
+        return self._irq
+
+    @property
+    def i3c_controller(self) -> I3cController:
+        """
+        Controller model on the bus, attached on first use
+        """
+        return self.controller_agent.get()
+
+    @property
+    def i3c_target(self) -> I3CTarget:
+        """
+        Target model on the bus, attached on first use
+        """
+        return self.target_agent.get()
+
+    # Completion of the core's operations. Each helper starts waiting right away and returns
+    # a task to await, so it has to be called before the action which causes the event.
+    # Awaiting the task raises SimTimeoutError if the event did not happen within the timeout.
+
+    def on_pulse(self, signal: SimHandleBase, timeout: int, units: str) -> Task:
+        """
+        Task completing at the next rising edge of `signal`
+        """
+        return background.start_soon(with_timeout(RisingEdge(signal), timeout, units))
+
+    def on_bus_stop(self, timeout: int = 100, units: str = "us") -> Task:
+        """
+        Task completing when the core detects a STOP on the I3C bus
+        """
+        return self.on_pulse(self.signals.bus_stop, timeout, units)
+
+    def on_recovery_command(self, timeout: int = 10, units: str = "us") -> Task:
+        """
+        Task completing when the recovery handler executed a command and updated the protocol
+        status in DEVICE_STATUS
+        """
+        return self.on_pulse(self.signals.recovery_cmd_done, timeout, units)
+
+    async def setup(
+        self,
+        boot: Optional[Callable[["I3CTopTestInterface"], Awaitable[None]]] = None,
+        idle_cycles: int = 0,
+    ):
+        """
+        Start the clock, reset the core and, if given, run `boot` on it after `idle_cycles`.
+        """
         await self.busIf.register_test_interfaces()
-        clock = Clock(self.clk, 2, units="ns")
-        cocotb.start_soon(clock.start())
+        await start_clock(self.clk, (CLK_PERIOD_PS, "ps"))
 
-        await ClockCycles(self.clk, 20)
+        await wait_cycles(self.clk, 20)
         await reset_n(self.clk, self.rst_n, cycles=5)
+
+        if boot is not None:
+            if idle_cycles:
+                await wait_cycles(self.clk, idle_cycles)
+            await boot(self)
@@ -0,0 +1,110 @@
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Interrupt sources of the core observed without bus transactions
+
+The core does not drive an interrupt line yet, so the status bits of PIO_INTR_STATUS,
+TTI INTERRUPT_STATUS and the recovery interface are tracked on the signals which set them.
+Each source is watched by a background task which only wakes up when its signal changes.
+"""
+
+from typing import Dict, Optional, Tuple
+
+from handles import resolve
+from tasks import background
+
+from cocotb.handle import SimHandleBase
+from cocotb.triggers import Event, FallingEdge, RisingEdge, with_timeout
+from cocotb.utils import get_sim_time
+
+# Source name -> (signal of the core raising it, active level)
+IRQ_SOURCES: Dict[str, Tuple[str, int]] = {
+    # PIO_INTR_STATUS
+    "hci_resp_ready_stat": ("hci_resp_queue_ready_thld_trig", 1),
+    "hci_cmd_queue_ready_stat": ("hci_cmd_queue_ready_thld_trig", 1),
+    "hci_ibi_status_thld_stat": ("ibi_queue_ready_thld_trig", 1),
+    "hci_rx_thld_stat": ("hci_rx_queue_ready_thld_trig", 1),
+    "hci_tx_thld_stat": ("hci_tx_queue_ready_thld_trig", 1),
+    # TTI INTERRUPT_STATUS
+    "tti_ibi_thld_stat": ("tti_ibi_queue_ready_thld_trig", 1),
+    "tti_rx_desc_thld_stat": ("tti_rx_desc_queue_ready_thld_trig", 1),
+    "tti_tx_desc_thld_stat": ("tti_tx_desc_queue_ready_thld_trig", 1),
+    "tti_rx_data_thld_stat": ("tti_rx_queue_ready_thld_trig", 1),
+    "tti_tx_data_thld_stat": ("tti_tx_queue_ready_thld_trig", 1),
+    "tti_rx_desc_stat": ("tti_rx_desc_queue_empty", 0),
+    # Recovery interface, DEVICE_STATUS updated after a command
+    "recovery_cmd_done": ("xrecovery_handler.cmd_done", 1),
+}
+
+
+class IrqSource:
+    def __init__(self, name: str, signal: SimHandleBase, active: int) -> None:
+        self.name = name
+        self.signal = signal
+        self.active = active
+        # Number of assertions and their times (ns)
+        self.count = 0
+        self.first_time: Optional[float] = None
+        self.last_time: Optional[float] = None
+        self._asserted = Event(name)
+
+    def is_set(self) -> bool:
+        return self._asserted.is_set()
+
+    async def wait(self, timeout: Optional[int] = None, units: str = "us") -> float:
+        """
+        Wait until the interrupt is asserted, returns the time (ns) of its last assertion
+        """
+        if timeout is None:
+            await self._asserted.wait()
+        else:
+            await with_timeout(self._asserted.wait(), timeout, units)
+        return self.last_time
+
+    def latency(self, since: float) -> Optional[float]:
+        """
+        Time (ns) from `since` to the last assertion, None if it was not asserted after it
+        """
+        if self.last_time is None or self.last_time < since:
+            return None
+        return self.last_time - since
+
+    def _update(self) -> None:
+        if self.signal.value == self.active:
+            if not self._asserted.is_set():
+                now = get_sim_time("ns")
+                self.count += 1
+                self.first_time = now if self.first_time is None else self.first_time
+                self.last_time = now
+                self._asserted.set()
+        else:
+            self._asserted.clear()
+
+    async def _monitor(self) -> None:
+        asserted_edge = RisingEdge if self.active else FallingEdge
+        deasserted_edge = FallingEdge if self.active else RisingEdge
+        while True:
+            self._update()
+            await (deasserted_edge if self.is_set() else asserted_edge)(self.signal)
+
+
+class IrqHub:
+    """
+    Awaitable interrupt sources of the core, e.g. `await tb.irq.tti_rx_desc_stat.wait()`
+    """
+
+    def __init__(self, core: SimHandleBase) -> None:
+        self.sources: Dict[str, IrqSource] = {}
+        for name, (path, active) in IRQ_SOURCES.items():
+            source = IrqSource(name, resolve(core, path), active)
+            self.sources[name] = source
+            background.start_soon(source._monitor())
+
+    def __getattr__(self, name: str) -> IrqSource:
+        try:
+            return self.__dict__["sources"][name]
+        except KeyError:
+            raise AttributeError(f"Unknown interrupt source {name}") from None
+
+    def counts(self) -> Dict[str, int]:
+        return {name: source.count for name, source in self.sources.items()}
@@ -3,12 +3,9 @@
 import logging
 
 from boot import boot_init
-from cocotbext_i3c.i3c_controller import I3cController
-from cocotbext_i3c.i3c_target import I3CTarget
 from interface import I3CTopTestInterface
 
 import cocotb
-from cocotb.triggers import ClockCycles
 
 
 @cocotb.test()
@@ -16,39 +13,14 @@ async def test_enter_exit_hdr_mode(dut):
     ENTHDR0 = 0x20
     cocotb.log.setLevel(logging.DEBUG)
 
-    i3c_controller = I3cController(
-        sda_i=dut.bus_sda,
-        sda_o=dut.sda_sim_ctrl_i,
-        scl_i=dut.bus_scl,
-        scl_o=dut.scl_sim_ctrl_i,
-        debug_state_o=None,
-        speed=12.5e6,
-    )
-
-    i3c_target = I3CTarget(  # noqa
-        sda_i=dut.bus_sda,
-        sda_o=dut.sda_sim_target_i,
-        scl_i=dut.bus_scl,
-        scl_o=dut.scl_sim_target_i,
-        debug_state_o=None,
-        speed=12.5e6,
-    )
-
     tb = I3CTopTestInterface(dut)
-    await tb.setup()
-    await ClockCycles(tb.clk, 50)
-    await boot_init(tb)
+    await tb.setup(boot=boot_init, idle_cycles=50)
+    i3c_controller = tb.i3c_controller
 
     await i3c_controller.i3c_ccc_write(ENTHDR0, broadcast_data=[])
 
-    assert (
-        dut.xi3c_wrapper.i3c.xcontroller.xcontroller_standby.xcontroller_standby_i3c.xi3c_target_fsm.state_d
-        == 32
-    )  # IdleHDR
+    assert tb.obs.target_fsm_state.value == 32  # IdleHDR
 
     await i3c_controller.send_hdr_exit()
 
-    assert (
-        dut.xi3c_wrapper.i3c.xcontroller.xcontroller_standby.xcontroller_standby_i3c.xi3c_target_fsm.state_d
-        == 0
-    )  # Idle
+    assert tb.obs.target_fsm_state.value == 0  # Idle
@@ -4,12 +4,13 @@ import logging
 
 from boot import boot_init
 from bus2csr import dword2int, int2dword
-from cocotbext_i3c.i3c_controller import I3cController
-from cocotbext_i3c.i3c_target import I3CTarget
+from cocotb_helpers import wait_cycles
 from interface import I3CTopTestInterface
+from tasks import background
 
 import cocotb
-from cocotb.triggers import ClockCycles, Timer
+from cocotb.triggers import Timer
+from cocotb.utils import get_sim_time
 
 
 async def timeout_task(timeout_us=5):
@@ -27,62 +28,30 @@ async def test_setup(dut):
     """
 
     cocotb.log.setLevel(logging.INFO)
-    cocotb.start_soon(timeout_task(20))
-
-    i3c_controller = I3cController(
-        sda_i=dut.bus_sda,
-        sda_o=dut.sda_sim_ctrl_i,
-        scl_i=dut.bus_scl,
-        scl_o=dut.scl_sim_ctrl_i,
-        debug_state_o=None,
-        speed=12.5e6,
-    )
-
-    i3c_target = I3CTarget(  # noqa
-        sda_i=dut.bus_sda,
-        sda_o=dut.sda_sim_target_i,
-        scl_i=dut.bus_scl,
-        scl_o=dut.scl_sim_target_i,
-        debug_state_o=None,
-        speed=12.5e6,
-    )
-
-    tb = I3CTopTestInterface(dut)
-    await tb.setup()
+    background.start_soon(timeout_task(20))
 
     # Configure the top level
-    await boot_init(tb)
+    tb = I3CTopTestInterface(dut)
+    await tb.setup(boot=boot_init)
 
-    return i3c_controller, i3c_target, tb
+    return tb.i3c_controller, tb
 
 
 @cocotb.test()
 async def test_i3c_target(dut):
 
     # Setup
-    i3c_controller, i3c_target, tb = await test_setup(dut)
+    i3c_controller, tb = await test_setup(dut)
 
     # Send Private Write on I3C
     test_data = [[0xAA, 0x00, 0xBB, 0xCC, 0xDD], [0xDE, 0xAD, 0xBA, 0xBE]]
     for test_vec in test_data:
+        stop = tb.on_bus_stop()
         await i3c_controller.i3c_write(0x5A, test_vec)
-        await ClockCycles(tb.clk, 10)
-
-    # Wait for an interrupt
-    wait_irq = True
-    timeout = 0
-    # Number of clock cycles after which we should observe an interrupt
-    TIMEOUT_THRESHOLD = 50
-    while wait_irq:
-        timeout += 1
-        await ClockCycles(tb.clk, 10)
-        irq = dword2int(await tb.read_csr(tb.reg_map.I3C_EC.TTI.INTERRUPT_STATUS.base_addr, 4))
-        if irq:
-            wait_irq = False
-            dut._log.debug(":::Interrupt was raised:::")
-        if timeout > TIMEOUT_THRESHOLD:
-            wait_irq = False
-            dut._log.debug(":::Timeout cancelled polling:::")
+        await stop
+
+    # Wait for the descriptor of the received data
+    await tb.irq.tti_rx_desc_stat.wait(timeout=1)
 
     # Convert bytes to 32-bit words
     words_ref = []
@@ -120,7 +89,39 @@ async def test_i3c_target(dut):
     assert words_out == words_ref
 
     # Dummy wait
-    await ClockCycles(tb.clk, 10)
+    await wait_cycles(tb.clk, 10)
+
+
+@cocotb.test()
+async def test_i3c_target_irq(dut):
+
+    # Setup
+    i3c_controller, tb = await test_setup(dut)
+    rx_desc = tb.irq.tti_rx_desc_stat
+    assert rx_desc.count == 0
+    assert rx_desc.first_time is None
+
+    # The descriptor queue stays not empty until it is read, so both transfers raise the
+    # interrupt once
+    start = get_sim_time("ns")
+    for test_vec in [[0x01, 0x02, 0x03, 0x04], [0x05, 0x06]]:
+        stop = tb.on_bus_stop()
+        await i3c_controller.i3c_write(0x5A, test_vec)
+        await stop
+
+    last_time = await rx_desc.wait(timeout=1)
+    assert rx_desc.is_set()
+    assert rx_desc.count == 1
+    assert start < rx_desc.first_time == last_time <= get_sim_time("ns")
+    assert rx_desc.latency(start) == last_time - start
+    assert rx_desc.latency(last_time + 1) is None
+
+    # Other sources are tracked independently
+    assert tb.irq.counts()["tti_rx_desc_stat"] == 1
+    assert tb.irq.recovery_cmd_done.count == 0
+
+    # Dummy wait
+    await wait_cycles(tb.clk, 10)
 
 
 @cocotb.test()
@@ -130,7 +131,7 @@ async def test_i3c_target_ibi(dut):
     addr = 0x5A
 
     # Setup
-    i3c_controller, i3c_target, tb = await test_setup(dut)
+    i3c_controller, tb = await test_setup(dut)
 
     target = i3c_controller.add_target(addr)
     target.set_bcr_fields(ibi_req_capable=True, ibi_payload=True)
@@ -145,4 +146,4 @@ async def test_i3c_target_ibi(dut):
     assert data == expected
 
     # Dummy wait
-    await ClockCycles(tb.clk, 10)
+    await wait_cycles(tb.clk, 10)
@@ -1,13 +1,10 @@
 # SPDX-License-Identifier: Apache-2.0
 
-import logging
-
 from boot import boot_init
 from bus2csr import dword2int, int2dword
-from cocotbext_i3c.i3c_controller import I3cController
-from cocotbext_i3c.i3c_target import I3CTarget
 from interface import I3CTopTestInterface
 from recovery_interface import RecoveryInterface
+from tasks import background
 
 import cocotb
 from cocotb.triggers import Timer
@@ -18,50 +15,34 @@ async def timeout():
     raise RuntimeError("Test timeout!")
 
 
-async def initialize(dut):
+async def boot_recovery(tb):
     """
-    Common test initialization routine
+    Boot the core and enable the recovery mode
     """
+    await boot_init(tb)
 
-    cocotb.log.setLevel(logging.DEBUG)
-
-    # Start the background timeout task
-    await cocotb.start(timeout())
-
-    # Initialize interfaces
-    i3c_controller = I3cController(
-        sda_i=dut.bus_sda,
-        sda_o=dut.sda_sim_ctrl_i,
-        scl_i=dut.bus_scl,
-        scl_o=dut.scl_sim_ctrl_i,
-        debug_state_o=None,
-        speed=12.5e6,
+    status = 0x3  # "Recovery Mode"
+    await tb.write_csr(
+        tb.reg_map.I3C_EC.SECFWRECOVERYIF.DEVICE_STATUS_0.base_addr, int2dword(status), 4
     )
 
-    i3c_target = I3CTarget(  # noqa
-        sda_i=dut.bus_sda,
-        sda_o=dut.sda_sim_target_i,
-        scl_i=dut.bus_scl,
-        scl_o=dut.scl_sim_target_i,
-        debug_state_o=None,
-        speed=12.5e6,
-    )
 
-    tb = I3CTopTestInterface(dut)
-    await tb.setup()
+async def initialize(dut):
+    """
+    Common test initialization routine
+    """
 
-    recovery = RecoveryInterface(i3c_controller)
+    # Start the background timeout task
+    await background.start(timeout())
 
     # Configure the top level
-    await boot_init(tb)
+    tb = I3CTopTestInterface(dut)
+    await tb.setup(boot=boot_recovery)
 
-    # Enable the recovery mode
-    status = 0x3  # "Recovery Mode"
-    await tb.write_csr(
-        tb.reg_map.I3C_EC.SECFWRECOVERYIF.DEVICE_STATUS_0.base_addr, int2dword(status), 4
-    )
+    i3c_controller = tb.i3c_controller
+    recovery = RecoveryInterface(i3c_controller)
 
-    return i3c_controller, i3c_target, tb, recovery
+    return i3c_controller, tb, recovery
 
 
 @cocotb.test()
@@ -71,15 +52,16 @@ async def test_recovery_write(dut):
     """
 
     # Initialize
-    i3c_controller, i3c_target, tb, recovery = await initialize(dut)
+    i3c_controller, tb, recovery = await initialize(dut)
 
     # Write to the RESET CSR (one word)
+    done = tb.on_recovery_command()
     await recovery.command(
         0x5A, RecoveryInterface.Command.DEVICE_RESET, True, [0xAA, 0xBB, 0xCC, 0xDD]
     )
 
     # Wait & read the CSR from the AHB/AXI side
-    await Timer(1, "us")
+    await done
 
     status = dword2int(
         await tb.read_csr(tb.reg_map.I3C_EC.SECFWRECOVERYIF.DEVICE_STATUS_0.base_addr, 4)
@@ -94,6 +76,7 @@ async def test_recovery_write(dut):
     assert data == 0xDDCCBBAA
 
     # Write to the FIFO_CTRL CSR (two words)
+    done = tb.on_recovery_command()
     await recovery.command(
         0x5A,
         RecoveryInterface.Command.INDIRECT_FIFO_CTRL,
@@ -102,7 +85,7 @@ async def test_recovery_write(dut):
     )
 
     # Wait & read the CSR from the AHB/AXI side
-    await Timer(1, "us")
+    await done
 
     status = dword2int(
         await tb.read_csr(tb.reg_map.I3C_EC.SECFWRECOVERYIF.DEVICE_STATUS_0.base_addr, 4)
@@ -131,17 +114,19 @@ async def test_recovery_write_pec(dut):
     """
 
     # Initialize
-    i3c_controller, i3c_target, tb, recovery = await initialize(dut)
+    i3c_controller, tb, recovery = await initialize(dut)
 
     # Write to the RESET CSR
+    done = tb.on_recovery_command()
     await recovery.command(
         0x5A, RecoveryInterface.Command.DEVICE_RESET, True, [0xEF, 0xBE, 0xAD, 0xDE]
     )
 
     # Wait, skip checks
-    await Timer(1, "us")
+    await done
 
     # Write to the RESET CSR again, deliberately malform PEC
+    done = tb.on_recovery_command()
     await recovery.command(
         0x5A,
         RecoveryInterface.Command.DEVICE_RESET,
@@ -151,7 +136,7 @@ async def test_recovery_write_pec(dut):
     )
 
     # Wait & read the CSR from the AHB/AXI side
-    await Timer(1, "us")
+    await done
 
     status = dword2int(
         await tb.read_csr(tb.reg_map.I3C_EC.SECFWRECOVERYIF.DEVICE_STATUS_0.base_addr, 4)
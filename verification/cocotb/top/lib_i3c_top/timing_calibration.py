@@ -0,0 +1,94 @@
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Measurement of the bus timing of the core for one point of the timing calibration
+
+Run by tools/timing/calibration.py, which passes the swept values of the SOCMGMTIF timing
+registers in TIMING_CALIBRATION_POINT (JSON) and collects calibration.json written to the
+working directory of the simulation. Registers which are not swept are set for the system
+clock of the model.
+"""
+
+import json
+import os
+
+import numpy as np
+from boot import boot_init
+from bus2csr import int2dword
+from calibration import CALIBRATION_FILE, POINT_ENV, base_point, measure
+from cocotb_helpers import wait_cycles
+from handles import SignalAliases
+from interface import I3CTopTestInterface
+from tasks import background
+from waveform import UNKNOWN
+
+import cocotb
+from cocotb.triggers import Edge, with_timeout
+from cocotb.utils import get_sim_time
+
+STANDBY = "xi3c_wrapper.i3c.xcontroller.xcontroller_standby.xcontroller_standby_i3c"
+
+# Signals recorded for `calibration.measure`
+CALIBRATION_SIGNALS = {
+    "scl": "bus_scl",
+    "sda": "bus_sda",
+    "sda_o": "xi3c_wrapper.sda_o",
+    "start_detect": f"{STANDBY}.start_detect",
+    "stop_detect": f"{STANDBY}.stop_detect",
+    "bus_free": f"{STANDBY}.bus_free",
+    "bus_available": f"{STANDBY}.bus_available",
+    "bus_idle": f"{STANDBY}.bus_idle",
+}
+
+# Cycles waited past the longest bus condition timing before the IBI
+CONDITION_MARGIN = 100
+
+
+async def record(signal, changes):
+    """
+    Append (time, value) of every change of `signal` to `changes`
+    """
+    while True:
+        value = signal.value
+        changes.append((get_sim_time("ps") * 1e-12, int(value) if value.is_resolvable else UNKNOWN))
+        await Edge(signal)
+
+
+@cocotb.test()
+async def timing_calibration(dut):
+    tb = I3CTopTestInterface(dut)
+    point = dict(base_point(tb.clk_freq), **json.loads(os.environ[POINT_ENV]))
+    await tb.setup(boot=boot_init)
+    for name, value in point.items():
+        reg = getattr(tb.reg_map.I3C_EC.SOCMGMTIF, name)
+        await tb.write_csr(reg.base_addr, int2dword(value), 4)
+
+    signals = SignalAliases(dut, CALIBRATION_SIGNALS)
+    changes = {name: [] for name in CALIBRATION_SIGNALS}
+    for name in CALIBRATION_SIGNALS:
+        background.start_soon(record(getattr(signals, name), changes[name]))
+
+    # Private write, the target acknowledges the address and data
+    stop = tb.on_bus_stop()
+    await tb.i3c_controller.i3c_write(0x5A, [0xAA, 0x55])
+    await stop
+    conditions = max(point["T_FREE_REG"], point["T_AVAL_REG"], point["T_IDLE_REG"])
+    await wait_cycles(tb.clk, conditions + CONDITION_MARGIN)
+
+    # IBI, the target drives its address and the MDB
+    ibi_start = get_sim_time("ps") * 1e-12
+    target = tb.i3c_controller.add_target(0x5A)
+    target.set_bcr_fields(ibi_req_capable=True, ibi_payload=True)
+    await tb.write_csr(tb.reg_map.I3C_EC.TTI.IBI_PORT.base_addr, int2dword(0xAA), 4)
+    await with_timeout(tb.i3c_controller.wait_for_ibi(), 100, "us")
+    await wait_cycles(tb.clk, CONDITION_MARGIN)
+
+    traces = {
+        name: tuple(np.array(column) for column in zip(*values)) for name, values in changes.items()
+    }
+    result = measure(traces, ibi_start, 1 / tb.clk_freq)
+    with open(CALIBRATION_FILE, "w") as f:
+        json.dump({"sys_clk": tb.clk_freq, "point": point, "measured": result}, f, indent=2)
+
+    for name, summary in result.items():
+        assert summary is not None, f"No {name} measured"
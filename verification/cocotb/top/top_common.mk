@@ -1,4 +1,7 @@
 TOP_DIR := $(abspath $(dir $(lastword $(MAKEFILE_LIST))))
 export PYTHONPATH := $(PYTHONPATH):$(TOP_DIR)/lib_i3c_top
 
+# Packed observation port of the test wrapper, see lib_i3c_top/i3c_top_obs.yaml
+VERILOG_INCLUDE_DIRS := $(TOP_DIR)/lib_i3c_top
+
 include $(TOP_DIR)/../common.mk
@@ -0,0 +1,66 @@
+# SPDX-License-Identifier: Apache-2.0
+import itertools
+
+import pytest
+from config_sweep import (
+    covering_array,
+    load_base_configs,
+    load_schema,
+    parse_param,
+    schema_levels,
+    sweep_configs,
+)
+from jsonschema import validate
+
+from common import ConfigException
+
+LEVELS = {"a": [1, 2, 3], "b": [False, True], "c": ["x", "y", "z"], "d": [4, 5]}
+
+
+@pytest.mark.parametrize("strength", [1, 2, 3])
+def test_covering_array(strength):
+    rows = covering_array(LEVELS, strength)
+    for combo in itertools.combinations(LEVELS, strength):
+        covered = {tuple(row[name] for name in combo) for row in rows}
+        assert covered == set(itertools.product(*(LEVELS[name] for name in combo)))
+    assert rows == covering_array(LEVELS, strength)
+
+
+def test_covering_array_size():
+    # Pairwise needs at least |a| * |c| rows, far less than all combinations
+    assert 9 <= len(covering_array(LEVELS, 2)) < 36
+    assert len(covering_array(LEVELS, 4)) == 36
+    assert len(covering_array(LEVELS, 5)) == 36
+
+
+def test_schema_levels():
+    props = load_schema()["properties"]
+    assert schema_levels("RxFifoDepth", props["RxFifoDepth"], 64) == [2, 16, 64, 256]
+    assert schema_levels("CmdFifoDepth", props["CmdFifoDepth"], 64) == [2, 16, 64, 255]
+    assert schema_levels("DatDepth", props["DatDepth"], 128) == [1, 16, 128]
+    assert schema_levels("IbiFifoExtSize", props["IbiFifoExtSize"], False) == [False, True]
+    assert schema_levels("FrontendBusInterface", props["FrontendBusInterface"], "AXI") == ["AXI"]
+
+
+def test_sweep_configs():
+    schema = load_schema()
+    base_configs = load_base_configs()
+    configs = sweep_configs(base_configs, schema)
+    for config in configs.values():
+        validate(config, schema)
+        assert config.keys() == base_configs[config["FrontendBusInterface"]].keys()
+    assert {c["FrontendBusInterface"] for c in configs.values()} == {"AHB", "AXI"}
+    assert {c["IbiFifoExtSize"] for c in configs.values()} == {False, True}
+    assert sweep_configs(base_configs, schema) == configs
+
+
+def test_sweep_configs_overrides():
+    name, values = parse_param("FrontendBusDataWidth=32,64")
+    assert (name, values) == ("FrontendBusDataWidth", [32, 64])
+    configs = sweep_configs(load_base_configs(), load_schema(), overrides={name: values})
+    assert {c["FrontendBusDataWidth"] for c in configs.values()} == {32, 64}
+
+    with pytest.raises(ConfigException):
+        parse_param("FrontendBusDataWidth")
+    with pytest.raises(ConfigException):
+        sweep_configs(load_base_configs(), load_schema(), overrides={"RxFifoDepth": [1]})
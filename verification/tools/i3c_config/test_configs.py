@@ -1,15 +1,16 @@
 # SPDX-License-Identifier: Apache-2.0
+import json
 import os
 import re
 import sys
 from io import StringIO
 
 import pytest
-from i3c_core_config import main, _DEFAULT_OUT_DEFINES_FILE, ConfigException
+from i3c_core_config import main, _DEFAULT_OUT_DEFINES_FILE, ConfigException, get_validator
 from defs import _TEST_CONFIG_FILE_PATH, Configs, Opts
 
 
-def run_and_capture_output(config_name, config_filename, tool_type):
+def run_and_capture_output(config_name, config_filename, tool_type, *tool_args):
     """
     Runs configuration generating tool and directs the output to the return value.
     """
@@ -20,7 +21,7 @@ def run_and_capture_output(config_name, config_filename, tool_type):
         gen_cfg_path = os.path.join(root_dir, "tools", "i3c_config", "i3c_core_config.py")
 
         old_argv = sys.argv
-        sys.argv = [gen_cfg_path, config_name, config_path, tool_type]
+        sys.argv = [gen_cfg_path, config_name, config_path, tool_type, *tool_args]
         output = main()
         sys.argv = old_argv
         return output
@@ -144,3 +145,45 @@ def test_gen_shv_file(config_svh):
     with open(_DEFAULT_OUT_DEFINES_FILE, "r") as svh:
         content = svh.read()
         assert content
+
+
+def test_batch(supported_config, tmp_path):
+    """
+    Invokes the batch mode and expects the manifest and the option files to match the
+    outputs of the individual tools, and a repeated run not to rewrite unchanged files.
+    """
+    out_dir = tmp_path / "out"
+    svh_file = tmp_path / "i3c_defines.svh"
+    batch_args = ["--output-dir", str(out_dir), "--svh-file", str(svh_file)]
+    run_and_capture_output(supported_config, "i3c_core_configs.yaml", "batch", *batch_args)
+
+    with open(out_dir / "manifest.json") as f:
+        manifest = json.load(f)
+    tools = [Opts.VCS, Opts.QuestaSim, Opts.QuestaCompile, Opts.RegGen, Opts.VerilatorSim]
+    for tool in tools:
+        out = run_and_capture_output(supported_config, "i3c_core_configs.yaml", tool.opts_arg)
+        assert manifest["options"][tool.opts_arg] == out.strip()
+        with open(manifest["files"][tool.opts_arg]) as f:
+            assert f.read().strip() == out.strip()
+    assert manifest["config"]["FrontendBusInterface"] == supported_config.upper()
+    assert manifest["files"]["svh_file"] == str(svh_file)
+
+    outputs = [*out_dir.iterdir(), svh_file]
+    for path in outputs:
+        os.utime(path, ns=(0, 0))
+    run_and_capture_output(supported_config, "i3c_core_configs.yaml", "batch", *batch_args)
+    assert all(os.stat(path).st_mtime_ns == 0 for path in outputs)
+
+
+def test_validator_cache():
+    schema_path = os.path.join(
+        os.path.dirname(__file__).removesuffix("verification/tools/i3c_config"),
+        "tools",
+        "i3c_config",
+        "i3c_core_config.schema.json",
+    )
+    with open(schema_path) as f:
+        schema = json.load(f)
+    validator = get_validator(schema)
+    assert get_validator(json.loads(json.dumps(schema))) is validator
+    assert get_validator({**schema, "title": "Other"}) is not validator
@@ -21,6 +21,9 @@ pip_requirements_path = "../../requirements.txt"
         "test_edge_case_config",
         "test_invalid_config",
         "test_gen_shv_file",
+        "test_config_sweep",
+        "test_batch",
+        "test_validator_cache",
     ],
 )
 def i3c_config_verify(session, test_name):
@@ -43,6 +46,83 @@ def i3c_config_verify(session, test_name):
         )
 
 
+@nox.session(tags=["tests"])
+def timing_verify(session):
+    session.install("-r", pip_requirements_path)
+    test_path = "timing"
+    root_dir = os.path.dirname(__file__).removesuffix("/verification/tools")
+    timing_tool = os.path.join(root_dir, "tools", "timing")
+    test_log_path = os.path.join(test_path, "test_checker.log")
+
+    with open(test_log_path, "w") as test_log:
+        session.run(
+            "pytest",
+            test_path,
+            env={"PYTHONPATH": timing_tool},
+            stdout=test_log,
+            stderr=test_log,
+        )
+
+
+@nox.session(tags=["tests"])
+def verilator_profile_verify(session):
+    session.install("-r", pip_requirements_path)
+    test_path = "verilator_profile"
+    root_dir = os.path.dirname(__file__).removesuffix("/verification/tools")
+    profile_tool = os.path.join(root_dir, "tools", "verilator_profile")
+    test_log_path = os.path.join(test_path, "test_summary.log")
+
+    with open(test_log_path, "w") as test_log:
+        session.run(
+            "pytest",
+            test_path,
+            env={"PYTHONPATH": profile_tool},
+            stdout=test_log,
+            stderr=test_log,
+        )
+
+
+@nox.session(tags=["tests"])
+def observation_verify(session):
+    session.install("-r", pip_requirements_path)
+    test_path = "observation"
+    root_dir = os.path.dirname(__file__).removesuffix("/verification/tools")
+    obs_tool = os.path.join(root_dir, "tools", "observation")
+    test_log_path = os.path.join(test_path, "test_obs_gen.log")
+
+    with open(test_log_path, "w") as test_log:
+        session.run(
+            "pytest",
+            test_path,
+            env={"PYTHONPATH": obs_tool},
+            stdout=test_log,
+            stderr=test_log,
+        )
+
+
+@nox.session(tags=["tests"])
+def replay_verify(session):
+    session.install("-r", pip_requirements_path)
+    test_path = "replay"
+    root_dir = os.path.dirname(__file__).removesuffix("/verification/tools")
+    # replay.py lives with the testbenches and reads VCD files with the timing tools
+    pythonpath = [
+        os.path.join(root_dir, "verification", "cocotb", "common"),
+        os.path.join(root_dir, "tools", "timing"),
+        os.path.join(root_dir, "tools", "cocotb_helpers", "src"),
+    ]
+    test_log_path = os.path.join(test_path, "test_replay.log")
+
+    with open(test_log_path, "w") as test_log:
+        session.run(
+            "pytest",
+            test_path,
+            env={"PYTHONPATH": os.pathsep.join(pythonpath)},
+            stdout=test_log,
+            stderr=test_log,
+        )
+
+
 @nox.session(reuse_venv=True)
 def lint(session: nox.Session) -> None:
     """Options are defined in pyproject.toml and .flake8 files"""
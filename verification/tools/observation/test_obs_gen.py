@@ -0,0 +1,50 @@
+# SPDX-License-Identifier: Apache-2.0
+
+import pytest
+from obs_gen import DescriptionError, format_py, format_sv, load_fields
+
+DESCRIPTION = {
+    "name": "test_obs",
+    "fields": [
+        {"name": "rx_empty", "signal": "rx_empty_o"},
+        {"name": "state", "signal": "xcore.xfsm.state_d", "width": 7},
+        {"name": "rx_full"},
+    ],
+}
+
+
+def test_load_fields():
+    assert load_fields(DESCRIPTION) == [
+        ("rx_empty", "rx_empty_o", 0, 1),
+        ("state", "xcore.xfsm.state_d", 1, 7),
+        ("rx_full", "rx_full", 8, 1),
+    ]
+
+
+@pytest.mark.parametrize(
+    "fields",
+    [
+        [],
+        [{"name": "a"}, {"name": "a"}],
+        [{"name": "a", "width": 0}],
+        [{"name": "a", "signal": "b; assign c = 1"}],
+        [{"name": "1a"}],
+    ],
+)
+def test_invalid_description(fields):
+    with pytest.raises(DescriptionError):
+        load_fields({"name": "test_obs", "fields": fields})
+
+
+def test_generated_sources_match():
+    fields = load_fields(DESCRIPTION)
+    sv = format_sv("test_obs", fields, "test_obs.yaml")
+    assert "`define TEST_OBS_WIDTH 9" in sv
+    assert "assign port[1 +: 7] = xcore.xfsm.state_d;" in sv
+    # The last line of the macro is not continued
+    assert sv.count("\\\n") == len(fields)
+
+    namespace = {}
+    exec(format_py("test_obs", fields, "test_obs.yaml"), namespace)
+    assert namespace["WIDTH"] == 9
+    assert namespace["FIELDS"] == {"rx_empty": (0, 1), "state": (1, 7), "rx_full": (8, 1)}
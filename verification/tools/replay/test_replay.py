@@ -0,0 +1,146 @@
+# SPDX-License-Identifier: Apache-2.0
+
+import pytest
+from replay import ReplayDut, ReplayScope, ReplaySignal, WaveformStore, replay
+from utils import Sequence
+from waveform import UNKNOWN
+
+# Clock rises at 5, 15, 25 and 35 ns. valid_i and data_i change at the falling edges, like
+# testbench inputs, fifo.count at the rising edges, like a flop output.
+VCD = """\
+$timescale 1ns $end
+$scope module TOP $end
+$scope module dut $end
+$var wire 1 ! clk_i $end
+$var wire 1 " valid_i $end
+$var wire 8 # data_i [7:0] $end
+$scope module fifo $end
+$var wire 4 $ count [3:0] $end
+$upscope $end
+$upscope $end
+$var wire 1 % other $end
+$upscope $end
+$enddefinitions $end
+#0
+$dumpvars
+0!
+0"
+bxxxxxxxx #
+b0 $
+0%
+$end
+#5
+1!
+#10
+0!
+1"
+b10101011 #
+#15
+1!
+b1 $
+#20
+0!
+0"
+#25
+1!
+b10 $
+#30
+0!
+#35
+1!
+"""
+
+
+@pytest.fixture
+def vcd(tmp_path):
+    path = tmp_path / "dump.vcd"
+    path.write_text(VCD)
+    return str(path)
+
+
+@pytest.fixture
+def dut(vcd):
+    return ReplayDut(WaveformStore.from_vcd(vcd, clock="clk_i"))
+
+
+def test_from_vcd_post_edge(vcd):
+    store = WaveformStore.from_vcd(vcd, clock="clk_i")
+    assert len(store) == 4
+    assert store.times == pytest.approx([5e-9, 15e-9, 25e-9, 35e-9])
+    # Signals outside of the scope of the clock are not loaded
+    assert sorted(store.samples) == ["clk_i", "data_i", "fifo.count", "valid_i"]
+    assert list(store.samples["valid_i"]) == [0, 1, 0, 0]
+    assert list(store.samples["data_i"]) == [UNKNOWN, 0xAB, 0xAB, 0xAB]
+    # Changes at the edge are seen after it
+    assert list(store.samples["fifo.count"]) == [0, 1, 2, 2]
+    assert store.widths == {"clk_i": 1, "valid_i": 1, "data_i": 8, "fifo.count": 4}
+
+
+def test_from_vcd_pre_edge(vcd):
+    store = WaveformStore.from_vcd(vcd, clock="clk_i", edge="pre")
+    assert list(store.samples["valid_i"]) == [0, 1, 0, 0]
+    assert list(store.samples["fifo.count"]) == [0, 0, 1, 2]
+
+
+def test_from_vcd_signals(vcd):
+    store = WaveformStore.from_vcd(vcd, clock="clk_i", signals=["fifo.count"])
+    assert sorted(store.samples) == ["clk_i", "fifo.count"]
+    with pytest.raises(KeyError):
+        WaveformStore.from_vcd(vcd, clock="clk_i", signals=["other"])
+
+
+def test_values(dut):
+    data = dut.data_i
+    assert not data.value.is_resolvable
+    assert len(data) == 8
+    assert dut.advance()
+    assert data.value == 0xAB
+    assert data.value.integer == 0xAB
+    assert data.value.is_resolvable
+    assert len(data.value) == 8
+    # Recorded values do not change when driven
+    data.value = 0
+    data.setimmediatevalue(0)
+    assert data.value == 0xAB
+
+
+def test_lookup(dut):
+    assert isinstance(dut.fifo, ReplayScope)
+    assert isinstance(dut.fifo.count, ReplaySignal)
+    assert dut.fifo.count is dut.fifo.count
+    assert dut.fifo.count._name == "count"
+    with pytest.raises(AttributeError):
+        dut.other
+    with pytest.raises(AttributeError):
+        dut.fifo.missing
+
+
+def test_advance(dut):
+    assert dut.time == pytest.approx(5e-9)
+    assert dut.advance(2)
+    assert dut.fifo.count.value == 2
+    assert dut.time == pytest.approx(25e-9)
+    assert not dut.advance(2)
+    # The time stays at the last edge
+    assert dut.time == pytest.approx(35e-9)
+
+
+def test_replay(dut):
+    seq = Sequence([lambda dut: dut.valid_i.value == 1, lambda dut: dut.fifo.count.value == 2])
+    match_ = replay(seq, dut)
+    assert match_.matched
+    assert match_.match_cycles == [1, 2]
+    # Like Sequence.match, the end of the sequence is noticed at the following edge
+    assert dut.cycle == 3
+
+
+def test_replay_end_of_recording(dut):
+    match_ = replay(Sequence(lambda dut: dut.fifo.count.value == 3), dut)
+    assert not match_.matched
+    assert match_.cycle == 4
+
+
+def test_replay_cycle_cnt(dut):
+    match_ = replay(Sequence(lambda dut: dut.fifo.count.value == 2), dut, cycle_cnt=2)
+    assert not match_.matched
+    assert match_.cycle == 2
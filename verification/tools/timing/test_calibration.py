@@ -0,0 +1,92 @@
+# SPDX-License-Identifier: Apache-2.0
+
+import numpy as np
+import pytest
+from calibration import (
+    REGISTERS,
+    base_point,
+    calibration_row,
+    measure,
+    parse_sweep,
+    predict,
+    sweep_points,
+)
+
+SYS_PERIOD = 2e-9
+
+
+def trace(*changes):
+    times, values = zip(*changes)
+    return np.array(times) * SYS_PERIOD, np.array(values)
+
+
+def test_parse_sweep():
+    assert parse_sweep("T_HD_DAT_REG=1:4") == ("T_HD_DAT_REG", [1, 2, 3, 4])
+    assert parse_sweep("T_R_REG=0:8:4") == ("T_R_REG", [0, 4, 8])
+    assert parse_sweep("T_FREE_REG=20,0x40") == ("T_FREE_REG", [20, 64])
+    with pytest.raises(ValueError):
+        parse_sweep("T_HIGH_REG=1:4")
+    with pytest.raises(ValueError):
+        parse_sweep("T_R_REG")
+
+
+def test_base_point():
+    base = base_point(500e6)
+    assert sorted(base) == sorted(REGISTERS)
+    # Bus condition timing scales with the system clock
+    assert base_point(250e6)["T_IDLE_REG"] < base["T_IDLE_REG"]
+
+
+def test_sweep_points():
+    points = sweep_points([("T_R_REG", [1, 2]), ("T_F_REG", [3, 4, 5])])
+    assert len(points) == 6
+    assert {(p["T_R_REG"], p["T_F_REG"]) for p in points} == {
+        (r, f) for r in [1, 2] for f in [3, 4, 5]
+    }
+    assert all(sorted(p) == ["T_F_REG", "T_R_REG"] for p in points)
+    assert sweep_points([]) == [{}]
+
+
+def test_measure():
+    # START at 10, SCL falls at 20, 60 and 100, STOP at 130, IBI from 140
+    traces = {
+        "scl": trace((0, 1), (20, 0), (40, 1), (60, 0), (80, 1), (100, 0), (120, 1)),
+        "sda": trace((0, 1), (10, 0), (130, 1)),
+        # Changes while SCL is high are not timed
+        "sda_o": trace((0, 1), (25, 0), (50, 1), (104, 0), (106, 1)),
+        "start_detect": trace((0, 0), (12, 1), (13, 0)),
+        "stop_detect": trace((0, 0), (133, 1), (134, 0)),
+        "bus_free": trace((0, 1), (133, 0), (153, 1)),
+        "bus_available": trace((0, 0), (633, 1)),
+        "bus_idle": trace((0, 0)),
+    }
+    result = measure(traces, 102 * SYS_PERIOD, SYS_PERIOD)
+    assert result["start_detect"]["median"] == pytest.approx(2)
+    assert result["stop_detect"]["median"] == pytest.approx(3)
+    assert result["target_hold"] == {"median": 5, "min": 5, "max": 5, "count": 1}
+    assert result["target_setup"]["min"] == pytest.approx(4)
+    assert result["target_setup"]["max"] == pytest.approx(6)
+    assert result["target_setup"]["count"] == 2
+    assert result["bus_free"]["median"] == pytest.approx(20)
+    assert result["bus_available"]["median"] == pytest.approx(500)
+    assert result["bus_idle"] is None
+
+
+def test_calibration_row():
+    point = base_point(500e6)
+    predicted = predict(point)
+    measured = {name: None for name in predicted}
+    measured["target_hold"] = {"median": predicted["target_hold"] + 2, "min": 1, "max": 9}
+
+    result = {"sys_clk": 500e6, "point": point, "measured": measured}
+    row = calibration_row(3, {"T_R_REG": point["T_R_REG"]}, result)
+    assert row["status"] == "ok"
+    assert row["sys_clk"] == 500e6
+    assert row["T_IDLE_REG"] == point["T_IDLE_REG"]
+    assert row["target_hold_offset"] == 2
+    assert "bus_idle_offset" not in row
+    assert row["bus_idle_predicted"] == point["T_IDLE_REG"]
+
+    failed = calibration_row(3, {"T_R_REG": 1}, None)
+    assert failed["status"] == "failed"
+    assert failed["T_R_REG"] == 1
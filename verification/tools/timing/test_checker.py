@@ -0,0 +1,74 @@
+# SPDX-License-Identifier: Apache-2.0
+
+import pytest
+from checker import check, check_waveform, measure
+from specification import IXCModes, IXCSpecification
+from timing import firmware_to_timings, get_firmware_settings
+from timing_utils import f2T
+from traces import SYS_CLK, i2c_write_trace, write_vcd
+from waveform import load_signals
+
+
+@pytest.fixture(params=[IXCModes.LEGACY_400k, IXCModes.LEGACY_1M], ids=["400k", "1M"])
+def mode(request):
+    return request.param
+
+
+def test_firmware_settings_compliant(mode, tmp_path):
+    """
+    Waveform generated from the default firmware settings must meet the specification
+    """
+    settings = get_firmware_settings(IXCSpecification(mode), SYS_CLK)
+    vcd = tmp_path / "dump.vcd"
+    write_vcd(vcd, *i2c_write_trace(settings), f2T(SYS_CLK))
+    assert check_waveform(vcd, mode) == []
+
+
+def test_measurements_match_model(mode, tmp_path):
+    """
+    Measured timings agree with the analytical model from `firmware_to_timings`
+    """
+    settings = get_firmware_settings(IXCSpecification(mode), SYS_CLK)
+    vcd = tmp_path / "dump.vcd"
+    write_vcd(vcd, *i2c_write_trace(settings), f2T(SYS_CLK))
+
+    signals = load_signals(vcd, ["bus_scl", "bus_sda"])
+    measured = measure(signals["bus_scl"], signals["bus_sda"])
+    expected = firmware_to_timings(settings, SYS_CLK)
+    for param in ["t_high", "t_low", "t_su_sta", "t_hd_sta", "t_su_sto", "t_buf", "t_scl"]:
+        _, durations = measured[param]
+        assert len(durations), param
+        assert any(d == pytest.approx(expected[param]) for d in durations), param
+
+
+def test_violations_reported(mode, tmp_path):
+    """
+    Shortened SCL high phase and bus free time are reported with timestamps
+    """
+    settings = get_firmware_settings(IXCSpecification(mode), SYS_CLK)
+    settings["T_HIGH"] = 10
+    settings["T_BUF_MIN"] = 1
+    vcd = tmp_path / "dump.vcd"
+    write_vcd(vcd, *i2c_write_trace(settings), f2T(SYS_CLK))
+
+    violations = check_waveform(vcd, mode)
+    params = {v.parameter for v in violations}
+    assert {"t_high", "t_buf"} <= params
+    assert all(v.measured < v.limit for v in violations)
+    assert [v.time for v in violations] == sorted(v.time for v in violations)
+
+
+def test_rise_time_compensation(mode, tmp_path):
+    """
+    Modelled rise time is subtracted from SCL high phase
+    """
+    settings = get_firmware_settings(IXCSpecification(mode), SYS_CLK)
+    scl, sda = i2c_write_trace(settings, restart=False)
+    vcd = tmp_path / "dump.vcd"
+    write_vcd(vcd, scl, sda, f2T(SYS_CLK))
+
+    signals = load_signals(vcd, ["bus_scl", "bus_sda"])
+    ideal = measure(signals["bus_scl"], signals["bus_sda"])
+    slow = measure(signals["bus_scl"], signals["bus_sda"], t_r=1e-6)
+    assert slow["t_high"][1] == pytest.approx(ideal["t_high"][1] - 1e-6)
+    assert check(slow, IXCSpecification(mode))
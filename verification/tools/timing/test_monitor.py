@@ -0,0 +1,61 @@
+# SPDX-License-Identifier: Apache-2.0
+
+import io
+
+from monitor import monitor
+from specification import IXCModes, IXCSpecification
+from timing import get_firmware_settings
+from timing_utils import f2T
+from traces import SYS_CLK, i2c_write_trace, write_vcd
+from waveform import load_signals
+
+MODE = IXCModes.LEGACY_400k
+
+
+def trace(tmp_path, repeat, **overrides):
+    """
+    VCD with `repeat` consecutive transfers, settings can be overridden per transfer index
+    """
+    settings = get_firmware_settings(IXCSpecification(MODE), SYS_CLK)
+    scl, sda, offset = [], [], 0
+    for i in range(repeat):
+        s = dict(settings, **overrides.get(str(i), {}))
+        scl_i, sda_i = i2c_write_trace(s)
+        scl += [(t + offset, v) for t, v in scl_i]
+        sda += [(t + offset, v) for t, v in sda_i]
+        offset = max(t for t, _ in scl + sda) + 1000
+    vcd = tmp_path / "dump.vcd"
+    write_vcd(vcd, sorted(scl), sorted(sda), f2T(SYS_CLK))
+    return vcd
+
+
+def test_no_violations(tmp_path):
+    vcd = trace(tmp_path, repeat=20)
+    with open(vcd) as stream:
+        assert monitor(stream, MODE, "bus_scl", "bus_sda", tmp_path, 20e-6, 20e-6) == 0
+    assert list(tmp_path.glob("violation_*.vcd")) == []
+
+
+def test_flagged_window_saved(tmp_path):
+    """
+    Only the window around the violation is kept and it can be read back
+    """
+    vcd = trace(tmp_path, repeat=20, **{"10": {"T_HIGH": 10}})
+    out_dir = tmp_path / "flagged"
+    out_dir.mkdir()
+    with open(vcd) as stream:
+        assert monitor(stream, MODE, "bus_scl", "bus_sda", out_dir, 10e-6, 10e-6) > 0
+
+    windows = list(out_dir.glob("violation_*_t_high.vcd"))
+    assert len(windows) >= 1
+    signals = load_signals(windows[0], ["bus_scl", "bus_sda"])
+    times, _ = signals["bus_scl"]
+    assert times[-1] - times[1] <= 20e-6
+    assert windows[0].stat().st_size < vcd.stat().st_size / 5
+
+
+def test_stream_from_memory(tmp_path):
+    vcd = trace(tmp_path, repeat=3, **{"1": {"T_BUF_MIN": 1}})
+    stream = io.StringIO(vcd.read_text())
+    assert monitor(stream, MODE, "bus_scl", "bus_sda", tmp_path, 5e-6, 5e-6) > 0
+    assert list(tmp_path.glob("violation_*_t_buf.vcd"))
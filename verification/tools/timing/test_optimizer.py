@@ -0,0 +1,99 @@
+# SPDX-License-Identifier: Apache-2.0
+
+import math
+
+import pytest
+from checker import TOLERANCE, spec_limits
+from optimizer import THIGH_MIN, cycles, optimize
+from specification import IXCModes, IXCSpecification
+from timing import firmware_to_timings, rise_fall_time
+from timing_utils import f2T
+
+SYS_CLKS = [50e6, 100e6, 200e6, 333.333e6, 500e6, 1e9]
+MODES = list(IXCModes)
+# T_R + 4 cycles of SCL high time exceed t_high_max of the open drain mode
+INFEASIBLE = {(IXCModes.I3C_SDR_12M5_OD, 50e6), (IXCModes.I3C_SDR_12M5_OD, 100e6)}
+
+
+def assert_compliant(mode, optimum):
+    timings = firmware_to_timings(optimum.settings, sys_clk=optimum.sys_clk)
+    for (param, kind), limit in spec_limits(IXCSpecification(mode)).items():
+        if kind == "min":
+            assert timings[param] >= limit - TOLERANCE, param
+        else:
+            assert timings[param] <= limit + TOLERANCE, param
+    assert optimum.settings["T_HIGH"] >= THIGH_MIN
+    assert optimum.settings["THD_DAT"] >= 1
+    assert optimum.settings["T_LOW"] > optimum.settings["THD_DAT"]
+
+
+@pytest.mark.parametrize("sys_clk", SYS_CLKS)
+@pytest.mark.parametrize("mode", MODES, ids=[m.name for m in MODES])
+def test_f_scl_objective(mode, sys_clk):
+    if (mode, sys_clk) in INFEASIBLE:
+        with pytest.raises(ValueError):
+            optimize(mode, sys_clk)
+        return
+    optimum = optimize(mode, sys_clk)
+    assert_compliant(mode, optimum)
+    assert optimum.timings["f_scl"] >= optimum.baseline_timings["f_scl"]
+    assert optimum.gain >= 0
+
+    # No SCL period is shorter than the sum of the bounds of its high and low phases
+    spec = IXCSpecification(mode)
+    sys_period = f2T(sys_clk)
+    rf = cycles(rise_fall_time(spec), sys_period)
+    t_high = max(cycles(spec.spec["t_high_min"], sys_period), rf + THIGH_MIN)
+    # SCL low phase spans T_F, THD_DAT >= 1 and the data setup time
+    t_su_dat = max(cycles(spec.spec["t_su_dat_min"], sys_period), 1)
+    t_low = max(cycles(spec.spec["t_low_min"], sys_period), rf + 1 + t_su_dat)
+    bound = max(t_high + t_low, cycles(f2T(spec.spec["f_scl_max"]), sys_period))
+    assert math.isclose(optimum.timings["t_scl"], bound * sys_period)
+
+
+@pytest.mark.parametrize("sys_clk", SYS_CLKS)
+@pytest.mark.parametrize("mode", MODES, ids=[m.name for m in MODES])
+def test_margin_objective(mode, sys_clk):
+    if (mode, sys_clk) in INFEASIBLE:
+        with pytest.raises(ValueError):
+            optimize(mode, sys_clk, "margin")
+        return
+    optimum = optimize(mode, sys_clk, "margin")
+    assert_compliant(mode, optimum)
+    assert math.isclose(optimum.timings["f_scl"], optimum.baseline_timings["f_scl"])
+    assert optimum.min_margin >= optimize(mode, sys_clk).min_margin
+
+
+def test_margin_objective_with_f_scl():
+    optimum = optimize(IXCModes.LEGACY_400k, 100e6, "margin", 250e3)
+    assert math.isclose(optimum.timings["f_scl"], 250e3)
+    assert optimum.min_margin > optimize(IXCModes.LEGACY_400k, 100e6, "margin").min_margin
+
+
+def test_open_drain_high_time():
+    optimum = optimize(IXCModes.I3C_SDR_12M5_OD, 500e6)
+    assert_compliant(IXCModes.I3C_SDR_12M5_OD, optimum)
+    assert optimum.timings["t_high"] <= 41e-9
+    assert optimum.gain > 0
+
+    # SCL is high for at least T_R + 4 cycles, which exceeds t_high_max at 100MHz
+    with pytest.raises(ValueError):
+        optimize(IXCModes.I3C_SDR_12M5_OD, 100e6)
+
+
+def test_cache():
+    assert optimize(IXCModes.LEGACY_1M, 250e6) is optimize(IXCModes.LEGACY_1M, 250e6)
+    assert optimize(IXCModes.LEGACY_1M, 250e6) is not optimize(IXCModes.LEGACY_1M, 250e6, "margin")
+
+
+def test_legal_baseline():
+    # The heuristic's T_HIGH of 2 cycles at 50MHz is below the FSM minimum, the baseline is
+    # the legal solver setting
+    optimum = optimize(IXCModes.I3C_SDR_12M5_PP, 50e6)
+    assert optimum.gain > 0
+    assert optimize(IXCModes.I3C_SDR_12M5_PP, 50e6, "margin").min_margin >= optimum.min_margin
+
+    # The heuristic violates t_high_max of the open drain mode at 333.333MHz
+    optimum = optimize(IXCModes.I3C_SDR_12M5_OD, 333.333e6, "margin")
+    assert_compliant(IXCModes.I3C_SDR_12M5_OD, optimum)
+    assert optimum.baseline_min_margin >= 0
@@ -0,0 +1,88 @@
+# SPDX-License-Identifier: Apache-2.0
+
+import csv
+import io
+import json
+
+import numpy as np
+import pytest
+from checker import TOLERANCE
+from solver import THIGH_MIN, solve, solve_table, write_table
+from specification import IXCModes, IXCSpecification
+from timing import firmware_to_timings, get_firmware_settings
+
+SYS_CLKS = np.arange(50e6, 1e9, 12.5e6)
+
+
+@pytest.mark.parametrize("mode", list(IXCModes), ids=[m.name for m in IXCModes])
+def test_solve_matches_firmware_settings(mode):
+    spec = IXCSpecification(mode)
+    settings = solve(spec, SYS_CLKS)
+    for i, sys_clk in enumerate(SYS_CLKS):
+        expected = get_firmware_settings(spec, sys_clk=sys_clk)
+        t_high = firmware_to_timings(expected, sys_clk=sys_clk)["t_high"]
+        if expected["T_HIGH"] < THIGH_MIN or t_high > spec.spec.get("t_high_max", np.inf):
+            continue
+        assert {name: int(value[i]) for name, value in settings.items()} == expected
+
+
+@pytest.mark.parametrize("mode", list(IXCModes), ids=[m.name for m in IXCModes])
+def test_solve_high_time_bounds(mode):
+    spec = IXCSpecification(mode)
+    settings = solve(spec, SYS_CLKS)
+    assert np.all(settings["T_HIGH"] >= THIGH_MIN)
+
+    timings = firmware_to_timings(settings, sys_clk=SYS_CLKS)
+    assert np.all(timings["t_scl"] >= 1 / spec.spec["f_scl_max"] - TOLERANCE)
+    # t_high_max is only violated when the FSM minimum does not fit in it
+    if "t_high_max" in spec.spec:
+        over = timings["t_high"] > spec.spec["t_high_max"] + TOLERANCE
+        assert np.all(settings["T_HIGH"][over] == THIGH_MIN)
+
+
+def test_table_compliance():
+    rows = solve_table([50e6, 100e6, 333.333e6])
+    for row in rows:
+        assert row["compliant"] == (row["min_margin"] >= -TOLERANCE)
+        assert row["T_HIGH"] >= THIGH_MIN
+
+    od = {r["sys_clk"]: r for r in rows if r["mode"] == "I3C_SDR_12M5_OD"}
+    # T_R + 4 cycles of SCL high time exceed t_high_max at 50 and 100MHz
+    assert not od[50e6]["compliant"] and not od[100e6]["compliant"]
+    assert od[333.333e6]["compliant"]
+    assert od[333.333e6]["margin_t_high_max"] >= 0
+    assert all(r["compliant"] for r in rows if r["mode"] == "I3C_SDR_12M5_PP")
+
+
+def test_table_timings_and_margins():
+    rows = solve_table([100e6, 500e6])
+    assert [(r["mode"], r["sys_clk"]) for r in rows[:2]] == [
+        ("LEGACY_400k", 100e6),
+        ("LEGACY_400k", 500e6),
+    ]
+    assert {r["mode"] for r in rows} == {m.name for m in IXCModes}
+
+    row = rows[1]
+    settings = get_firmware_settings(IXCSpecification(IXCModes.LEGACY_400k), sys_clk=500e6)
+    timings = firmware_to_timings(settings, sys_clk=500e6)
+    assert row["f_scl"] == pytest.approx(timings["f_scl"])
+    assert row["margin_t_low_min"] == pytest.approx(timings["t_low"] - 1300e-9)
+    assert row["min_margin"] == min(v for k, v in row.items() if k.startswith("margin_"))
+
+    # SCL high time of the open drain mode is limited from both sides
+    od = next(r for r in rows if r["mode"] == "I3C_SDR_12M5_OD")
+    assert od["margin_t_high_max"] == pytest.approx(41e-9 - od["t_high"])
+
+
+@pytest.mark.parametrize("fmt", ["csv", "json"])
+def test_write_table(fmt):
+    rows = solve_table([200e6], [IXCModes.LEGACY_1M, IXCModes.I3C_SDR_12M5_OD])
+    out = io.StringIO()
+    write_table(rows, out, fmt)
+    out.seek(0)
+    if fmt == "json":
+        loaded = json.load(out)
+    else:
+        loaded = list(csv.DictReader(out))
+    assert [r["mode"] for r in loaded] == ["LEGACY_1M", "I3C_SDR_12M5_OD"]
+    assert float(loaded[0]["T_HIGH"]) == rows[0]["T_HIGH"]
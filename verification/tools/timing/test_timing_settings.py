@@ -0,0 +1,25 @@
+# SPDX-License-Identifier: Apache-2.0
+
+from optimizer import optimize
+from specification import IXCModes
+from timing_settings import settings_for, spec_timing_enabled
+
+
+def test_settings_for():
+    timings = settings_for(IXCModes.LEGACY_400k, 2e6)
+    settings = optimize(IXCModes.LEGACY_400k, 2e6).settings
+    assert timings.t_high == settings["T_HIGH"]
+    assert timings.t_low == settings["T_LOW"]
+    assert timings.t_hd_dat == settings["THD_DAT"]
+    assert timings.t_buf == settings["T_BUF_MIN"]
+
+    # Modes can be given by name, lookups are memoized
+    assert settings_for("LEGACY_400k", 2e6) == timings
+    assert settings_for("I3C_SDR_12M5_PP", 500e6) is settings_for("I3C_SDR_12M5_PP", 500e6)
+
+
+def test_spec_timing_enabled(monkeypatch):
+    monkeypatch.delenv("COCOTB_TB_SPEC_TIMING", raising=False)
+    assert not spec_timing_enabled()
+    monkeypatch.setenv("COCOTB_TB_SPEC_TIMING", "1")
+    assert spec_timing_enabled()
@@ -0,0 +1,75 @@
+# SPDX-License-Identifier: Apache-2.0
+
+"""
+Synthetic SCL/SDA traces shared by the timing tool tests
+"""
+
+SYS_CLK = 100e6
+
+
+def i2c_write_trace(settings, data=0xA5, restart=True):
+    """
+    Generate ideal SCL/SDA value changes (in sys_clk cycles) of a single byte write
+    following counters of the I2C controller FSM.
+    """
+    t_r, t_f, thd_dat = settings["T_R"], settings["T_F"], settings.get("THD_DAT", 0)
+    high, low = t_r + settings["T_HIGH"], t_f + settings["T_LOW"]
+    scl, sda = [(0, 1)], [(0, 1)]
+    t = 100
+
+    def start():
+        nonlocal t
+        sda.append((t, 0))
+        t += t_f + settings["THD_STA_MIN"]
+        scl.append((t, 0))
+
+    def bit(value):
+        nonlocal t
+        sda.append((t + t_f + thd_dat, value))
+        t += low
+        scl.append((t, 1))
+        t += high
+        scl.append((t, 0))
+
+    start()
+    for i in range(8):
+        bit((data >> (7 - i)) & 1)
+    bit(0)
+    if restart:
+        # Repeated start: release SDA while SCL is low, then release SCL
+        sda.append((t + t_f + thd_dat, 1))
+        t += low
+        scl.append((t, 1))
+        t += t_r + settings["TSU_STA_MIN"]
+        start()
+        bit(1)
+    # Stop
+    sda.append((t + t_f + thd_dat, 0))
+    t += low
+    scl.append((t, 1))
+    t += t_r + settings["T_STO_MIN"]
+    sda.append((t, 1))
+    t += 2 * t_r + settings["T_BUF_MIN"]
+    start()
+    return scl, sda
+
+
+def write_vcd(path, scl, sda, period):
+    changes = sorted([(t, "!", v) for t, v in scl] + [(t, '"', v) for t, v in sda])
+    lines = [
+        "$timescale 1ps $end",
+        "$scope module TOP $end",
+        "$scope module i3c_test_wrapper $end",
+        "$var wire 1 ! bus_scl $end",
+        '$var wire 1 " bus_sda $end',
+        "$upscope $end",
+        "$upscope $end",
+        "$enddefinitions $end",
+    ]
+    last = None
+    for t, ident, v in changes:
+        if t != last:
+            lines.append(f"#{round(t * period * 1e12)}")
+            last = t
+        lines.append(f"{v}{ident}")
+    path.write_text("\n".join(lines) + "\n")
@@ -0,0 +1,49 @@
+# SPDX-License-Identifier: Apache-2.0
+
+import pytest
+from summary import COCOTB, OTHER, VERILATED, classify, format_summary, summarize
+
+REPORT = """Flat profile:
+
+Each sample counts as 0.01 seconds.
+  %   cumulative   self              self     total
+ time   seconds   seconds    calls  ms/call  ms/call  name
+ 40.00      2.00     2.00   100000     0.02     0.02  _sequent__TOP__2__PROF__I3CCSR__l1200
+ 20.00      3.00     1.00   100000     0.01     0.01  _sequent__TOP__7__PROF__I3CCSR__l80
+ 20.00      4.00     1.00                             _combo__TOP__3__PROF__queues__l42
+ 10.00      4.50     0.50     2000     0.25     0.25  VL_WRITEF
+  6.00      4.80     0.30      500     0.60     0.60  vpi_get_value
+  4.00      5.00     0.20                             memcpy
+
+Call graph
+"""
+
+
+def test_classify():
+    assert classify("_sequent__TOP__2__PROF__I3CCSR__l1200") == ("I3CCSR", 1200)
+    assert classify("_eval__PROF__i2c_controller_fsm__l7(Vtop___024root*)") == (
+        "i2c_controller_fsm",
+        7,
+    )
+    assert classify("VL_WRITEF") == (VERILATED, None)
+    assert classify("vpi_get_value") == (COCOTB, None)
+    assert classify("memcpy") == (OTHER, None)
+
+
+def test_summarize():
+    files = summarize(REPORT)
+    assert set(files) == {"I3CCSR", "queues", VERILATED, COCOTB, OTHER}
+    assert files["I3CCSR"].seconds == pytest.approx(3.0)
+    assert files["I3CCSR"].functions == 2
+    assert files["I3CCSR"].hottest_line() == 1200
+    assert files["queues"].seconds == pytest.approx(1.0)
+    assert files[OTHER].hottest_line() is None
+
+
+def test_format_summary():
+    lines = format_summary(summarize(REPORT)).splitlines()
+    assert lines[0] == "Total sampled time: 5.00 s"
+    assert lines[2].split()[-1] == "file"
+    # Most expensive file first
+    assert lines[3].split() == ["3.00", "60.00", "2", "l1200", "I3CCSR"]
+    assert lines[-1].endswith(OTHER)